@@ -0,0 +1,128 @@
+'''
+Google API 배치 요청 도우미
+- 서로 의존하지 않는 작은 요청(드라이브 이동, 권한 설정 등)을 모아
+  BatchHttpRequest 한 번(멀티파트 왕복 1회)으로 보냅니다.
+- 요청마다 콜백과 오류를 따로 받으므로 하나가 실패해도 나머지는 그대로 처리됩니다.
+- 배치 안의 요청 수만큼 쿼터 토큰을 쓰고, 429/503으로 실패한 요청만 모아 다시 보냅니다.
+'''
+
+from googleapiclient.errors import HttpError
+import api_metrics
+from quota_scheduler import (get_scheduler, request_api, request_kind, retry_after_seconds,
+                             backoff_seconds, RETRY_STATUSES, MAX_RETRIES)
+
+MAX_BATCH_SIZE = 100  # 배치 한 번에 넣을 수 있는 최대 요청 수 (Drive/Forms 공통 한도)
+
+class BatchCollector:
+    """독립적인 API 요청을 모았다가 한 번의 배치 요청으로 실행
+
+    사용 예:
+        batch = BatchCollector(drive_service)
+        batch.add(drive_service.files().update(...), request_id='move')
+        batch.add(drive_service.permissions().create(...), request_id='share')
+        results = batch.execute()
+        response, error = results['share']
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self._items = []  # (request_id, request, callback)
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, request, callback=None, request_id=None):
+        """요청 추가. callback(request_id, response, exception)은 요청마다 호출됨"""
+        if request_id is None:
+            request_id = str(len(self._items) + 1)
+        self._items.append((request_id, request, callback))
+        return request_id
+
+    def execute(self):
+        """모은 요청을 실행하고 {request_id: (response, exception)} 반환"""
+        items, self._items = self._items, []
+        results = {}
+
+        def handle(request_id, response, exception, callback):
+            results[request_id] = (response, exception)
+            if callback is None:
+                return
+            try:
+                callback(request_id, response, exception)
+            except Exception as e:
+                # 콜백 오류가 나머지 요청 처리를 막지 않도록 기록만 한다
+                print(f"배치 콜백 처리 중 오류 발생 ({request_id}): {e}")
+
+        # 요청이 하나뿐이면 멀티파트로 감쌀 필요 없이 그대로 실행
+        if len(items) == 1:
+            request_id, request, callback = items[0]
+            try:
+                response, exception = get_scheduler().execute(request), None
+            except Exception as e:
+                response, exception = None, e
+            handle(request_id, response, exception, callback)
+            return results
+
+        pending = items
+        for attempt in range(MAX_RETRIES + 1):
+            retry = []
+            for start in range(0, len(pending), MAX_BATCH_SIZE):
+                chunk = pending[start:start + MAX_BATCH_SIZE]
+                for request_id, request, callback, response, exception in self._send(chunk):
+                    if _is_retryable(exception) and attempt < MAX_RETRIES:
+                        retry.append(((request_id, request, callback), exception))
+                        continue
+                    handle(request_id, response, exception, callback)
+
+            if not retry:
+                break
+
+            # 쿼터 초과로 실패한 요청만 다시 보냄 (Retry-After가 있으면 따름)
+            delays = [retry_after_seconds(exception) for _, exception in retry]
+            delay = max([d for d in delays if d is not None], default=backoff_seconds(attempt))
+            pending = [item for item, _ in retry]
+            self._bucket(pending).throttle(delay)
+            print(f"⚠️ 배치 요청 {len(pending)}건이 쿼터/서버 오류로 실패했습니다. {delay:.1f}초 후 재시도합니다...")
+
+        return results
+
+    def _bucket(self, items):
+        """배치에 해당하는 쿼터 버킷 (첫 요청의 API, 쓰기가 하나라도 있으면 쓰기 쿼터)"""
+        requests = [request for _, request, _ in items]
+        kind = 'write' if any(request_kind(r) == 'write' for r in requests) else 'read'
+        return get_scheduler().bucket(request_api(requests[0]), kind)
+
+    def _send(self, chunk):
+        """요청 묶음을 배치 한 번으로 보내고 (request_id, request, callback, response, exception) 목록 반환"""
+        outcomes = {}
+
+        def collect(request_id, response, exception):
+            outcomes[request_id] = (response, exception)
+
+        batch = self.service.new_batch_http_request()
+        timers = {}
+        for request_id, request, _ in chunk:
+            batch.add(request, callback=collect, request_id=request_id)
+            timers[request_id] = api_metrics.CallTimer(request, request_api(request))
+
+        queue_wait = self._bucket(chunk).acquire(len(chunk))
+        for timer in timers.values():
+            timer.begin()
+        try:
+            batch.execute()
+        except HttpError as e:
+            # 배치 요청 자체가 실패하면 묶음 안의 모든 요청이 같은 오류를 받은 것으로 처리
+            for timer in timers.values():
+                timer.finish(e.resp.status, queue_wait=queue_wait)
+            return [(rid, req, cb, None, e) for rid, req, cb in chunk]
+
+        for request_id, timer in timers.items():
+            _, exception = outcomes.get(request_id, (None, None))
+            status = exception.resp.status if isinstance(exception, HttpError) else None
+            timer.finish(status, queue_wait=queue_wait)
+
+        return [(rid, req, cb) + outcomes.get(rid, (None, None)) for rid, req, cb in chunk]
+
+def _is_retryable(exception):
+    """쿼터 초과/일시적 서버 오류인지 확인"""
+    return isinstance(exception, HttpError) and exception.resp.status in RETRY_STATUSES
@@ -0,0 +1,167 @@
+'''
+Google API 호출 계측
+- execute_request()를 거치는 모든 호출에 대해 API, 메서드, 지연 시간, 쿼터 대기 시간,
+  요청/응답 바이트, 재시도 횟수, 상태 코드를 JSON lines 파일에 한 줄씩 기록합니다.
+- 파일은 크기 기준으로 회전(logs/api_calls.jsonl, .1, .2 ...)하며,
+  summarize()로 메서드별 집계와 지연 시간 히스토그램을 만듭니다. (관리자 탭 '로그 확인')
+'''
+
+import os
+import json
+import time
+import logging
+import threading
+from logging.handlers import RotatingFileHandler
+
+LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
+LOG_PATH = os.path.join(LOG_DIR, 'api_calls.jsonl')
+LOG_MAX_BYTES = 5 * 1024 * 1024  # 파일 하나의 최대 크기
+LOG_BACKUP_COUNT = 3  # 보관할 이전 파일 수
+
+# 지연 시간 히스토그램 구간 (ms, 이하)
+LATENCY_BUCKETS_MS = [50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+_logger = None
+_logger_lock = threading.Lock()
+
+def _get_logger():
+    """JSON lines 회전 파일 로거 반환 (처음 호출할 때 생성)"""
+    global _logger
+    with _logger_lock:
+        if _logger is None:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            logger = logging.getLogger('paldo.api_metrics')
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            handler = RotatingFileHandler(LOG_PATH, maxBytes=LOG_MAX_BYTES,
+                                          backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            logger.addHandler(handler)
+            _logger = logger
+        return _logger
+
+def record(api, method, latency, status, request_bytes=0, response_bytes=0, retries=0, queue_wait=0.0):
+    """API 호출 한 건 기록 (시간 인자는 초 단위)"""
+    entry = {
+        'ts': round(time.time(), 3),
+        'api': api,
+        'method': method,
+        'latency_ms': round(latency * 1000, 1),
+        'queue_ms': round(queue_wait * 1000, 1),
+        'request_bytes': request_bytes,
+        'response_bytes': response_bytes,
+        'retries': retries,
+        'status': status,
+    }
+    try:
+        _get_logger().info(json.dumps(entry, ensure_ascii=False))
+    except Exception as e:
+        # 계측 실패가 실제 API 호출을 막으면 안 됨
+        print(f"API 호출 기록 중 오류 발생: {e}")
+
+class CallTimer:
+    """요청 한 건의 지연 시간과 응답 크기/상태를 측정
+
+    request.postproc을 감싸 응답 본문 크기와 상태 코드를 잡으므로,
+    배치 요청 안의 개별 응답도 측정된다.
+    지연 시간은 마지막 begin()부터 잰다. (쿼터 대기와 재시도 사이 대기는 queue_ms로 따로 기록하므로 빼고,
+    실제 execute() 시도 한 번만 잼)
+    """
+
+    def __init__(self, request, api):
+        self.api = api
+        self.method = getattr(request, 'methodId', None) or request.method
+        self.request_bytes = len(request.body or '')
+        self.response_bytes = 0
+        self.status = None
+        self.start = time.perf_counter()
+        _attach(request, self)
+
+    def begin(self):
+        """execute() 시도 직전에 호출 - 지연 시간 측정 시작점을 다시 잡음"""
+        self.start = time.perf_counter()
+
+    def finish(self, status=None, retries=0, queue_wait=0.0):
+        """측정 종료 후 기록"""
+        record(self.api, self.method, time.perf_counter() - self.start,
+               status or self.status or 'error', self.request_bytes,
+               self.response_bytes, retries, queue_wait)
+
+def _attach(request, timer):
+    """request.postproc을 한 번만 감싸고, 현재 측정 중인 타이머를 연결"""
+    if not getattr(request, '_metrics_wrapped', False):
+        original = request.postproc
+
+        def postproc(resp, content):
+            current = getattr(request, '_metrics_timer', None)
+            if current is not None:
+                current.response_bytes = len(content or b'')
+                current.status = getattr(resp, 'status', None)
+            return original(resp, content)
+
+        request.postproc = postproc
+        request._metrics_wrapped = True
+    request._metrics_timer = timer
+
+def load_records():
+    """회전된 파일을 포함해 기록된 호출을 오래된 순서로 반환"""
+    paths = [f"{LOG_PATH}.{i}" for i in range(LOG_BACKUP_COUNT, 0, -1)] + [LOG_PATH]
+    records = []
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    return records
+
+def _is_success(status):
+    return isinstance(status, int) and 200 <= status < 300
+
+def _percentile(sorted_values, ratio):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def summarize(records=None):
+    """(api, method)별 집계 목록 반환 - 호출 수가 많은 순"""
+    if records is None:
+        records = load_records()
+
+    groups = {}
+    for entry in records:
+        groups.setdefault((entry.get('api'), entry.get('method')), []).append(entry)
+
+    summary = []
+    for (api, method), entries in groups.items():
+        latencies = sorted(e.get('latency_ms', 0) for e in entries)
+        histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        for latency in latencies:
+            index = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if latency <= bound),
+                         len(LATENCY_BUCKETS_MS))
+            histogram[index] += 1
+        summary.append({
+            'api': api,
+            'method': method,
+            'count': len(entries),
+            'errors': sum(1 for e in entries if not _is_success(e.get('status'))),
+            'retries': sum(e.get('retries', 0) for e in entries),
+            'avg_ms': sum(latencies) / len(latencies),
+            'p50_ms': _percentile(latencies, 0.5),
+            'p95_ms': _percentile(latencies, 0.95),
+            'max_ms': latencies[-1],
+            'queue_ms': sum(e.get('queue_ms', 0) for e in entries),
+            'request_bytes': sum(e.get('request_bytes', 0) for e in entries),
+            'response_bytes': sum(e.get('response_bytes', 0) for e in entries),
+            'histogram': histogram,
+        })
+    summary.sort(key=lambda item: item['count'], reverse=True)
+    return summary
+
+def histogram_labels():
+    """히스토그램 구간 이름 목록 (예: '≤50ms', ..., '>10000ms')"""
+    return [f"≤{bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
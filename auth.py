@@ -1,28 +1,73 @@
 import os
 import sys
+import json
+import time
+import datetime
+import glob
+import hashlib
+import threading
+import requests
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.http import build_http
 from dotenv import load_dotenv
 
 # 환경 변수 로드
 load_dotenv()
 
-# Google API 접근 범위 설정
-SCOPES = [
-    'https://www.googleapis.com/auth/drive',
-    'https://www.googleapis.com/auth/spreadsheets',
-    'https://www.googleapis.com/auth/documents',
-    'https://www.googleapis.com/auth/calendar',
-    'https://www.googleapis.com/auth/forms.body'  # 폼 내용 수정 권한
-]
+# 도구(진입점)별로 필요한 Google API 접근 범위
+TOOL_SCOPES = {
+    'dashboard': [
+        'https://www.googleapis.com/auth/drive',
+        'https://www.googleapis.com/auth/spreadsheets',
+        'https://www.googleapis.com/auth/forms.body',  # 폼 내용 수정 권한
+    ],
+    'googleform': [
+        'https://www.googleapis.com/auth/drive',
+        'https://www.googleapis.com/auth/forms.body',
+    ],
+    'form_responses': [
+        'https://www.googleapis.com/auth/drive',  # 응답 목록 조회도 drive 범위로 가능
+        'https://www.googleapis.com/auth/spreadsheets',
+    ],
+    'upload_tracking': [
+        'https://www.googleapis.com/auth/drive',  # 시트 버전 확인용
+        'https://www.googleapis.com/auth/spreadsheets',
+    ],
+    '가구매': [
+        'https://www.googleapis.com/auth/drive',
+        'https://www.googleapis.com/auth/spreadsheets',
+        'https://www.googleapis.com/auth/documents',
+        'https://www.googleapis.com/auth/calendar',
+    ],
+}
+
+# 모든 도구가 필요로 하는 범위의 합집합 - 새로 동의를 받을 때는 항상 이 범위로 받아서
+# 다른 도구로 바꿔 실행해도 다시 동의 화면이 뜨지 않게 한다
+SCOPES = sorted(set(scope for scopes in TOOL_SCOPES.values() for scope in scopes))
+
+# 프로젝트에서 사용하는 API의 디스커버리 문서 (디스크에 캐시해서 사용)
+DISCOVERY_APIS = {
+    'sheets': 'v4',
+    'forms': 'v1',
+    'drive': 'v3',
+}
+DISCOVERY_CACHE_VERSION = 1  # 캐시 파일 형식이 바뀌면 올려서 기존 캐시를 무효화
+DISCOVERY_MAX_AGE = 7 * 24 * 60 * 60  # 이 기간이 지나면 백그라운드에서 새로 받음 (초)
+DISCOVERY_URL = "https://{api}.googleapis.com/$discovery/rest?version={version}"
+
+TOKEN_REFRESH_MARGIN = 10 * 60  # 만료 몇 초 전에 백그라운드에서 토큰을 갱신할지
+HTTP_TIMEOUT = 60  # 스레드별 HTTP 연결의 소켓 타임아웃 (초)
 
 # 환경 변수에서 클라이언트 정보 가져오기
 CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
 CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET')
 
 def get_token_path():
-    """운영 체제에 따른 토큰 저장 경로 반환"""
+    """운영 체제에 따른 기본 토큰 저장 경로 반환 (범위별 토큰 파일도 같은 폴더에 저장)"""
     if sys.platform == "win32":
         return os.path.join(os.environ["APPDATA"], "GoogleAPI", "token.json")
     return os.path.join(os.path.expanduser("~"), ".config", "GoogleAPI", "token.json")
@@ -33,16 +78,49 @@ def ensure_token_dir():
     if not os.path.exists(token_dir):
         os.makedirs(token_dir)
 
-def get_credentials():
-    """OAuth2 인증을 통해 자격 증명 반환"""
-    token_path = get_token_path()
+def get_scoped_token_path(scopes):
+    """범위 조합별 토큰 파일 경로 반환 (같은 범위 조합은 항상 같은 파일)"""
+    digest = hashlib.sha1(' '.join(sorted(set(scopes))).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(os.path.dirname(get_token_path()), f"token_{digest}.json")
+
+def _token_scopes(token_path):
+    """토큰 파일에 기록된 범위 반환 (파일이 없거나 읽을 수 없으면 빈 집합)"""
+    try:
+        with open(token_path, 'r') as f:
+            return set(json.load(f).get('scopes') or [])
+    except (OSError, ValueError):
+        return set()
+
+def find_token_path(scopes):
+    """요청한 범위를 모두 포함하는 기존 토큰 파일 경로 반환 (없으면 None)
+
+    예전 버전이 쓰던 token.json도 후보에 포함하되, 새로 발급받은 토큰은
+    범위 조합별 파일에 저장하므로 다른 도구가 덮어쓸 일이 없다.
+    """
+    needed = set(scopes)
+    token_dir = os.path.dirname(get_token_path())
+    candidates = [get_token_path()] + sorted(glob.glob(os.path.join(token_dir, "token_*.json")))
+    for token_path in candidates:
+        if needed <= _token_scopes(token_path):
+            return token_path
+    return None
+
+def _save_token(token_path, creds):
+    """자격 증명을 토큰 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+    tmp_path = token_path + ".tmp"
+    with open(tmp_path, 'w') as token:
+        token.write(creds.to_json())
+    os.replace(tmp_path, token_path)
+
+def _authorize(token_path, scopes):
+    """토큰 파일을 읽어 유효한 자격 증명 반환 (필요하면 동기적으로 갱신하거나 새로 인증)"""
     ensure_token_dir()
     creds = None
 
     # 토큰 파일이 있으면 불러오기
     if os.path.exists(token_path):
         try:
-            creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+            creds = Credentials.from_authorized_user_file(token_path, scopes)
         except Exception as e:
             print(f"토큰 파일 로드 중 오류 발생: {e}")
     
@@ -52,6 +130,7 @@ def get_credentials():
         if creds and creds.expired and creds.refresh_token:
             try:
                 creds.refresh(Request())
+                _save_token(token_path, creds)
                 print("토큰이 성공적으로 갱신되었습니다.")
             except Exception as e:
                 print(f"토큰 갱신 중 오류 발생: {e}")
@@ -70,13 +149,371 @@ def get_credentials():
                         "token_uri": "https://oauth2.googleapis.com/token",
                     }
                 },
-                SCOPES
+                scopes
             )
-            creds = flow.run_local_server(port=0)
+            # include_granted_scopes: 이미 허용한 범위에 더해 점진적으로 권한을 추가
+            creds = flow.run_local_server(port=0, include_granted_scopes='true')
             
             # 새로운 토큰 저장
-            with open(token_path, 'w') as token:
-                token.write(creds.to_json())
+            _save_token(token_path, creds)
             print("새로운 인증 토큰이 생성되었습니다.")
     
     return creds
+
+def _file_mtime(path):
+    """파일 수정 시각 반환 (파일이 없으면 None)"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+class CredentialHolder:
+    """자격 증명을 메모리에 보관하고 만료 전에 백그라운드에서 갱신하는 홀더
+
+    - 필요한 범위를 모두 포함하는 토큰 파일을 찾아 사용하고, 없으면 전체 범위(SCOPES)로
+      새로 동의를 받아 범위 조합별 파일에 저장한다.
+    - 토큰 파일은 수정 시각(mtime)이 바뀐 경우에만 다시 읽는다.
+    - 만료 TOKEN_REFRESH_MARGIN초 전에 타이머 스레드가 토큰을 갱신하고 파일에 저장한다.
+      갱신은 같은 Credentials 객체를 제자리에서 바꾸므로, 이미 만들어진 서비스 객체도
+      새 토큰을 그대로 사용한다.
+    - 호출 스레드에서 갱신이 일어나는 경우는 타이머가 실패했거나(절전 등)
+      처음 인증할 때뿐이다.
+    """
+
+    def __init__(self, scopes):
+        self.scopes = sorted(set(scopes))  # 호출한 도구가 필요로 하는 범위
+        self.token_path = None
+        self.granted_scopes = None  # 토큰 파일에 실제로 부여된 범위
+        self._creds = None
+        self._mtime = None
+        self._timer = None
+        self._lock = threading.RLock()
+
+    def get(self):
+        """유효한 자격 증명 반환"""
+        with self._lock:
+            mtime = _file_mtime(self.token_path) if self.token_path else None
+            if self._creds is not None and mtime == self._mtime and self._creds.valid:
+                return self._creds
+
+            # 다른 도구가 토큰 파일을 바꿨다면 기존 서비스 객체도 새 자격 증명으로 다시 만든다
+            token_changed = self._creds is not None and mtime != self._mtime
+
+            # 토큰 파일이 없거나 필요한 범위를 더 이상 포함하지 않으면 다른 토큰을 찾는다
+            if self.token_path is None or not set(self.scopes) <= _token_scopes(self.token_path):
+                self._resolve_token_path()
+
+            self._creds = _authorize(self.token_path, self.granted_scopes)
+            self._mtime = _file_mtime(self.token_path)
+            self._schedule_refresh()
+            creds = self._creds
+
+        # 서비스 레지스트리 락은 홀더 락을 놓은 뒤에 잡는다 (get_service와 락 순서가 엇갈리지 않도록)
+        if token_changed:
+            clear_services()
+        return creds
+
+    def _resolve_token_path(self):
+        """사용할 토큰 파일과 그 파일의 범위 결정"""
+        token_path = find_token_path(self.scopes)
+        if token_path is None:
+            # 필요한 범위를 가진 토큰이 없으면 전체 범위로 한 번에 업그레이드
+            granted = sorted(set(self.scopes) | set(SCOPES))
+            token_path = get_scoped_token_path(granted)
+        else:
+            granted = sorted(_token_scopes(token_path))
+        self.token_path = token_path
+        self.granted_scopes = granted
+
+    def _schedule_refresh(self):
+        """만료 직전에 백그라운드 갱신 타이머 예약"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        creds = self._creds
+        if creds is None or not creds.refresh_token or creds.expiry is None:
+            return
+
+        # Credentials.expiry는 naive UTC datetime
+        remaining = (creds.expiry - datetime.datetime.utcnow()).total_seconds()
+        delay = max(remaining - TOKEN_REFRESH_MARGIN, 0)
+        self._timer = threading.Timer(delay, self._refresh_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh_in_background(self):
+        """타이머 스레드에서 토큰 갱신 후 파일에 저장"""
+        with self._lock:
+            self._timer = None
+            creds = self._creds
+            if creds is None:
+                return
+            try:
+                creds.refresh(Request())
+                _save_token(self.token_path, creds)
+                self._mtime = _file_mtime(self.token_path)
+            except Exception as e:
+                # 실패하면 다음 get() 호출이 동기 경로로 처리
+                print(f"백그라운드 토큰 갱신 중 오류 발생: {e}")
+                return
+            self._schedule_refresh()
+
+    def stop(self):
+        """예약된 갱신 타이머 취소"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+# 범위(scopes) 조합별 자격 증명 홀더
+_HOLDERS = {}
+_HOLDERS_LOCK = threading.Lock()
+
+def get_credentials(scopes=None):
+    """OAuth2 인증을 통해 자격 증명 반환 (메모리 캐시 + 백그라운드 갱신)
+
+    scopes를 생략하면 전체 범위(SCOPES)를 요청한다. 도구별로 TOOL_SCOPES의 항목을
+    넘겨도 되며, 어느 쪽이든 새 동의는 전체 범위로 받는다.
+    """
+    scopes = scopes or SCOPES
+    key = tuple(sorted(scopes))
+    with _HOLDERS_LOCK:
+        holder = _HOLDERS.get(key)
+        if holder is None:
+            holder = CredentialHolder(scopes)
+            _HOLDERS[key] = holder
+    return holder.get()
+
+def get_discovery_cache_path(api, version):
+    """디스커버리 문서 캐시 파일 경로 반환 (토큰과 같은 폴더의 discovery/ 아래)"""
+    token_dir = os.path.dirname(get_token_path())
+    return os.path.join(token_dir, "discovery", f"{api}.{version}.json")
+
+# 프로세스 안에서 한 번 읽은 디스커버리 문서는 메모리에 보관
+_DISCOVERY_DOCS = {}
+_DISCOVERY_LOCK = threading.Lock()
+_DISCOVERY_REFRESHING = set()
+
+def _read_discovery_cache(api, version):
+    """디스크 캐시에서 디스커버리 문서를 읽어 (문서, 저장시각) 반환. 없거나 형식이 다르면 (None, 0)"""
+    cache_path = get_discovery_cache_path(api, version)
+    if not os.path.exists(cache_path):
+        return None, 0
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('cache_version') != DISCOVERY_CACHE_VERSION:
+            return None, 0
+        return cached['document'], cached.get('fetched_at', 0)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"디스커버리 캐시 로드 중 오류 발생 ({api} {version}): {e}")
+        return None, 0
+
+def _write_discovery_cache(api, version, document):
+    """디스커버리 문서를 캐시 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+    cache_path = get_discovery_cache_path(api, version)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    cached = {
+        'cache_version': DISCOVERY_CACHE_VERSION,
+        'api': api,
+        'version': version,
+        'revision': document.get('revision'),
+        'fetched_at': time.time(),
+        'document': document,
+    }
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cached, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+
+def _fetch_discovery_document(api, version):
+    """디스커버리 문서를 네트워크에서 받아 반환"""
+    response = requests.get(DISCOVERY_URL.format(api=api, version=version), timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+def _bundled_discovery_document(api, version):
+    """google-api-python-client에 포함된 정적 디스커버리 문서 반환 (없으면 None)"""
+    try:
+        from googleapiclient import discovery_cache
+        content = discovery_cache.get_static_doc(api, version)
+    except Exception:
+        return None
+    return json.loads(content) if content else None
+
+def _refresh_discovery_document(api, version):
+    """디스커버리 문서를 새로 받아 캐시와 메모리를 갱신 (백그라운드 스레드에서 실행)"""
+    try:
+        document = _fetch_discovery_document(api, version)
+        _write_discovery_cache(api, version, document)
+        with _DISCOVERY_LOCK:
+            old = _DISCOVERY_DOCS.get((api, version))
+            _DISCOVERY_DOCS[(api, version)] = document
+        if old is not None and old.get('revision') != document.get('revision'):
+            print(f"디스커버리 문서 갱신됨: {api} {version} ({old.get('revision')} → {document.get('revision')})")
+    except Exception as e:
+        print(f"디스커버리 문서 갱신 중 오류 발생 ({api} {version}): {e}")
+    finally:
+        with _DISCOVERY_LOCK:
+            _DISCOVERY_REFRESHING.discard((api, version))
+
+def _schedule_discovery_refresh(api, version):
+    """오래된 캐시를 백그라운드에서 갱신 (같은 문서는 한 번에 하나만)"""
+    with _DISCOVERY_LOCK:
+        if (api, version) in _DISCOVERY_REFRESHING:
+            return
+        _DISCOVERY_REFRESHING.add((api, version))
+    threading.Thread(target=_refresh_discovery_document, args=(api, version), daemon=True).start()
+
+def get_discovery_document(api, version):
+    """디스커버리 문서 반환
+
+    갱신 정책:
+    - 메모리에 있으면 그대로 사용
+    - 디스크 캐시가 있으면 즉시 사용하고, DISCOVERY_MAX_AGE가 지났으면 백그라운드에서 갱신
+    - 캐시가 없으면 라이브러리 내장 문서로 시작하고 백그라운드에서 최신 문서를 받음
+    - 내장 문서도 없을 때만 네트워크에서 동기적으로 받음
+    """
+    document = _DISCOVERY_DOCS.get((api, version))
+    if document is not None:
+        return document
+
+    document, fetched_at = _read_discovery_cache(api, version)
+    if document is not None:
+        if time.time() - fetched_at > DISCOVERY_MAX_AGE:
+            _schedule_discovery_refresh(api, version)
+    else:
+        document = _bundled_discovery_document(api, version)
+        if document is not None:
+            _write_discovery_cache(api, version, document)
+            _schedule_discovery_refresh(api, version)
+        else:
+            document = _fetch_discovery_document(api, version)
+            _write_discovery_cache(api, version, document)
+
+    with _DISCOVERY_LOCK:
+        _DISCOVERY_DOCS.setdefault((api, version), document)
+        return _DISCOVERY_DOCS[(api, version)]
+
+def prefetch_discovery_documents():
+    """프로젝트에서 쓰는 모든 디스커버리 문서를 미리 로드 (대시보드 시작 시 백그라운드에서 호출)"""
+    for api, version in DISCOVERY_APIS.items():
+        try:
+            get_discovery_document(api, version)
+        except Exception as e:
+            print(f"디스커버리 문서 로드 중 오류 발생 ({api} {version}): {e}")
+
+class ThreadLocalHttp:
+    """스레드마다 자기 keep-alive 연결을 쓰는 httplib2 호환 트랜스포트
+
+    httplib2.Http는 스레드 안전하지 않으므로, 서비스 객체는 공유하되 실제 요청은
+    호출한 스레드 전용 AuthorizedHttp(자격 증명은 공유)로 보낸다. 그래서 같은 서비스
+    객체로 여러 작업 스레드가 동시에 시트 쓰기, 드라이브 업로드를 해도 연결이 섞이지 않는다.
+    """
+
+    def __init__(self, credentials, timeout=HTTP_TIMEOUT):
+        self.credentials = credentials
+        self.timeout = timeout
+        self._local = threading.local()
+        self._all_https = []
+        self._lock = threading.Lock()
+
+    def _thread_http(self):
+        """현재 스레드의 AuthorizedHttp 반환 (없으면 생성)"""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            # build_http()는 재개 가능한 업로드에 쓰이는 308 응답을 리다이렉트로 처리하지 않게 설정
+            http = AuthorizedHttp(self.credentials, http=build_http())
+            http.http.timeout = self.timeout
+            self._local.http = http
+            with self._lock:
+                self._all_https.append(http)
+        return http
+
+    def request(self, *args, **kwargs):
+        """httplib2.Http.request와 같은 인터페이스로 현재 스레드의 연결을 사용해 요청"""
+        return self._thread_http().request(*args, **kwargs)
+
+    def close(self):
+        """모든 스레드의 연결 닫기"""
+        with self._lock:
+            https, self._all_https = self._all_https, []
+        for http in https:
+            http.close()
+        self._local = threading.local()
+
+# 서비스 객체 레지스트리 - (api, version, scopes) 별로 한 번만 생성해서 재사용
+_SERVICES = {}
+_BACKEND = None  # use_backend()로 지정한 가짜 트랜스포트 (없으면 실제 Google API)
+_SERVICES_LOCK = threading.Lock()  # 이 락을 잡은 채로 get_credentials()를 부르지 않음 (홀더 락과 순서가 엇갈림)
+_BACKEND_LOCK = threading.Lock()  # 가짜 백엔드 지연 로드용 (카세트 기록 모드는 여기서 자격 증명을 받음)
+
+def get_service(api, version, scopes=None):
+    """메모이즈된 Google API 서비스 객체 반환
+
+    같은 (api, version, scopes) 조합은 프로세스 안에서 한 번만 토큰을 읽고
+    build() 하므로, 이후 호출은 실제 API 왕복 비용만 든다.
+    서비스 객체는 ThreadLocalHttp를 사용하므로 여러 스레드에서 공유해도 안전하다.
+    만료된 토큰은 스레드별 AuthorizedHttp가 요청 직전에 자동 갱신한다.
+    """
+    key = (api, version, tuple(sorted(scopes or SCOPES)))
+    service = _SERVICES.get(key)
+    if service is not None:
+        return service
+
+    backend = _get_backend()
+    if backend is not None:
+        with _SERVICES_LOCK:
+            # 락을 기다리는 동안 다른 스레드가 이미 만들었을 수 있음
+            if key not in _SERVICES:
+                # 가짜 백엔드는 자격 증명과 네트워크 없이 캐시/내장 디스커버리 문서만 사용
+                document = _read_discovery_cache(api, version)[0] or _bundled_discovery_document(api, version)
+                _SERVICES[key] = build_from_document(document, http=backend)
+            return _SERVICES[key]
+
+    # 자격 증명은 레지스트리 락 밖에서 받는다 (토큰이 바뀌면 get()이 clear_services()를 부름)
+    credentials = get_credentials(scopes)
+    with _SERVICES_LOCK:
+        # 락을 기다리는 동안 다른 스레드가 이미 만들었을 수 있음
+        service = _SERVICES.get(key)
+        if service is None:
+            http = ThreadLocalHttp(credentials)
+            if DISCOVERY_APIS.get(api) == version:
+                # 디스크에 캐시된 디스커버리 문서로 빌드 (네트워크 조회 없음)
+                service = build_from_document(get_discovery_document(api, version), http=http)
+            else:
+                service = build(api, version, http=http)
+            _SERVICES[key] = service
+    return service
+
+def clear_services():
+    """캐시된 서비스 객체를 모두 제거 (재인증 후 등에 사용)"""
+    with _SERVICES_LOCK:
+        _SERVICES.clear()
+
+def _get_backend():
+    """지정된 가짜 백엔드 반환
+
+    환경 변수로도 지정할 수 있으며 처음 호출할 때 로드한다.
+    - PALDO_FAKE_GOOGLE: fake_google 픽스처 경로
+    - PALDO_CASSETTE: cassette 폴더 (기록 모드면 실제 연결을 감싸서 응답을 기록)
+    """
+    global _BACKEND
+    with _BACKEND_LOCK:
+        if _BACKEND is None and os.getenv('PALDO_FAKE_GOOGLE'):
+            from fake_google import FakeGoogleBackend
+            _BACKEND = FakeGoogleBackend.from_fixture(os.getenv('PALDO_FAKE_GOOGLE'))
+            print(f"가짜 Google 백엔드 사용 중: {os.getenv('PALDO_FAKE_GOOGLE')}")
+        elif _BACKEND is None and os.getenv('PALDO_CASSETTE'):
+            from cassette import get_cassette
+            _BACKEND = get_cassette().google_http(lambda: ThreadLocalHttp(get_credentials()))
+        return _BACKEND
+
+def use_backend(backend):
+    """get_service()가 실제 Google API 대신 backend(httplib2 호환, 예: fake_google.FakeGoogleBackend)로
+    요청하도록 설정. None을 넘기면 실제 API로 되돌린다. (오프라인 벤치마크용)"""
+    global _BACKEND
+    with _BACKEND_LOCK:
+        _BACKEND = backend
+    clear_services()
@@ -0,0 +1,402 @@
+'''
+HTTP 카세트 (기록 / 재생)
+- 실제 실행 중의 Google API 응답과 크롤러가 본 페이지(네이버 블로그 PostList, 인스타그램
+  프로필/게시물)를 파일로 기록하고, 이후에는 네트워크 없이 같은 응답을 재생합니다.
+  최적화 전후를 같은 입력으로 반복 비교할 때 사용합니다.
+- Google API는 httplib2 트랜스포트 단계에서 기록하므로 서비스 객체, execute_request(),
+  BatchCollector가 그대로 동작합니다. (auth.get_service()가 자동으로 카세트를 사용)
+- 크롤러 페이지는 WebDriver를 감싸서, 클릭/이동 직전의 DOM(page_source)과 URL을 상태로 저장합니다.
+  재생 시에는 저장된 HTML을 헤드리스 Chrome에 로컬 파일로 열고(외부 네트워크 차단),
+  같은 순서의 클릭/이동마다 다음 상태로 넘어갑니다.
+- 재생 시간 모드: real(기록된 응답 시간만큼 대기) / zero(대기 없음)
+
+### 사용 (환경 변수 또는 .env)
+PALDO_CASSETTE=cassettes/캠페인A           # 카세트 폴더
+PALDO_CASSETTE_MODE=record | replay        # 기본값 replay
+PALDO_CASSETTE_TIMING=real | zero          # 재생 시간 모드, 기본값 real
+
+### 폴더 구성
+cassettes/<이름>/google.jsonl   Google API 요청/응답 (한 줄에 하나)
+cassettes/<이름>/pages.json     URL별 방문 기록 (방문마다 상태 목록)
+cassettes/<이름>/pages/*.html   상태별 DOM 스냅샷
+'''
+
+import os
+import re
+import json
+import time
+import base64
+import atexit
+import hashlib
+import pathlib
+import threading
+from collections import Counter
+import httplib2
+
+GOOGLE_FILE = 'google.jsonl'
+PAGES_FILE = 'pages.json'
+PAGES_DIR = 'pages'
+
+_SCRIPT_RE = re.compile(r'<script\b[^>]*>.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+_HEAD_RE = re.compile(r'<head\b[^>]*>', re.IGNORECASE)
+_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?')
+_CONTENT_ID_RE = re.compile(rb'Content-ID: <([^+>]+)\+')
+_RESPONSE_ID_RE = re.compile(rb'Content-ID: <response-([^+>]+)\+')
+
+class CassetteMissError(Exception):
+    """재생할 기록이 없는 요청 / 페이지"""
+
+def _to_bytes(value):
+    if value is None:
+        return b''
+    return value.encode('utf-8') if isinstance(value, str) else value
+
+def _body_key(body, headers):
+    """요청 본문 해시 (멀티파트 경계와 배치 Content-ID처럼 매번 달라지는 값은 제외)"""
+    body = _to_bytes(body)
+    content_type = (headers or {}).get('content-type', '')
+    match = _BOUNDARY_RE.search(content_type)
+    if match:
+        body = body.replace(match.group(1).encode(), b'')
+        body = _CONTENT_ID_RE.sub(b'Content-ID: <+', body)
+    return hashlib.sha1(body).hexdigest()
+
+def sanitize_html(html, url):
+    """재생용 HTML - 스크립트를 제거하고 상대 링크가 원래 URL 기준으로 풀리도록 <base> 추가"""
+    html = _SCRIPT_RE.sub('', html)
+    base = f'<base href="{url}">'
+    if _HEAD_RE.search(html):
+        return _HEAD_RE.sub(lambda m: m.group(0) + base, html, count=1)
+    return base + html
+
+class Cassette:
+    """카세트 폴더 하나 (기록 또는 재생)"""
+
+    def __init__(self, path, mode='replay', timing='real'):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"알 수 없는 카세트 모드: {mode}")
+        if timing not in ('real', 'zero'):
+            raise ValueError(f"알 수 없는 재생 시간 모드: {timing}")
+        self.path = path
+        self.mode = mode
+        self.timing = timing
+        self._lock = threading.RLock()
+        self._google = {}  # (method, uri, body_key) → 기록 목록
+        self._pages = {}  # url → 방문 목록 (방문마다 상태 목록)
+        self._cursor = Counter()  # 재생 위치
+        self._page_count = 0
+        self._browser = None
+
+        if mode == 'record':
+            os.makedirs(os.path.join(path, PAGES_DIR), exist_ok=True)
+            # 새로 기록 - 이전 기록 목록은 비움 (HTML 파일은 덮어씀)
+            open(os.path.join(path, GOOGLE_FILE), 'w', encoding='utf-8').close()
+            self._save_pages()
+        else:
+            self._load()
+
+    @property
+    def recording(self):
+        return self.mode == 'record'
+
+    def _load(self):
+        google_path = os.path.join(self.path, GOOGLE_FILE)
+        if os.path.exists(google_path):
+            with open(google_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        key = (entry['method'], entry['uri'], entry['body_key'])
+                        self._google.setdefault(key, []).append(entry)
+        pages_path = os.path.join(self.path, PAGES_FILE)
+        if os.path.exists(pages_path):
+            with open(pages_path, 'r', encoding='utf-8') as f:
+                self._pages = json.load(f)
+        print(f"카세트 재생: {self.path} (API 응답 {sum(len(v) for v in self._google.values())}건, "
+              f"페이지 {len(self._pages)}개, 시간 모드 {self.timing})")
+
+    def _wait(self, elapsed):
+        if self.timing == 'real' and elapsed:
+            time.sleep(elapsed)
+
+    def _next(self, kind, key, entries):
+        """같은 요청이 여러 번 기록되어 있으면 순서대로, 다 쓰면 마지막 기록을 반복"""
+        with self._lock:
+            index = self._cursor[(kind, key)]
+            self._cursor[(kind, key)] += 1
+        return entries[min(index, len(entries) - 1)]
+
+    # ----- Google API -----
+
+    def google_http(self, real_http_factory):
+        """auth.get_service()에 넘길 트랜스포트 (기록 모드에서만 실제 연결을 만듦)"""
+        if self.recording:
+            return RecordingHttp(real_http_factory(), self)
+        return ReplayHttp(self)
+
+    def record_exchange(self, method, uri, body, headers, resp, content, elapsed):
+        """API 요청/응답 한 건을 기록"""
+        content = _to_bytes(content)
+        try:
+            text, encoding = content.decode('utf-8'), 'utf-8'
+        except UnicodeDecodeError:
+            text, encoding = base64.b64encode(content).decode('ascii'), 'base64'
+        entry = {
+            'method': method.upper(),
+            'uri': uri,
+            'body_key': _body_key(body, headers),
+            'status': resp.status,
+            'headers': {k: v for k, v in resp.items() if k != 'status'},
+            'content': text,
+            'encoding': encoding,
+            'elapsed': round(elapsed, 4),
+        }
+        with self._lock:
+            with open(os.path.join(self.path, GOOGLE_FILE), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def replay_exchange(self, method, uri, body, headers):
+        """기록된 응답 반환 - (httplib2.Response, content bytes)"""
+        key = (method.upper(), uri, _body_key(body, headers))
+        entries = self._google.get(key)
+        if not entries:
+            raise CassetteMissError(f"카세트에 없는 API 요청입니다: {method} {uri}")
+        entry = self._next('google', key, entries)
+        self._wait(entry['elapsed'])
+
+        content = entry['content'].encode('utf-8') if entry['encoding'] == 'utf-8' else base64.b64decode(entry['content'])
+        recorded_id = _RESPONSE_ID_RE.search(content)
+        current_id = _CONTENT_ID_RE.search(_to_bytes(body))
+        if recorded_id and current_id:
+            # 배치 응답의 Content-ID를 이번 요청의 ID로 바꿔야 콜백이 연결됨
+            content = content.replace(b'<response-' + recorded_id.group(1) + b'+',
+                                      b'<response-' + current_id.group(1) + b'+')
+        resp = httplib2.Response(dict(entry['headers'], status=str(entry['status'])))
+        return resp, content
+
+    # ----- 크롤러 페이지 -----
+
+    def record_visit(self, url, elapsed):
+        """새 방문 시작 - 상태 목록(list) 반환"""
+        visit = {'elapsed': round(elapsed, 4), 'states': []}
+        with self._lock:
+            self._pages.setdefault(url, []).append(visit)
+        return visit
+
+    def record_state(self, visit, current_url, html):
+        """방문 중 상태(현재 URL, DOM) 하나를 저장"""
+        with self._lock:
+            self._page_count += 1
+            file_name = f"{self._page_count:06d}.html"
+            with open(os.path.join(self.path, PAGES_DIR, file_name), 'w', encoding='utf-8') as f:
+                f.write(sanitize_html(html, current_url))
+            visit['states'].append({'url': current_url, 'file': file_name})
+            self._save_pages()
+
+    def _save_pages(self):
+        pages_path = os.path.join(self.path, PAGES_FILE)
+        with open(pages_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self._pages, f, ensure_ascii=False, indent=1)
+        os.replace(pages_path + '.tmp', pages_path)
+
+    def replay_visit(self, url):
+        """기록된 방문 하나 반환 (같은 URL을 여러 번 방문했으면 순서대로)"""
+        visits = [v for v in self._pages.get(url, []) if v['states']]
+        if not visits:
+            raise CassetteMissError(f"카세트에 없는 페이지입니다: {url}")
+        visit = self._next('page', url, visits)
+        self._wait(visit['elapsed'])
+        return visit
+
+    def page_uri(self, state):
+        return pathlib.Path(os.path.abspath(os.path.join(self.path, PAGES_DIR, state['file']))).as_uri()
+
+    def browser(self):
+        """재생용 헤드리스 Chrome (카세트 하나에 하나를 공유, 외부 네트워크 차단)"""
+        with self._lock:
+            if self._browser is None:
+                from selenium import webdriver
+                from selenium.webdriver.chrome.options import Options
+                options = Options()
+                options.add_argument('--headless=new')
+                options.add_argument('--host-resolver-rules=MAP * ~NOTFOUND')
+                options.add_argument('--blink-settings=imagesEnabled=false')
+                self._browser = webdriver.Chrome(options=options)
+                atexit.register(self.close)
+            return self._browser
+
+    def close(self):
+        """재생용 브라우저 종료"""
+        with self._lock:
+            browser, self._browser = self._browser, None
+        if browser is not None:
+            try:
+                browser.quit()
+            except Exception:
+                pass
+
+class RecordingHttp:
+    """실제 트랜스포트로 요청하고 응답을 카세트에 기록"""
+
+    def __init__(self, http, cassette):
+        self.http = http
+        self.cassette = cassette
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        start = time.perf_counter()
+        resp, content = self.http.request(uri, method=method, body=body, headers=headers, **kwargs)
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+        self.cassette.record_exchange(method, uri, body, lowered, resp, content, time.perf_counter() - start)
+        return resp, content
+
+    def close(self):
+        self.http.close()
+
+class ReplayHttp:
+    """카세트에 기록된 응답을 돌려주는 트랜스포트 (네트워크 사용 안 함)"""
+
+    def __init__(self, cassette):
+        self.cassette = cassette
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+        return self.cassette.replay_exchange(method, uri, body, lowered)
+
+    def close(self):
+        pass
+
+class _CassetteElement:
+    """클릭을 가로채기 위해 WebElement를 감싼 객체 (나머지 속성은 그대로 전달)"""
+
+    def __init__(self, driver, element):
+        self._driver = driver
+        self._element = element
+
+    def __getattr__(self, name):
+        return getattr(self._element, name)
+
+    def click(self):
+        self._driver._before_action()
+        if self._driver.live:
+            self._element.click()
+
+    def find_element(self, by, value=None):
+        return _CassetteElement(self._driver, self._element.find_element(by, value))
+
+    def find_elements(self, by, value=None):
+        return [_CassetteElement(self._driver, e) for e in self._element.find_elements(by, value)]
+
+class _CassetteDriver:
+    """기록/재생 드라이버 공통 부분 - find_element 결과를 감싸고 클릭 스크립트를 가로챔"""
+
+    live = True
+
+    def __init__(self, driver, cassette):
+        self._driver = driver
+        self.cassette = cassette
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def find_element(self, by, value=None):
+        return _CassetteElement(self, self._driver.find_element(by, value))
+
+    def find_elements(self, by, value=None):
+        return [_CassetteElement(self, e) for e in self._driver.find_elements(by, value)]
+
+    def execute_script(self, script, *args):
+        args = [a._element if isinstance(a, _CassetteElement) else a for a in args]
+        if 'click' in script:
+            self._before_action()
+            if not self.live:
+                return None
+        return self._driver.execute_script(script, *args)
+
+    def _before_action(self):
+        raise NotImplementedError
+
+class RecordingDriver(_CassetteDriver):
+    """실제 WebDriver로 크롤링하면서 클릭/이동 직전의 페이지 상태를 기록"""
+
+    def __init__(self, driver, cassette):
+        super().__init__(driver, cassette)
+        self._visit = None
+
+    def get(self, url):
+        self._snapshot()
+        start = time.perf_counter()
+        self._driver.get(url)
+        self._visit = self.cassette.record_visit(url, time.perf_counter() - start)
+
+    def _snapshot(self):
+        if self._visit is None:
+            return
+        try:
+            self.cassette.record_state(self._visit, self._driver.current_url, self._driver.page_source)
+        except Exception as e:
+            print(f"페이지 기록 중 오류 발생: {e}")
+
+    def _before_action(self):
+        # 클릭 직전까지 크롤러가 읽은 DOM이 이 상태
+        self._snapshot()
+
+    def quit(self):
+        self._snapshot()
+        self._visit = None
+        self._driver.quit()
+
+class ReplayDriver(_CassetteDriver):
+    """기록된 페이지 상태를 헤드리스 Chrome에 열어 크롤러에 보여 주는 드라이버"""
+
+    live = False
+
+    def __init__(self, cassette):
+        super().__init__(cassette.browser(), cassette)
+        self._states = []
+        self._index = 0
+
+    @property
+    def current_url(self):
+        return self._states[self._index]['url'] if self._states else self._driver.current_url
+
+    def get(self, url):
+        self._states = self.cassette.replay_visit(url)['states']
+        self._index = 0
+        self._driver.get(self.cassette.page_uri(self._states[0]))
+
+    def _before_action(self):
+        # 기록 때와 같은 순서로 클릭하면 다음 상태가 그 클릭의 결과
+        if self._index + 1 < len(self._states):
+            self._index += 1
+            self._driver.get(self.cassette.page_uri(self._states[self._index]))
+
+    def quit(self):
+        # 브라우저는 카세트가 공유하므로 닫지 않음
+        self._states = []
+
+_CASSETTE = None
+_CASSETTE_LOCK = threading.Lock()
+
+def get_cassette():
+    """PALDO_CASSETTE 환경 변수로 지정된 카세트 반환 (없으면 None)"""
+    global _CASSETTE
+    path = os.getenv('PALDO_CASSETTE')
+    if not path:
+        return None
+    with _CASSETTE_LOCK:
+        if _CASSETTE is None:
+            _CASSETTE = Cassette(path, os.getenv('PALDO_CASSETTE_MODE', 'replay'),
+                                 os.getenv('PALDO_CASSETTE_TIMING', 'real'))
+        return _CASSETTE
+
+def create_driver(factory):
+    """크롤러용 WebDriver 생성 - 카세트가 지정되어 있으면 기록/재생 드라이버로 감쌈
+
+    factory는 실제 Chrome을 띄우는 함수이며, 재생 모드에서는 호출하지 않는다.
+    """
+    cassette = get_cassette()
+    if cassette is None:
+        return factory()
+    if cassette.recording:
+        return RecordingDriver(factory(), cassette)
+    return ReplayDriver(cassette)
@@ -8,12 +8,14 @@
 import sys
 import os
 import subprocess
+import threading
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QTabWidget, QListWidget, QStackedWidget,
                              QListWidgetItem, QLabel, QPushButton, QComboBox,
                              QLineEdit, QFormLayout, QGroupBox, QRadioButton,
                              QMessageBox, QCheckBox, QFileDialog, QInputDialog,
-                             QProgressBar, QTextEdit)
+                             QProgressBar, QTextEdit, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QSpinBox)
 from PyQt5.QtCore import Qt, QUrl, QMimeData
 from PyQt5.QtGui import QDesktopServices, QDragEnterEvent, QDropEvent
 
@@ -32,8 +34,8 @@ from image_drop_widget import ImageDropWidget
 # 이미지 업로드를 위한 추가 임포트
 import mimetypes
 from googleapiclient.http import MediaFileUpload
-from auth import get_credentials
-from googleapiclient.discovery import build
+from auth import get_service, prefetch_discovery_documents
+import api_metrics
 import tempfile
 import uuid
 import os
@@ -41,14 +43,18 @@ from PIL import ImageGrab, Image
 
 # 소셜체험단 업로드트래킹 모듈 임포트
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '소셜체험단_업로드트래킹'))
-from Blog_uploadTracking import setup_webdriver, scrape_blog_data, get_blog_data_from_sheet, extract_sheet_id
+from Blog_uploadTracking import (close_fallback_driver, crawl_blogs, get_blog_data_from_sheet, extract_sheet_id,
+                                  get_blog_mirror, get_blog_work_list_from_all_tabs, style_status_board)
+from crawl_engine import CRAWL_WORKERS, PER_HOST_LIMIT
+from sheet_writer import close_sheet_writers
+from sheet_mirror import start_sync_jobs, close_sheet_mirrors
 
 class UploadTrackingUI(QWidget):
     def __init__(self):
         super().__init__()
         self.initUI()
-        self.driver = None
         self.service = None
+        # Chrome은 여기서 띄우지 않음 - 브라우저가 처음 필요할 때 풀이 띄우고 이후 재사용
         
     def initUI(self):
         layout = QVBoxLayout()
@@ -66,6 +72,10 @@ class UploadTrackingUI(QWidget):
         help_label.setStyleSheet("color: gray; font-size: 10px;")
         sheet_layout.addRow("", help_label)
         
+        # 전체 탭 모드 (같은 블로거는 한 번만 크롤링하고 모든 행에 기록)
+        self.all_tabs_checkbox = QCheckBox("모든 탭 한 번에 처리 ('시트1' 대신)")
+        sheet_layout.addRow("", self.all_tabs_checkbox)
+        
         sheet_group.setLayout(sheet_layout)
         layout.addWidget(sheet_group)
         
@@ -77,6 +87,13 @@ class UploadTrackingUI(QWidget):
         self.keyword_input.setPlaceholderText("검색할 키워드를 입력하세요")
         search_layout.addRow("키워드:", self.keyword_input)
         
+        # 동시에 검색할 블로그 수 - 모든 작업이 blog.naver.com으로 가므로 호스트당 상한보다 늘려도 빨라지지 않음
+        self.workers_input = QSpinBox()
+        self.workers_input.setRange(1, PER_HOST_LIMIT)
+        self.workers_input.setValue(min(CRAWL_WORKERS, PER_HOST_LIMIT))
+        self.workers_input.setToolTip(f"blog.naver.com에는 동시에 {PER_HOST_LIMIT}개까지만 요청합니다. (PALDO_CRAWL_PER_HOST)")
+        search_layout.addRow(f"동시 작업 수 (최대 {PER_HOST_LIMIT}):", self.workers_input)
+        
         search_group.setLayout(search_layout)
         layout.addWidget(search_group)
         
@@ -85,6 +102,16 @@ class UploadTrackingUI(QWidget):
         self.start_button.clicked.connect(self.start_tracking)
         layout.addWidget(self.start_button)
         
+        # 시트 현황 버튼 (로컬 미러 조회)
+        self.status_button = QPushButton("시트 현황 보기")
+        self.status_button.clicked.connect(self.show_sheet_status)
+        layout.addWidget(self.status_button)
+        
+        # 시트에 현황 색 표시 버튼 (서식 요청을 모아 한 번에 전송)
+        self.style_button = QPushButton("시트에 현황 색 표시")
+        self.style_button.clicked.connect(self.style_sheet_status)
+        layout.addWidget(self.style_button)
+        
         # 진행 상태 표시
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -101,6 +128,46 @@ class UploadTrackingUI(QWidget):
         """로그 메시지를 출력 영역에 추가"""
         self.log_output.append(message)
     
+    def show_sheet_status(self):
+        """로컬 미러로 시트 현황 조회 (시트가 바뀌었을 때만 다시 읽음)"""
+        sheet_id_or_url = self.sheet_id_input.text().strip()
+        if not sheet_id_or_url:
+            QMessageBox.warning(self, "입력 오류", "구글 시트 URL 또는 ID를 입력해주세요.")
+            return
+        
+        try:
+            spreadsheet_id = extract_sheet_id(sheet_id_or_url)
+            mirror = get_blog_mirror(get_service('sheets', 'v4'), spreadsheet_id)
+            mirror.sync()
+            
+            self.log("\n=== 시트 현황 ===")
+            self.log(f"링크를 찾아야 할 블로그: {len(mirror.pending_rows('B', 'C'))}개")
+            self.log(f"C열(포스팅 링크)이 빈 행: {len(mirror.rows_without('C'))}개")
+            for weeks in (1, 2, 4):
+                self.log(f"최근 {weeks}주 안에 올라온 포스팅: {len(mirror.posts_within(weeks))}개")
+            if mirror.dirty_count():
+                self.log(f"시트에 아직 보내지 않은 셀: {mirror.dirty_count()}개")
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+        except Exception as e:
+            self.log(f"시트 현황 조회 중 오류 발생: {str(e)}")
+    
+    def style_sheet_status(self):
+        """추적 시트의 헤더와 C열을 현황에 맞게 색칠 (spreadsheets.batchUpdate 한 번)"""
+        sheet_id_or_url = self.sheet_id_input.text().strip()
+        if not sheet_id_or_url:
+            QMessageBox.warning(self, "입력 오류", "구글 시트 URL 또는 ID를 입력해주세요.")
+            return
+        
+        try:
+            spreadsheet_id = extract_sheet_id(sheet_id_or_url)
+            done, pending = style_status_board(get_service('sheets', 'v4'), spreadsheet_id)
+            self.log(f"\n시트에 현황 색을 표시했습니다. (링크 찾음 {done}개 / 아직 못 찾음 {pending}개)")
+        except ValueError as e:
+            QMessageBox.warning(self, "입력 오류", str(e))
+        except Exception as e:
+            self.log(f"현황 색 표시 중 오류 발생: {str(e)}")
+    
     def start_tracking(self):
         """업로드 추적 시작"""
         sheet_id_or_url = self.sheet_id_input.text().strip()
@@ -122,12 +189,17 @@ class UploadTrackingUI(QWidget):
                 return
             
             # 구글 시트 서비스 초기화
-            creds = get_credentials()
-            self.service = build('sheets', 'v4', credentials=creds)
+            self.service = get_service('sheets', 'v4')
+            
+            # 추적하는 동안 미러를 주기적으로 시트와 동기화 (끝나면 close_sheet_mirrors()에서 멈춤)
+            start_sync_jobs()
             
             # 블로그 데이터 가져오기
             self.log("블로그 데이터를 가져오는 중...")
-            urls, names, row_indices = get_blog_data_from_sheet(self.service, sheet_id_or_url)
+            if self.all_tabs_checkbox.isChecked():
+                urls, names, row_indices = get_blog_work_list_from_all_tabs(self.service, sheet_id_or_url)
+            else:
+                urls, names, row_indices = get_blog_data_from_sheet(self.service, sheet_id_or_url)
             
             if not urls:
                 self.log("처리할 블로그 데이터가 없습니다.")
@@ -135,19 +207,19 @@ class UploadTrackingUI(QWidget):
             
             self.log(f"총 {len(urls)}개의 블로그를 검색합니다.")
             
-            # 웹드라이버 설정
-            self.driver = setup_webdriver()
-            
             # 진행 상태바 설정
             self.progress_bar.setVisible(True)
             self.progress_bar.setMaximum(len(urls))
             self.progress_bar.setValue(0)
             
-            # 각 블로그별로 실시간 처리
-            for i, (url, name, row_index) in enumerate(zip(urls, names, row_indices)):
-                self.log(f"\n{name}의 블로그 검색 중...")
-                data = scrape_blog_data(self.driver, url, keyword, name, self.service, spreadsheet_id, row_index)
-                self.progress_bar.setValue(i + 1)
+            # 작업자 여러 명이 동시에 처리하고, 끝나는 대로 진행 상태 갱신
+            # (HTTP로 읽고, 실패한 블로그만 브라우저를 띄워 읽음)
+            def on_result(index, job, data, error):
+                self.log(f"{job[1]}의 블로그 검색 완료 ({len(data or [])}개 글)")
+                self.progress_bar.setValue(self.progress_bar.value() + 1)
+            
+            crawl_blogs(urls, names, row_indices, keyword, self.service, spreadsheet_id,
+                        workers=self.workers_input.value(), on_result=on_result)
             
             self.log("\n업로드 추적이 완료되었습니다.")
             
@@ -156,10 +228,73 @@ class UploadTrackingUI(QWidget):
             QMessageBox.critical(self, "오류", f"업로드 추적 중 오류가 발생했습니다: {str(e)}")
         
         finally:
-            if self.driver:
-                self.driver.quit()
+            # 브라우저 풀은 닫지 않고 유지 - 다음 실행에서 Chrome을 다시 띄우지 않음 (대시보드 종료 시 닫음)
+            # 미러에 모아 둔 시트 쓰기(링크/작성일) 전송
+            close_sheet_mirrors()
+            close_sheet_writers()
             self.progress_bar.setVisible(False)
 
+class ApiLogUI(QWidget):
+    """관리자 탭 '로그 확인' - Google API 호출 집계 (logs/api_calls.jsonl)"""
+    
+    COLUMNS = ["API", "메서드", "호출 수", "오류", "재시도", "평균(ms)", "p50(ms)", "p95(ms)",
+               "최대(ms)", "쿼터 대기(ms)", "요청(KB)", "응답(KB)"]
+    
+    def __init__(self):
+        super().__init__()
+        self.initUI()
+        self.refresh()
+    
+    def initUI(self):
+        layout = QVBoxLayout()
+        
+        # 상단 요약 및 새로고침 버튼
+        top_layout = QHBoxLayout()
+        self.summary_label = QLabel()
+        refresh_button = QPushButton("새로고침")
+        refresh_button.clicked.connect(self.refresh)
+        top_layout.addWidget(self.summary_label)
+        top_layout.addStretch()
+        top_layout.addWidget(refresh_button)
+        layout.addLayout(top_layout)
+        
+        # 메서드별 집계 표
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setColumnCount(len(self.COLUMNS) + len(api_metrics.histogram_labels()))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS + api_metrics.histogram_labels())
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        layout.addWidget(self.table)
+        
+        path_label = QLabel(f"로그 파일: {api_metrics.LOG_PATH}")
+        path_label.setStyleSheet("color: gray; font-size: 10px;")
+        layout.addWidget(path_label)
+        
+        self.setLayout(layout)
+    
+    def refresh(self):
+        """로그 파일을 다시 읽어 표 갱신"""
+        try:
+            summary = api_metrics.summarize()
+        except Exception as e:
+            self.summary_label.setText(f"로그를 읽는 중 오류 발생: {str(e)}")
+            return
+        
+        total_calls = sum(item['count'] for item in summary)
+        total_errors = sum(item['errors'] for item in summary)
+        self.summary_label.setText(f"총 {total_calls}회 호출, 오류 {total_errors}회")
+        
+        self.table.setRowCount(len(summary))
+        for row, item in enumerate(summary):
+            values = [
+                item['api'], item['method'], item['count'], item['errors'], item['retries'],
+                f"{item['avg_ms']:.0f}", f"{item['p50_ms']:.0f}", f"{item['p95_ms']:.0f}",
+                f"{item['max_ms']:.0f}", f"{item['queue_ms']:.0f}",
+                f"{item['request_bytes'] / 1024:.1f}", f"{item['response_bytes'] / 1024:.1f}",
+            ] + item['histogram']
+            for col, value in enumerate(values):
+                self.table.setItem(row, col, QTableWidgetItem(str(value)))
+
 class Dashboard(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -169,6 +304,9 @@ class Dashboard(QMainWindow):
         self.admin_tab_index = 7  # 관리자 탭의 인덱스 (나중에 설정됨)
         self.initUI()
         
+        # 구글 API 디스커버리 문서를 미리 로드해 첫 클릭 지연을 없앰
+        threading.Thread(target=prefetch_discovery_documents, daemon=True).start()
+        
     def initUI(self):
         # 메인 위젯과 레이아웃 설정
         main_widget = QWidget()
@@ -270,6 +408,8 @@ class Dashboard(QMainWindow):
                 content_layout.addWidget(self.create_googleform_ui())
             elif item_text == "업로드 추적":
                 content_layout.addWidget(UploadTrackingUI())
+            elif item_text == "로그 확인":
+                content_layout.addWidget(ApiLogUI())
             else:
                 label = QLabel(f"{item_text} 기능이 여기에 구현됩니다.")
                 label.setAlignment(Qt.AlignCenter)
@@ -370,6 +510,11 @@ class Dashboard(QMainWindow):
         else:
             QMessageBox.warning(self, "인증 실패", "잘못된 승인번호입니다.")
     
+    def closeEvent(self, event):
+        """대시보드 종료 시 미리 띄워 둔 브라우저 종료"""
+        close_fallback_driver()
+        super().closeEvent(event)
+    
     def on_tab_changed(self, index):
         """탭 변경 시 호출되는 이벤트 핸들러"""
         # 관리자 탭으로 이동하고 아직 인증되지 않았으면 인증 화면 표시
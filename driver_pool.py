@@ -0,0 +1,225 @@
+'''
+WebDriver 풀 (미리 띄워 두고 재사용)
+- 크롤링 작업이 필요할 때마다 Chrome을 새로 띄우면 매번 몇 초씩 걸리므로,
+  브라우저를 미리(백그라운드에서) 띄워 두고 작업에 빌려주었다가 돌려받아 다시 씁니다.
+- 돌려받을 때 상태를 확인해(health check) 응답이 없거나 죽은 브라우저는 버리고,
+  max_pages번 빌려준 브라우저도 메모리가 늘어나지 않도록 새것으로 교체합니다.
+- 교체용 브라우저는 백그라운드에서 띄우므로 다음 작업이 기다리지 않습니다.
+
+### 사용 예
+pool = DriverPool(setup_webdriver, size=2)
+pool.prewarm()  # 백그라운드에서 미리 띄움
+with pool.lease() as driver:
+    driver.get(url)
+pool.close()  # 프로그램 종료 시
+'''
+
+import os
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+
+DRIVER_POOL_SIZE = int(os.getenv('PALDO_DRIVER_POOL', '2'))  # 동시에 띄워 둘 수 있는 브라우저 수
+MAX_PAGES = 50  # 브라우저 하나를 이만큼 빌려준 뒤에는 새것으로 교체
+MAX_LAUNCH_FAILURES = 3  # 브라우저 실행이 연속으로 이만큼 실패하면 acquire()가 마지막 오류를 발생시킴
+
+class PooledDriver:
+    """풀이 관리하는 브라우저 하나 (빌려준 횟수 포함)"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.time()
+
+def is_healthy(driver):
+    """브라우저가 응답하는지 확인 (창이 닫혔거나 드라이버가 죽었으면 False)"""
+    try:
+        driver.current_url
+        return bool(driver.window_handles)
+    except Exception:
+        return False
+
+def quit_driver(driver):
+    """브라우저 종료 (이미 죽은 경우의 오류는 무시)"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+class DriverPool:
+    """미리 띄운 WebDriver를 빌려주고 돌려받는 풀
+
+    factory는 브라우저를 새로 띄워 반환하는 함수. 한 브라우저는 한 번에 한 작업(스레드)만 쓴다.
+    """
+
+    def __init__(self, factory, size=DRIVER_POOL_SIZE, max_pages=MAX_PAGES):
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self._idle = []  # 쉬고 있는 PooledDriver
+        self._leased = {}  # id(driver) → 빌려준 PooledDriver
+        self._launching = 0  # 띄우는 중인 브라우저 수
+        self._checking = 0  # 락 밖에서 상태 확인 중인 브라우저 수
+        self._closed = False
+        self._launch_failures = 0  # 연속으로 실패한 브라우저 실행 수
+        self._launch_error = None  # 마지막 실행 실패 예외
+        self._cond = threading.Condition()
+        self.launch_count = 0  # 실제로 브라우저를 띄운 횟수
+        self.recycle_count = 0  # 상태 이상 / max_pages로 교체한 횟수
+
+    def _total(self):
+        return len(self._idle) + len(self._leased) + self._launching + self._checking
+
+    def _launch(self):
+        """브라우저를 하나 띄워 쉬는 목록에 추가 (호출 전에 _launching을 늘려 둠)"""
+        pooled = error = None
+        try:
+            pooled = PooledDriver(self.factory())
+        except Exception as e:
+            print(f"브라우저 실행 중 오류 발생: {str(e)}")
+            error = e
+        with self._cond:
+            self._launching -= 1
+            if error is not None:
+                self._launch_failures += 1
+                self._launch_error = error
+            if pooled is not None:
+                self._launch_failures = 0
+                self.launch_count += 1
+                if self._closed:
+                    quit_driver(pooled.driver)
+                else:
+                    self._idle.append(pooled)
+            self._cond.notify_all()
+
+    def _launch_in_background(self):
+        """풀에 자리가 있으면 백그라운드에서 하나 더 띄움 (락을 잡은 상태에서 호출)"""
+        if self._closed or self._total() >= self.size:
+            return False
+        self._launching += 1
+        threading.Thread(target=self._launch, name='driver-pool-launch', daemon=True).start()
+        return True
+
+    def prewarm(self, count=None):
+        """백그라운드에서 브라우저를 count개(기본: 풀 크기)까지 미리 띄움 - 바로 반환"""
+        with self._cond:
+            while len(self._idle) + self._launching < (count or self.size) and self._launch_in_background():
+                pass
+
+    def acquire(self, timeout=None):
+        """브라우저 하나를 빌림 - 쉬는 브라우저가 없으면 새로 띄우거나(자리가 있을 때) 돌아올 때까지 기다림
+
+        상태 확인(WebDriver 왕복)은 락 밖에서 하므로, 응답 없는 브라우저 하나가 다른 acquire/release를 막지 않는다.
+        브라우저 실행이 연속으로 MAX_LAUNCH_FAILURES번 실패하면 (Chrome이 없거나 드라이버 버전이 안 맞는 등)
+        timeout이 없어도 계속 기다리지 않고 마지막 실행 오류를 발생시킨다.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while not self._idle:
+                    if self._closed:
+                        raise RuntimeError("브라우저 풀이 닫혔습니다.")
+                    if self._launch_failures >= MAX_LAUNCH_FAILURES and not self._launching:
+                        # 다음 acquire()는 다시 MAX_LAUNCH_FAILURES번까지 시도
+                        error, self._launch_failures = self._launch_error, 0
+                        raise error
+                    if not self._launching:
+                        self._launch_in_background()
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("사용할 수 있는 브라우저가 없습니다.")
+                    self._cond.wait(remaining)
+                if self._closed:
+                    raise RuntimeError("브라우저 풀이 닫혔습니다.")
+                pooled = self._idle.pop()
+                self._checking += 1
+
+            healthy = is_healthy(pooled.driver)
+            if not healthy:
+                # 쉬는 동안 죽은 브라우저는 버리고 새로 띄움
+                print("응답하지 않는 브라우저를 교체합니다.")
+                quit_driver(pooled.driver)
+            with self._cond:
+                self._checking -= 1
+                if healthy and not self._closed:
+                    pooled.pages += 1
+                    self._leased[id(pooled.driver)] = pooled
+                    return pooled.driver
+                if not healthy:
+                    self.recycle_count += 1
+                    self._launch_in_background()
+                self._cond.notify_all()
+            if healthy:
+                # 상태를 확인하는 사이 풀이 닫힘
+                quit_driver(pooled.driver)
+                raise RuntimeError("브라우저 풀이 닫혔습니다.")
+
+    def release(self, driver, broken=False):
+        """빌린 브라우저를 돌려줌 - 죽었거나(broken / health check 실패) max_pages번 쓴 브라우저는 교체"""
+        with self._cond:
+            pooled = self._leased.pop(id(driver), None)
+            if pooled is None:
+                return
+            self._checking += 1
+        worn_out = self.max_pages and pooled.pages >= self.max_pages
+        if broken or worn_out or not is_healthy(driver):
+            if not worn_out:
+                print("브라우저에 문제가 있어 새로 띄웁니다.")
+            quit_driver(driver)
+            with self._cond:
+                self._checking -= 1
+                self.recycle_count += 1
+                self._launch_in_background()
+                self._cond.notify_all()
+            return
+        with self._cond:
+            self._checking -= 1
+            closed = self._closed
+            if not closed:
+                self._idle.append(pooled)
+            self._cond.notify_all()
+        if closed:
+            quit_driver(driver)
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """with pool.lease() as driver: ... - 작업이 끝나거나 예외가 나면 돌려줌 (돌려줄 때 상태 확인)"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def stats(self):
+        """풀 상태 요약"""
+        with self._cond:
+            return {'idle': len(self._idle), 'leased': len(self._leased), 'launching': self._launching,
+                    'launched': self.launch_count, 'recycled': self.recycle_count}
+
+    def close(self):
+        """쉬는 브라우저를 모두 종료 (빌려준 브라우저는 돌아올 때 종료)"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for pooled in idle:
+            quit_driver(pooled.driver)
+
+_POOLS = []
+_POOLS_LOCK = threading.Lock()
+
+def register_pool(pool):
+    """프로그램 종료 시 닫을 풀로 등록"""
+    with _POOLS_LOCK:
+        _POOLS.append(pool)
+    return pool
+
+@atexit.register
+def close_driver_pools():
+    """등록된 풀 전체 종료"""
+    with _POOLS_LOCK:
+        pools = list(_POOLS)
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
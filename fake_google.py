@@ -0,0 +1,717 @@
+'''
+가짜 Google Sheets / Forms / Drive 백엔드 (오프라인 벤치마크용)
+- 이 프로젝트가 쓰는 API만 메모리에서 흉내 냅니다.
+  · Sheets v4 : spreadsheets.get / batchUpdate(updateCells, repeatCell, mergeCells, unmergeCells),
+                values.get / batchGet / update / batchUpdate
+  · Forms v1  : forms.create / get / batchUpdate, forms.responses.list
+  · Drive v3  : files.create(업로드 포함) / get / update, permissions.create
+  · 위 요청들을 묶은 배치 요청 (BatchHttpRequest)
+- httplib2.Http와 같은 request() 인터페이스를 가지므로 실제 서비스 객체, execute_request(),
+  BatchCollector, api_metrics가 그대로 동작합니다.
+- 지연 시간 프로필(LATENCY_PROFILES)과 쿼터 오류 프로필(ERROR_PROFILES)로
+  네트워크 없이 트래커/폼 생성 처리량을 측정할 수 있습니다.
+
+### 사용 예
+from auth import use_backend
+from fake_google import FakeGoogleBackend
+
+backend = FakeGoogleBackend(latency='typical', errors='quota')
+sheet_id = backend.add_spreadsheet({'시트1': [['이름', '블로그'], ['홍길동', 'https://blog.naver.com/abc']]})
+use_backend(backend)  # 이후 get_service()는 모두 가짜 백엔드로 요청
+
+### 픽스처 파일로 실행 (.env 또는 환경 변수)
+PALDO_FAKE_GOOGLE=벤치마크/fixture.json python dashboard.py
+'''
+
+import re
+import json
+import time
+import uuid
+import random
+import datetime
+import threading
+from collections import Counter, deque
+from email.parser import Parser, BytesParser
+from urllib.parse import urlparse, parse_qs, unquote
+import httplib2
+
+# API별 응답 지연 시간 (평균 초, ± 편차 초)
+LATENCY_PROFILES = {
+    'zero': {},
+    'typical': {'sheets': (0.25, 0.1), 'forms': (0.35, 0.15), 'drive': (0.2, 0.1)},
+    'slow': {'sheets': (0.8, 0.4), 'forms': (1.0, 0.5), 'drive': (0.6, 0.3)},
+}
+
+# 쿼터 / 서버 오류 프로필
+# - quota: (api, 'read'|'write')별 window초 동안 허용할 요청 수 (초과하면 429 + Retry-After)
+# - error_rate: API별로 500/503을 돌려줄 확률
+ERROR_PROFILES = {
+    'none': {},
+    'quota': {
+        'quota': {
+            ('sheets', 'read'): 60, ('sheets', 'write'): 60,
+            ('forms', 'read'): 180, ('forms', 'write'): 60,
+            ('drive', 'read'): 12000, ('drive', 'write'): 12000,
+        },
+        'window': 60,
+    },
+    'flaky': {'error_rate': {'sheets': 0.05, 'forms': 0.05, 'drive': 0.05}},
+}
+
+FOLDER_MIME = 'application/vnd.google-apps.folder'
+SPREADSHEET_MIME = 'application/vnd.google-apps.spreadsheet'
+FORM_MIME = 'application/vnd.google-apps.form'
+
+class FakeApiError(Exception):
+    """가짜 백엔드가 돌려줄 HTTP 오류"""
+
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+def column_index(letters):
+    """열 문자를 0부터 시작하는 번호로 변환 (A → 0, AA → 26)"""
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + (ord(char) - ord('A') + 1)
+    return index - 1
+
+def column_letters(index):
+    """0부터 시작하는 열 번호를 열 문자로 변환 (0 → A, 26 → AA)"""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+_CELL_RE = re.compile(r'^([A-Za-z]*)(\d*)$')
+
+def split_a1(a1):
+    """A1 표기를 (시트 이름 또는 None, 셀 범위 문자열 또는 None)으로 분리"""
+    if '!' in a1:
+        sheet, cells = a1.rsplit('!', 1)
+    elif all(_CELL_RE.match(part) for part in a1.split(':')):
+        sheet, cells = None, a1
+    else:
+        sheet, cells = a1, None
+    if sheet and sheet.startswith("'") and sheet.endswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    return sheet, cells
+
+def parse_cells(cells):
+    """셀 범위를 (시작 행, 시작 열, 끝 행, 끝 열)로 변환 (0부터 시작, 끝은 미포함, 제한 없으면 None)"""
+    if not cells:
+        return 0, 0, None, None
+    parts = cells.split(':')
+    start_col, start_row = _CELL_RE.match(parts[0]).groups()
+    if len(parts) == 1:
+        end_col, end_row = start_col, start_row
+    else:
+        end_col, end_row = _CELL_RE.match(parts[1]).groups()
+    return (
+        int(start_row) - 1 if start_row else 0,
+        column_index(start_col) if start_col else 0,
+        int(end_row) if end_row else None,
+        column_index(end_col) + 1 if end_col else None,
+    )
+
+def quote_sheet(title):
+    """응답의 range 표기용 시트 이름"""
+    if re.match(r'^[A-Za-z0-9_]+$', title):
+        return title
+    return "'" + title.replace("'", "''") + "'"
+
+def _now():
+    return datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+def _select_fields(resource, fields):
+    """fields 파라미터의 최상위 필드만 남김 (예: 'id, parents, name')"""
+    if not fields:
+        return resource
+    names = [name.strip().split('(')[0].split('/')[0] for name in fields.split(',')]
+    return {name: resource[name] for name in names if name in resource}
+
+class FakeGoogleBackend:
+    """Sheets / Forms / Drive를 메모리에서 흉내 내는 httplib2 호환 트랜스포트
+
+    latency, errors에는 프로필 이름이나 같은 형식의 dict를 넘긴다.
+    여러 스레드에서 동시에 써도 안전하다. (저장소는 락 하나로 보호)
+    """
+
+    def __init__(self, latency='zero', errors='none', seed=None):
+        self.latency = LATENCY_PROFILES[latency] if isinstance(latency, str) else dict(latency)
+        self.errors = ERROR_PROFILES[errors] if isinstance(errors, str) else dict(errors)
+        self.calls = Counter()  # 메서드별 호출 수 (배치 안의 요청 포함)
+        self.files = {}  # Drive 파일 메타데이터 (스프레드시트, 폼, 폴더 포함)
+        self.spreadsheets = {}  # spreadsheet_id → {'title', 'sheets': {title: {'sheetId', 'rows'}}}
+        self.forms = {}
+        self.responses = {}  # form_id → 응답 목록
+        self._random = random.Random(seed)
+        self._quota_windows = {}
+        self._lock = threading.RLock()
+
+    # ----- 데이터 준비 -----
+
+    @classmethod
+    def from_fixture(cls, path, **kwargs):
+        """JSON 픽스처 파일로 백엔드 생성
+
+        형식: {"latency": "typical", "errors": "none",
+               "spreadsheets": {"<id>": {"title": "...", "sheets": {"시트1": [[...], ...]}}},
+               "forms": {"<id>": {"info": {"title": "..."}, "items": [...]}},
+               "responses": {"<form_id>": [...]}}
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            fixture = json.load(f)
+        kwargs.setdefault('latency', fixture.get('latency', 'zero'))
+        kwargs.setdefault('errors', fixture.get('errors', 'none'))
+        backend = cls(**kwargs)
+        for spreadsheet_id, spreadsheet in fixture.get('spreadsheets', {}).items():
+            backend.add_spreadsheet(spreadsheet.get('sheets', {}), spreadsheet.get('title', ''), spreadsheet_id)
+        for form_id, form in fixture.get('forms', {}).items():
+            backend.add_form(form, form_id)
+        for form_id, responses in fixture.get('responses', {}).items():
+            backend.add_form_responses(form_id, responses)
+        return backend
+
+    def add_spreadsheet(self, sheets, title='', spreadsheet_id=None):
+        """시트 이름 → 행 목록 dict로 스프레드시트를 만들고 ID 반환"""
+        with self._lock:
+            spreadsheet_id = spreadsheet_id or self._new_id()
+            self.spreadsheets[spreadsheet_id] = {
+                'title': title or spreadsheet_id,
+                'sheets': {
+                    name: {'sheetId': index, 'rows': [[str(v) for v in row] for row in rows]}
+                    for index, (name, rows) in enumerate(sheets.items())
+                },
+            }
+            self._add_file(spreadsheet_id, title or spreadsheet_id, SPREADSHEET_MIME)
+            return spreadsheet_id
+
+    def add_form(self, form, form_id=None):
+        """폼 리소스(dict)를 등록하고 ID 반환"""
+        with self._lock:
+            form_id = form_id or self._new_id()
+            form = dict(form, formId=form_id)
+            form.setdefault('info', {'title': ''})
+            form.setdefault('items', [])
+            form.setdefault('revisionId', '00000001')
+            form.setdefault('responderUri', f"https://docs.google.com/forms/d/e/{form_id}/viewform")
+            self.forms[form_id] = form
+            self.responses.setdefault(form_id, [])
+            if form_id not in self.files:
+                self._add_file(form_id, form['info'].get('title', ''), FORM_MIME)
+            return form_id
+
+    def add_folder(self, name, parents=None):
+        """Drive 폴더를 만들고 ID 반환"""
+        with self._lock:
+            return self._add_file(self._new_id(), name, FOLDER_MIME, parents)['id']
+
+    def add_form_responses(self, form_id, responses):
+        """폼 응답 추가"""
+        with self._lock:
+            self.responses.setdefault(form_id, []).extend(responses)
+
+    def sheet_values(self, spreadsheet_id, sheet):
+        """시트의 현재 값 (검증용)"""
+        with self._lock:
+            return [list(row) for row in self.spreadsheets[spreadsheet_id]['sheets'][sheet]['rows']]
+
+    def sheet_formats(self, spreadsheet_id, sheet):
+        """시트의 현재 셀 서식 {(행, 열): userEnteredFormat}과 병합 범위 목록 (0부터 시작, 검증용)"""
+        with self._lock:
+            data = self.spreadsheets[spreadsheet_id]['sheets'][sheet]
+            return dict(data.get('formats', {})), [dict(merge) for merge in data.get('merges', [])]
+
+    def reset_stats(self):
+        """호출 수 초기화"""
+        with self._lock:
+            self.calls.clear()
+
+    def _new_id(self):
+        return uuid.uuid4().hex[:20]
+
+    def _add_file(self, file_id, name, mime_type, parents=None):
+        self.files[file_id] = {
+            'kind': 'drive#file',
+            'id': file_id,
+            'name': name,
+            'mimeType': mime_type,
+            'parents': list(parents or ['root']),
+            'permissions': [],
+            'version': '1',
+            'modifiedTime': _now(),
+            'createdTime': _now(),
+        }
+        return self.files[file_id]
+
+    def _touch(self, file_id):
+        """파일이 바뀌었음을 기록 (version, modifiedTime 갱신)"""
+        file = self.files.get(file_id)
+        if file is not None:
+            file['version'] = str(int(file['version']) + 1)
+            file['modifiedTime'] = _now()
+
+    # ----- httplib2 인터페이스 -----
+
+    def request(self, uri, method='GET', body=None, headers=None, redirections=None, connection_type=None):
+        """httplib2.Http.request와 같은 인터페이스 - (Response, content bytes) 반환"""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        parsed = urlparse(uri)
+        self._sleep(self._api_of(parsed))
+
+        if parsed.path.rstrip('/').endswith('/batch') or parsed.path.startswith('/batch/'):
+            return self._batch(body, headers)
+        status, payload, extra_headers = self._dispatch(method, uri, body, headers)
+        return self._response(status, payload, extra_headers)
+
+    def close(self):
+        pass
+
+    def _api_of(self, parsed):
+        host = parsed.netloc.split('.')[0]
+        if host == 'www':
+            parts = [p for p in parsed.path.split('/') if p and p not in ('upload', 'batch')]
+            return parts[0] if parts else host
+        return host
+
+    def _sleep(self, api):
+        mean, jitter = self.latency.get(api, (0.0, 0.0))
+        if mean <= 0 and jitter <= 0:
+            return
+        with self._lock:
+            delay = max(0.0, mean + self._random.uniform(-jitter, jitter))
+        time.sleep(delay)
+
+    def _response(self, status, payload, extra_headers=None):
+        content = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        resp = httplib2.Response(dict({'status': str(status), 'content-type': 'application/json; charset=UTF-8'},
+                                      **(extra_headers or {})))
+        return resp, content
+
+    def _error_payload(self, error):
+        return {'error': {'code': error.status, 'message': error.message}}
+
+    def _check_quota(self, api, kind):
+        """쿼터 초과 / 서버 오류를 흉내 냄 (프로필에 따라 FakeApiError 발생)"""
+        rate = self.errors.get('error_rate', {}).get(api, 0.0)
+        with self._lock:
+            if rate and self._random.random() < rate:
+                raise FakeApiError(self._random.choice([500, 503]), 'Backend Error (simulated)')
+
+            limit = self.errors.get('quota', {}).get((api, kind))
+            if not limit:
+                return
+            window = self.errors.get('window', 60)
+            now = time.monotonic()
+            calls = self._quota_windows.setdefault((api, kind), deque())
+            while calls and now - calls[0] >= window:
+                calls.popleft()
+            if len(calls) >= limit:
+                retry_after = max(1, int(window - (now - calls[0]) + 0.999))
+                raise FakeApiError(429, f"Quota exceeded for {api} {kind} requests (simulated)",
+                                   {'retry-after': str(retry_after)})
+            calls.append(now)
+
+    def _dispatch(self, method, uri, body, headers):
+        """요청 하나 처리 - (status, payload, headers) 반환"""
+        parsed = urlparse(uri)
+        api = self._api_of(parsed)
+        params = parse_qs(parsed.query)  # ranges처럼 여러 번 오는 값은 목록으로
+        query = {k: v[-1] for k, v in params.items()}
+        segments = [unquote(s) for s in parsed.path.split('/') if s]
+        method = method.upper()
+        try:
+            self._check_quota(api, 'read' if method == 'GET' else 'write')
+            if api == 'sheets':
+                name, payload = self._sheets(method, segments[1:], params, self._json(body))
+            elif api == 'forms':
+                name, payload = self._forms(method, segments[1:], query, self._json(body))
+            elif api == 'drive':
+                upload = segments[0] == 'upload'
+                name, payload = self._drive(method, segments[3 if upload else 2:], query, body, headers, upload)
+            else:
+                raise FakeApiError(404, f"Unsupported API: {api}")
+        except FakeApiError as e:
+            with self._lock:
+                self.calls[f"{api}.error"] += 1
+            return e.status, self._error_payload(e), e.headers
+        with self._lock:
+            self.calls[name] += 1
+        return 200, payload, None
+
+    def _json(self, body):
+        if not body:
+            return {}
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        return json.loads(body)
+
+    # ----- 배치 요청 -----
+
+    def _batch(self, body, headers):
+        """multipart/mixed 배치 요청을 풀어 하나씩 처리하고 multipart 응답 반환"""
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        message = Parser().parsestr(f"content-type: {headers['content-type']}\r\n\r\n{body}")
+        boundary = 'batch_' + uuid.uuid4().hex
+        parts = []
+        for part in message.get_payload():
+            request_line, rest = part.get_payload().split('\n', 1)
+            method, path, _ = request_line.strip().split(' ', 2)
+            inner = Parser().parsestr(rest)
+            inner_body = inner.get_payload() or None
+            inner_headers = {k.lower(): v for k, v in inner.items()}
+            uri = f"https://{inner_headers.get('host', '')}{path}"
+            status, payload, extra_headers = self._dispatch(method, uri, inner_body, inner_headers)
+            response_headers = ''.join(f"{k}: {v}\r\n" for k, v in (extra_headers or {}).items())
+            content_id = part['Content-ID'].replace('<', '<response-', 1)
+            parts.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\nContent-ID: {content_id}\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                f"Content-Type: application/json; charset=UTF-8\r\n{response_headers}\r\n"
+                f"{json.dumps(payload, ensure_ascii=False)}\r\n"
+            )
+        content = ''.join(parts) + f"--{boundary}--\r\n"
+        resp = httplib2.Response({'status': '200', 'content-type': f"multipart/mixed; boundary={boundary}"})
+        return resp, content.encode('utf-8')
+
+    # ----- Sheets v4 -----
+
+    def _sheets(self, method, segments, params, body):
+        """segments: ['spreadsheets', id, ...], params: 쿼리 문자열 (키 → 값 목록)"""
+        if len(segments) < 2 or segments[0] != 'spreadsheets':
+            raise FakeApiError(404, 'Unsupported Sheets request')
+        with self._lock:
+            spreadsheet_id, _, action = segments[1].partition(':')
+            spreadsheet = self.spreadsheets.get(spreadsheet_id)
+            if spreadsheet is None:
+                raise FakeApiError(404, f"Requested entity was not found: {spreadsheet_id}")
+            rest = segments[2:]
+
+            if action == 'batchUpdate' and not rest and method == 'POST':
+                replies = [self._apply_sheet_request(spreadsheet_id, request) for request in body.get('requests', [])]
+                self._touch(spreadsheet_id)
+                return 'sheets.spreadsheets.batchUpdate', {'spreadsheetId': spreadsheet_id, 'replies': replies}
+            if action:
+                raise FakeApiError(404, f"Unsupported Sheets request: {method} {'/'.join(segments)}")
+            if not rest and method == 'GET':
+                return 'sheets.spreadsheets.get', self._spreadsheet_resource(spreadsheet_id)
+            if rest == ['values:batchUpdate'] and method == 'POST':
+                responses = [self._write_values(spreadsheet_id, data['range'], data.get('values', []))
+                             for data in body.get('data', [])]
+                self._touch(spreadsheet_id)
+                return 'sheets.spreadsheets.values.batchUpdate', {
+                    'spreadsheetId': spreadsheet_id,
+                    'totalUpdatedCells': sum(r['updatedCells'] for r in responses),
+                    'totalUpdatedRows': sum(r['updatedRows'] for r in responses),
+                    'responses': responses,
+                }
+            if rest == ['values:batchGet'] and method == 'GET':
+                return 'sheets.spreadsheets.values.batchGet', {
+                    'spreadsheetId': spreadsheet_id,
+                    'valueRanges': [self._read_values(spreadsheet_id, a1) for a1 in params.get('ranges', [])],
+                }
+            if len(rest) == 2 and rest[0] == 'values':
+                if method == 'GET':
+                    return 'sheets.spreadsheets.values.get', self._read_values(spreadsheet_id, rest[1])
+                if method == 'PUT':
+                    response = self._write_values(spreadsheet_id, rest[1], body.get('values', []))
+                    self._touch(spreadsheet_id)
+                    return 'sheets.spreadsheets.values.update', response
+        raise FakeApiError(404, f"Unsupported Sheets request: {method} {'/'.join(segments)}")
+
+    def _grid_sheet(self, spreadsheet_id, sheet_id):
+        """sheetId로 시트 dict 찾기"""
+        for sheet in self.spreadsheets[spreadsheet_id]['sheets'].values():
+            if sheet['sheetId'] == sheet_id:
+                return sheet
+        raise FakeApiError(400, f"No grid with id: {sheet_id}")
+
+    def _grid_bounds(self, sheet, grid_range):
+        """GridRange를 (시작 행, 끝 행, 시작 열, 끝 열)로 변환 (끝은 미포함, 제한 없으면 현재 크기까지)"""
+        rows = sheet['rows']
+        end_row = grid_range.get('endRowIndex', max(1000, len(rows)))
+        end_col = grid_range.get('endColumnIndex', max([26] + [len(row) for row in rows]))
+        return grid_range.get('startRowIndex', 0), end_row, grid_range.get('startColumnIndex', 0), end_col
+
+    def _set_cell(self, sheet, row_index, col_index, cell, fields):
+        """CellData 하나를 적용 (fields에 든 항목만 - 값은 rows에, 서식은 formats에 저장)"""
+        names = {name.strip().split('(')[0].split('.')[0] for name in fields.split(',')}
+        if '*' in names or 'userEnteredValue' in names:
+            value = cell.get('userEnteredValue', {})
+            text = next(iter(value.values()), '') if value else ''
+            if isinstance(text, bool):
+                text = 'TRUE' if text else 'FALSE'
+            elif isinstance(text, float) and text.is_integer():
+                text = int(text)
+            self._write_values_to(sheet, row_index, col_index, [[text]])
+        if '*' in names or 'userEnteredFormat' in names:
+            formats = sheet.setdefault('formats', {})
+            if cell.get('userEnteredFormat'):
+                formats[(row_index, col_index)] = cell['userEnteredFormat']
+            else:
+                formats.pop((row_index, col_index), None)
+
+    def _apply_sheet_request(self, spreadsheet_id, request):
+        """spreadsheets.batchUpdate의 요청 하나를 적용하고 reply 반환"""
+        kind, payload = next(iter(request.items()))
+        if kind == 'updateCells':
+            fields = payload.get('fields', '*')
+            if 'start' in payload:
+                sheet = self._grid_sheet(spreadsheet_id, payload['start'].get('sheetId', 0))
+                start_row = payload['start'].get('rowIndex', 0)
+                start_col = payload['start'].get('columnIndex', 0)
+            else:
+                sheet = self._grid_sheet(spreadsheet_id, payload['range'].get('sheetId', 0))
+                start_row, _, start_col, _ = self._grid_bounds(sheet, payload['range'])
+            for row_offset, row in enumerate(payload.get('rows', [])):
+                for col_offset, cell in enumerate(row.get('values', [])):
+                    self._set_cell(sheet, start_row + row_offset, start_col + col_offset, cell, fields)
+        elif kind == 'repeatCell':
+            sheet = self._grid_sheet(spreadsheet_id, payload['range'].get('sheetId', 0))
+            start_row, end_row, start_col, end_col = self._grid_bounds(sheet, payload['range'])
+            for row_index in range(start_row, end_row):
+                for col_index in range(start_col, end_col):
+                    self._set_cell(sheet, row_index, col_index, payload.get('cell', {}), payload.get('fields', '*'))
+        elif kind == 'mergeCells':
+            sheet = self._grid_sheet(spreadsheet_id, payload['range'].get('sheetId', 0))
+            merges = sheet.setdefault('merges', [])
+            if payload['range'] not in merges:
+                merges.append(dict(payload['range']))
+        elif kind == 'unmergeCells':
+            sheet = self._grid_sheet(spreadsheet_id, payload['range'].get('sheetId', 0))
+            start_row, end_row, start_col, end_col = self._grid_bounds(sheet, payload['range'])
+            sheet['merges'] = [
+                merge for merge in sheet.get('merges', [])
+                if not (start_row <= merge.get('startRowIndex', 0) and merge.get('endRowIndex', 0) <= end_row
+                        and start_col <= merge.get('startColumnIndex', 0) and merge.get('endColumnIndex', 0) <= end_col)
+            ]
+        else:
+            raise FakeApiError(400, f"Unsupported request: {kind}")
+        return {}
+
+    def _spreadsheet_resource(self, spreadsheet_id):
+        spreadsheet = self.spreadsheets[spreadsheet_id]
+        sheets = []
+        for index, (title, sheet) in enumerate(spreadsheet['sheets'].items()):
+            rows = sheet['rows']
+            resource = {'properties': {
+                'sheetId': sheet['sheetId'],
+                'title': title,
+                'index': index,
+                'sheetType': 'GRID',
+                'gridProperties': {
+                    'rowCount': max(1000, len(rows)),
+                    'columnCount': max([26] + [len(row) for row in rows]),
+                },
+            }}
+            if sheet.get('merges'):
+                resource['merges'] = [dict(merge) for merge in sheet['merges']]
+            sheets.append(resource)
+        return {
+            'spreadsheetId': spreadsheet_id,
+            'properties': {'title': spreadsheet['title'], 'locale': 'ko_KR'},
+            'sheets': sheets,
+            'spreadsheetUrl': f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit",
+        }
+
+    def _resolve_range(self, spreadsheet_id, a1):
+        """A1 범위를 (시트 이름, 시트 dict, 시작 행, 시작 열, 끝 행, 끝 열)로 변환"""
+        sheets = self.spreadsheets[spreadsheet_id]['sheets']
+        sheet_name, cells = split_a1(a1)
+        if sheet_name is None:
+            # 'Sheet1'처럼 셀 주소로도 읽히는 이름은 같은 이름의 시트가 있으면 시트로 본다
+            if cells in sheets:
+                sheet_name, cells = cells, None
+            else:
+                sheet_name = next(iter(sheets))
+        if sheet_name not in sheets:
+            raise FakeApiError(400, f"Unable to parse range: {a1}")
+        try:
+            bounds = parse_cells(cells)
+        except AttributeError:
+            raise FakeApiError(400, f"Unable to parse range: {a1}")
+        return (sheet_name, sheets[sheet_name]) + bounds
+
+    def _read_values(self, spreadsheet_id, a1):
+        sheet_name, sheet, start_row, start_col, end_row, end_col = self._resolve_range(spreadsheet_id, a1)
+        rows = sheet['rows'][start_row:end_row]
+        values = []
+        for row in rows:
+            cells = row[start_col:end_col]
+            while cells and cells[-1] == '':
+                cells.pop()
+            values.append(cells)
+        while values and not values[-1]:
+            values.pop()
+
+        last_row = end_row if end_row is not None else start_row + max(len(values), 1)
+        last_col = end_col if end_col is not None else start_col + max([len(v) for v in values] + [1])
+        response = {
+            'range': f"{quote_sheet(sheet_name)}!{column_letters(start_col)}{start_row + 1}"
+                     f":{column_letters(last_col - 1)}{last_row}",
+            'majorDimension': 'ROWS',
+        }
+        if values:
+            response['values'] = values
+        return response
+
+    def _write_values(self, spreadsheet_id, a1, values):
+        sheet_name, sheet, start_row, start_col, _, _ = self._resolve_range(spreadsheet_id, a1)
+        self._write_values_to(sheet, start_row, start_col, values)
+
+        width = max([len(v) for v in values] + [0])
+        return {
+            'spreadsheetId': spreadsheet_id,
+            'updatedRange': f"{quote_sheet(sheet_name)}!{column_letters(start_col)}{start_row + 1}"
+                            f":{column_letters(start_col + max(width, 1) - 1)}{start_row + max(len(values), 1)}",
+            'updatedRows': len(values),
+            'updatedColumns': width,
+            'updatedCells': sum(len(v) for v in values),
+        }
+
+    def _write_values_to(self, sheet, start_row, start_col, values):
+        """시트 dict의 (start_row, start_col)부터 값 목록 쓰기 (0부터 시작)"""
+        rows = sheet['rows']
+        for offset, row_values in enumerate(values):
+            row_index = start_row + offset
+            while len(rows) <= row_index:
+                rows.append([])
+            row = rows[row_index]
+            needed = start_col + len(row_values)
+            if len(row) < needed:
+                row.extend([''] * (needed - len(row)))
+            for col_offset, value in enumerate(row_values):
+                row[start_col + col_offset] = '' if value is None else str(value)
+
+    # ----- Forms v1 -----
+
+    def _forms(self, method, segments, query, body):
+        """segments: ['forms'] / ['forms', id] / ['forms', 'id:batchUpdate'] / ['forms', id, 'responses']"""
+        if not segments or segments[0] != 'forms':
+            raise FakeApiError(404, 'Unsupported Forms request')
+        with self._lock:
+            if len(segments) == 1 and method == 'POST':
+                info = dict(body.get('info', {}))
+                form_id = self.add_form({'info': info})
+                return 'forms.forms.create', self.forms[form_id]
+
+            form_id, _, action = segments[1].partition(':')
+            form = self.forms.get(form_id)
+            if form is None:
+                raise FakeApiError(404, f"Requested entity was not found: {form_id}")
+
+            if action == 'batchUpdate' and method == 'POST':
+                replies = [self._apply_form_request(form, request) for request in body.get('requests', [])]
+                form['revisionId'] = f"{int(form['revisionId'], 16) + 1:08x}"
+                self._touch(form_id)
+                response = {'replies': replies, 'writeControl': {'requiredRevisionId': form['revisionId']}}
+                if body.get('includeFormInResponse'):
+                    response['form'] = form
+                return 'forms.forms.batchUpdate', response
+            if len(segments) == 2 and not action and method == 'GET':
+                return 'forms.forms.get', form
+            if segments[2:] == ['responses'] and method == 'GET':
+                responses = self.responses.get(form_id, [])
+                return 'forms.forms.responses.list', {'responses': responses} if responses else {}
+        raise FakeApiError(404, f"Unsupported Forms request: {method} {'/'.join(segments)}")
+
+    def _apply_form_request(self, form, request):
+        """forms.batchUpdate의 요청 하나를 적용하고 reply 반환"""
+        items = form['items']
+        if 'createItem' in request:
+            item = json.loads(json.dumps(request['createItem']['item']))
+            item['itemId'] = uuid.uuid4().hex[:8]
+            reply = {'itemId': item['itemId']}
+            question = item.get('questionItem', {}).get('question')
+            if question is not None:
+                question['questionId'] = uuid.uuid4().hex[:8]
+                reply['questionId'] = [question['questionId']]
+            index = request['createItem'].get('location', {}).get('index', len(items))
+            if index > len(items):
+                raise FakeApiError(400, f"Invalid location index: {index}")
+            items.insert(index, item)
+            return {'createItem': reply}
+        if 'updateFormInfo' in request:
+            form['info'].update(request['updateFormInfo'].get('info', {}))
+            return {}
+        if 'updateSettings' in request:
+            form.setdefault('settings', {}).update(request['updateSettings'].get('settings', {}))
+            return {}
+        if 'updateItem' in request:
+            index = request['updateItem'].get('location', {}).get('index', 0)
+            if index >= len(items):
+                raise FakeApiError(400, f"Invalid location index: {index}")
+            items[index].update(request['updateItem'].get('item', {}))
+            return {}
+        if 'deleteItem' in request:
+            index = request['deleteItem'].get('location', {}).get('index', 0)
+            if index >= len(items):
+                raise FakeApiError(400, f"Invalid location index: {index}")
+            del items[index]
+            return {}
+        raise FakeApiError(400, f"Unsupported Forms request: {list(request)}")
+
+    # ----- Drive v3 -----
+
+    def _drive(self, method, segments, query, body, headers, upload):
+        """segments: ['files'] / ['files', id] / ['files', id, 'permissions']"""
+        if not segments or segments[0] != 'files':
+            raise FakeApiError(404, 'Unsupported Drive request')
+        fields = query.get('fields')
+        with self._lock:
+            if len(segments) == 1 and method == 'POST':
+                metadata = self._upload_metadata(body, headers) if upload else self._json(body)
+                file = self._add_file(self._new_id(), metadata.get('name', 'Untitled'),
+                                      metadata.get('mimeType') or 'application/octet-stream',
+                                      metadata.get('parents'))
+                if file['mimeType'] == SPREADSHEET_MIME:
+                    self.spreadsheets[file['id']] = {'title': file['name'], 'sheets': {'시트1': {'sheetId': 0, 'rows': []}}}
+                return 'drive.files.create', self._file_resource(file, fields)
+
+            file = self.files.get(segments[1]) if len(segments) > 1 else None
+            if file is None:
+                raise FakeApiError(404, f"File not found: {segments[1] if len(segments) > 1 else ''}")
+
+            if len(segments) == 2 and method == 'GET':
+                return 'drive.files.get', self._file_resource(file, fields)
+            if len(segments) == 2 and method == 'PATCH':
+                metadata = self._json(body)
+                for key in ('name', 'mimeType', 'description'):
+                    if key in metadata:
+                        file[key] = metadata[key]
+                removed = [p for p in query.get('removeParents', '').split(',') if p]
+                added = [p for p in query.get('addParents', '').split(',') if p]
+                file['parents'] = [p for p in file['parents'] if p not in removed]
+                file['parents'] += [p for p in added if p not in file['parents']]
+                self._touch(file['id'])
+                return 'drive.files.update', self._file_resource(file, fields)
+            if segments[2:] == ['permissions'] and method == 'POST':
+                permission = dict(self._json(body), id=uuid.uuid4().hex[:16], kind='drive#permission')
+                file['permissions'].append(permission)
+                return 'drive.permissions.create', _select_fields(permission, fields)
+        raise FakeApiError(404, f"Unsupported Drive request: {method} {'/'.join(segments)}")
+
+    def _upload_metadata(self, body, headers):
+        """multipart 업로드 본문에서 메타데이터(JSON) 부분 추출"""
+        content_type = headers.get('content-type', '')
+        if not content_type.startswith('multipart/'):
+            return {}
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        message = BytesParser().parsebytes(b"content-type: " + content_type.encode() + b"\r\n\r\n" + body)
+        for part in message.get_payload():
+            if part.get_content_type() == 'application/json':
+                return json.loads(part.get_payload(decode=True))
+        return {}
+
+    def _file_resource(self, file, fields):
+        resource = {k: v for k, v in file.items() if k != 'permissions'}
+        if not fields:
+            return {k: resource[k] for k in ('kind', 'id', 'name', 'mimeType')}
+        return _select_fields(resource, fields)
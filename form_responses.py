@@ -2,8 +2,10 @@ import os
 import sys
 import csv
 import datetime
-from googleapiclient.discovery import build
-from auth import get_credentials
+from auth import get_service
+from quota_scheduler import execute_request
+import sheet_cache
+from sheet_reader import iter_rows, count_rows
 import re
 
 def extract_form_id_from_url(url):
@@ -18,19 +20,16 @@ def extract_form_id_from_url(url):
 def get_form_responses_direct(form_id):
     """Forms API를 사용하여 응답 데이터를 직접 가져옵니다."""
     try:
-        # 인증 정보 가져오기
-        creds = get_credentials()
-        
-        # Forms API 서비스 객체 생성
-        forms_service = build('forms', 'v1', credentials=creds)
+        # Forms API 서비스 객체 가져오기
+        forms_service = get_service('forms', 'v1')
         
         # 폼 정보 가져오기
-        form_info = forms_service.forms().get(formId=form_id).execute()
+        form_info = execute_request(forms_service.forms().get(formId=form_id))
         form_title = form_info.get('info', {}).get('title', '제목 없음')
         print(f"폼 제목: {form_title}")
         
         # 응답 데이터 직접 가져오기
-        responses_data = forms_service.forms().responses().list(formId=form_id).execute()
+        responses_data = execute_request(forms_service.forms().responses().list(formId=form_id))
         responses = responses_data.get('responses', [])
         
         return len(responses), responses, form_title
@@ -59,43 +58,32 @@ def get_spreadsheet_id_manually():
     return None
 
 def get_form_responses_from_spreadsheet(spreadsheet_id):
-    """스프레드시트에서 응답 수를 가져옵니다."""
+    """스프레드시트에서 응답 수를 가져옵니다. (응답 수, 응답 시트 이름, 스프레드시트 제목) 반환
+
+    응답이 수만 개여도 메모리가 일정하도록 A열(타임스탬프)만 구간 단위로 읽어서 셉니다.
+    """
     try:
-        # 인증 정보 가져오기
-        creds = get_credentials()
+        # 스프레드시트 API 서비스 객체 가져오기
+        sheets_service = get_service('sheets', 'v4')
         
-        # 스프레드시트 API 서비스 객체 생성
-        sheets_service = build('sheets', 'v4', credentials=creds)
-        
-        # 스프레드시트 정보 가져오기
-        sheet_metadata = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+        # 스프레드시트 정보 가져오기 (지난번 이후 응답이 없으면 캐시 사용)
+        sheet_metadata = sheet_cache.get_spreadsheet(sheets_service, spreadsheet_id)
         sheets = sheet_metadata.get('sheets', '')
         spreadsheet_title = sheet_metadata.get('properties', {}).get('title', '제목 없음')
         
         # 첫 번째 시트의 제목 가져오기
         sheet_title = sheets[0]['properties']['title']
         
-        # 데이터 범위 가져오기
-        result = sheets_service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=sheet_title
-        ).execute()
-        
-        # 데이터 가져오기
-        rows = result.get('values', [])
-        
         # 행 수 계산 (헤더 행 제외)
-        if len(rows) > 1:  # 헤더 행이 있다고 가정
-            return len(rows) - 1, rows, spreadsheet_title
-        return 0, rows, spreadsheet_title
+        return count_rows(sheets_service, spreadsheet_id, sheet_title, first_row=2), sheet_title, spreadsheet_title
     
     except Exception as e:
         print(f"스프레드시트 접근 중 오류 발생: {e}")
-        return None, [], ''
+        return None, None, ''
 
 def save_to_csv(data, form_title):
-    """응답 데이터를 CSV 파일로 저장합니다."""
-    if not data or len(data) <= 1:
+    """응답 데이터를 CSV 파일로 저장합니다. (data는 행 목록이나 iter_rows() 같은 생성기 - 한 행씩 기록)"""
+    if isinstance(data, list) and len(data) <= 1:
         print("저장할 데이터가 없습니다.")
         return False
     
@@ -128,12 +116,19 @@ def save_to_csv(data, form_title):
         with open(filepath, 'w', newline='', encoding='utf-8-sig') as csvfile:
             writer = csv.writer(csvfile)
             
-            # 데이터의 모든 행 작성
-            print(f"데이터 {len(data)}행을 저장 중...")
+            # 데이터의 모든 행 작성 (받는 대로 바로 기록)
+            print("데이터를 저장 중...")
+            row_count = 0
             for row in data:
                 writer.writerow(row)
+                row_count += 1
+        
+        if row_count <= 1:
+            os.remove(filepath)
+            print("저장할 데이터가 없습니다.")
+            return False
         
-        print(f"응답 데이터가 '{filepath}' 파일로 저장되었습니다.")
+        print(f"응답 데이터 {row_count}행이 '{filepath}' 파일로 저장되었습니다.")
         
         # 파일이 실제로 존재하는지 확인
         if os.path.exists(filepath):
@@ -180,16 +175,18 @@ def main():
     
     if spreadsheet_id:
         print("입력한 스프레드시트에서 응답 수를 조회합니다...")
-        spreadsheet_count, spreadsheet_data, spreadsheet_title = get_form_responses_from_spreadsheet(spreadsheet_id)
+        spreadsheet_count, sheet_title, spreadsheet_title = get_form_responses_from_spreadsheet(spreadsheet_id)
         
         if spreadsheet_count is not None:
             print(f"스프레드시트에서 가져온 응답 수: {spreadsheet_count}개")
             
             # CSV로 저장할지 물어보기
-            if spreadsheet_data:
+            if spreadsheet_count:
                 save_option = input("\n응답 데이터를 CSV 파일로 저장하시겠습니까? (y/n): ")
                 if save_option.lower() == 'y':
-                    save_to_csv(spreadsheet_data, spreadsheet_title)
+                    # 시트 전체를 메모리에 올리지 않고 구간 단위로 읽으며 기록
+                    rows = iter_rows(get_service('sheets', 'v4'), spreadsheet_id, sheet_title)
+                    save_to_csv(rows, spreadsheet_title)
     
     print("\n참고: 구글 폼에서 정확한 응답 수를 확인하려면 다음 방법을 사용하세요:")
     print("1. 구글 폼에 접속하여 '응답' 탭 선택")
@@ -0,0 +1,182 @@
+'''
+Google API 쿼터 스케줄러
+- Sheets / Forms / Drive의 사용자별 분당 쿼터를 토큰 버킷으로 모델링해서,
+  몰아서 보내고 쉬는 대신 쿼터가 허용하는 최대 속도로 요청을 고르게 내보냅니다.
+- 429 / 500 / 503 응답을 받으면 Retry-After를 따르고, 해당 버킷의 속도를 절반으로 줄였다가
+  성공이 이어지면 조금씩 원래 속도로 되돌립니다.
+- 모든 .execute() 호출은 execute_request(request)를 거치도록 합니다. (호출마다 api_metrics에 기록)
+'''
+
+import time
+import random
+import socket
+import threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from googleapiclient.errors import HttpError
+import api_metrics
+
+# API별 사용자 쿼터 (분당 요청 수) - Google Cloud 콘솔의 기본 사용자별 한도 기준
+QUOTAS = {
+    ('sheets', 'read'): 60,
+    ('sheets', 'write'): 60,
+    ('forms', 'read'): 180,
+    ('forms', 'write'): 60,
+    ('drive', 'read'): 12000,
+    ('drive', 'write'): 12000,
+}
+DEFAULT_QUOTA = 60  # 목록에 없는 API의 분당 요청 수
+BURST_SECONDS = 5  # 버킷에 모아둘 수 있는 최대 토큰 (몇 초 분량까지 한 번에 보낼지)
+
+RETRY_STATUSES = {429, 500, 503}  # 재시도할 HTTP 상태 코드
+MAX_RETRIES = 5
+MAX_BACKOFF = 64  # 지수 백오프 최대 대기 시간 (초)
+
+class TokenBucket:
+    """분당 요청 수 한도를 가진 토큰 버킷 (먼저 온 요청부터 순서대로 통과)"""
+
+    def __init__(self, rate_per_minute):
+        self.max_rate = rate_per_minute / 60.0  # 초당 토큰
+        self.rate = self.max_rate
+        self.min_rate = self.max_rate / 16
+        self.capacity = max(1.0, self.max_rate * BURST_SECONDS)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._queue_lock = threading.Lock()  # 대기 중인 요청의 순서 유지
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """토큰을 얻을 때까지 대기하고 대기한 시간(초) 반환"""
+        waited = 0.0
+        with self._queue_lock:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._refill(now)
+                    # 버킷 용량보다 큰 요청(배치)은 가득 찼을 때 빚을 지고 통과
+                    needed = min(tokens, self.capacity)
+                    if now >= self._paused_until and self._tokens >= needed:
+                        self._tokens -= tokens
+                        return waited
+                    delay = max(self._paused_until - now, (needed - self._tokens) / self.rate)
+                time.sleep(delay)
+                waited += delay
+
+    def throttle(self, pause):
+        """쿼터 초과 응답을 받았을 때 속도를 절반으로 줄이고 pause초 동안 멈춤"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self._tokens = min(self._tokens, 0.0)
+
+    def success(self):
+        """성공 응답마다 속도를 원래 한도 쪽으로 조금씩 되돌림"""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+def request_api(request):
+    """요청 URI로 API 이름(sheets / forms / drive) 판별"""
+    parsed = urlparse(request.uri)
+    host = parsed.netloc.split('.')[0]
+    if host == 'www':
+        # www.googleapis.com/drive/v3/..., www.googleapis.com/upload/drive/v3/...
+        parts = [p for p in parsed.path.split('/') if p and p not in ('upload', 'batch')]
+        return parts[0] if parts else host
+    return host
+
+def request_kind(request):
+    """요청 종류 판별 (GET은 읽기, 나머지는 쓰기)"""
+    return 'read' if request.method.upper() == 'GET' else 'write'
+
+def retry_after_seconds(error):
+    """HttpError의 Retry-After 헤더 값을 초 단위로 반환 (없으면 None)"""
+    resp = getattr(error, 'resp', None)
+    value = resp.get('retry-after') if resp is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def backoff_seconds(attempt):
+    """지수 백오프 대기 시간 (무작위 지터 포함)"""
+    return min(MAX_BACKOFF, 2 ** attempt) + random.uniform(0, 1)
+
+class QuotaScheduler:
+    """API별 토큰 버킷으로 요청 속도를 맞추고 쿼터 오류를 재시도하는 스케줄러"""
+
+    def __init__(self, quotas=None):
+        self.quotas = dict(QUOTAS if quotas is None else quotas)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, api, kind):
+        """(api, kind)에 해당하는 토큰 버킷 반환"""
+        key = (api, kind)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.quotas.get(key, DEFAULT_QUOTA))
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, api, kind, tokens=1):
+        """쿼터 토큰을 얻을 때까지 대기 (배치처럼 직접 실행하는 요청용)"""
+        return self.bucket(api, kind).acquire(tokens)
+
+    def execute(self, request, api=None, kind=None, max_retries=MAX_RETRIES):
+        """쿼터에 맞춰 요청을 실행하고 결과 반환 (재시도 후에도 실패하면 예외를 그대로 발생)"""
+        api = api or request_api(request)
+        bucket = self.bucket(api, kind or request_kind(request))
+        timer = api_metrics.CallTimer(request, api)
+        queue_wait = 0.0
+
+        for attempt in range(max_retries + 1):
+            queue_wait += bucket.acquire()
+            timer.begin()
+            try:
+                response = request.execute()
+            except HttpError as e:
+                status = e.resp.status
+                if status not in RETRY_STATUSES or attempt == max_retries:
+                    timer.finish(status, attempt, queue_wait)
+                    raise
+                delay = retry_after_seconds(e)
+                if delay is None:
+                    delay = backoff_seconds(attempt)
+                bucket.throttle(delay)
+                print(f"⚠️ API 쿼터/서버 오류 {status} (시도 {attempt + 1}/{max_retries + 1}). {delay:.1f}초 후 재시도합니다...")
+                continue
+            except (socket.timeout, ConnectionError) as e:
+                if attempt == max_retries:
+                    timer.finish('network_error', attempt, queue_wait)
+                    raise
+                delay = backoff_seconds(attempt)
+                print(f"⚠️ 네트워크 오류 (시도 {attempt + 1}/{max_retries + 1}). {delay:.1f}초 후 재시도합니다: {e}")
+                time.sleep(delay)
+                continue
+
+            bucket.success()
+            timer.finish(retries=attempt, queue_wait=queue_wait)
+            return response
+
+_DEFAULT_SCHEDULER = QuotaScheduler()
+
+def get_scheduler():
+    """프로세스 공용 스케줄러 반환"""
+    return _DEFAULT_SCHEDULER
+
+def execute_request(request, api=None, kind=None, max_retries=MAX_RETRIES):
+    """공용 스케줄러로 요청 실행 (request.execute() 대신 사용)"""
+    return _DEFAULT_SCHEDULER.execute(request, api=api, kind=kind, max_retries=max_retries)
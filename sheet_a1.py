@@ -0,0 +1,21 @@
+'''
+A1 표기 도우미
+- 열 문자(A, M, AA)와 0부터 시작하는 열 번호를 서로 변환합니다.
+- 시트를 읽고 쓰는 모듈(sheet_reader, sheet_writer, sheet_mirror, sheet_rows, sheet_format)이 함께 씁니다.
+'''
+
+def column_to_index(column):
+    """열 문자를 0부터 시작하는 번호로 변환 (A → 0, M → 12)"""
+    index = 0
+    for char in column.upper():
+        index = index * 26 + (ord(char) - ord('A') + 1)
+    return index - 1
+
+def index_to_column(index):
+    """0부터 시작하는 번호를 열 문자로 변환 (0 → A, 12 → M)"""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
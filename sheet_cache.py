@@ -0,0 +1,145 @@
+'''
+시트 읽기 캐시 (조건부 재조회)
+- values.get / values.batchGet / spreadsheets.get 응답을 스프레드시트 파일의 Drive version과 함께 저장해 두고,
+  다음 읽기 때는 Drive 메타데이터 조회(files.get fields=version) 한 번으로 바뀌었는지 확인합니다.
+  바뀌지 않았으면 저장해 둔 응답을 그대로 돌려주므로 큰 범위를 다시 받지 않습니다.
+- 캐시는 메모리와 디스크(토큰 폴더의 sheet_cache/)에 두므로 프로그램을 다시 실행해도 유지됩니다.
+- 짧은 시간(VERSION_CHECK_TTL초) 안에 같은 시트를 여러 번 읽으면 버전 확인도 한 번만 합니다.
+'''
+
+import os
+import copy
+import json
+import time
+import threading
+from auth import get_service, get_token_path
+from quota_scheduler import execute_request
+
+SHEET_CACHE_VERSION = 1  # 캐시 파일 형식이 바뀌면 올려서 기존 캐시를 무효화
+VERSION_CHECK_TTL = 2  # 이 시간(초) 안의 연속 읽기는 버전을 다시 확인하지 않음
+
+_CACHE = {}  # spreadsheet_id → {'version': ..., 'entries': {key: response}}
+_CHECKED = {}  # spreadsheet_id → (version, 확인한 시각)
+_LOCK = threading.RLock()
+
+def get_sheet_cache_path(spreadsheet_id):
+    """시트 캐시 파일 경로 반환 (토큰과 같은 폴더의 sheet_cache/ 아래)"""
+    token_dir = os.path.dirname(get_token_path())
+    return os.path.join(token_dir, "sheet_cache", f"{spreadsheet_id}.json")
+
+def get_file_version(drive_service, file_id):
+    """Drive 파일의 (version, modifiedTime) 반환 - 조회에 실패하면 (None, None)"""
+    try:
+        file = execute_request(drive_service.files().get(
+            fileId=file_id,
+            fields='version, modifiedTime',
+            supportsAllDrives=True
+        ))
+        return file.get('version'), file.get('modifiedTime')
+    except Exception as e:
+        print(f"시트 버전 확인 중 오류 발생: {str(e)}")
+        return None, None
+
+def current_version(spreadsheet_id, drive_service=None, max_age=VERSION_CHECK_TTL):
+    """스프레드시트의 현재 버전 (max_age초 안에 확인한 값이 있으면 재사용, 실패하면 None)"""
+    with _LOCK:
+        checked = _CHECKED.get(spreadsheet_id)
+        if checked and time.monotonic() - checked[1] < max_age:
+            return checked[0]
+    version, _ = get_file_version(drive_service or get_service('drive', 'v3'), spreadsheet_id)
+    with _LOCK:
+        if version is None:
+            _CHECKED.pop(spreadsheet_id, None)
+        else:
+            _CHECKED[spreadsheet_id] = (version, time.monotonic())
+    return version
+
+def _load(spreadsheet_id):
+    """메모리 → 디스크 순으로 캐시 항목 반환 (없으면 빈 항목)"""
+    entry = _CACHE.get(spreadsheet_id)
+    if entry is not None:
+        return entry
+    entry = {'version': None, 'entries': {}}
+    cache_path = get_sheet_cache_path(spreadsheet_id)
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('cache_version') == SHEET_CACHE_VERSION:
+                entry = {'version': cached['version'], 'entries': cached['entries']}
+        except (OSError, ValueError, KeyError) as e:
+            print(f"시트 캐시 로드 중 오류 발생: {e}")
+    _CACHE[spreadsheet_id] = entry
+    return entry
+
+def _save(spreadsheet_id, entry):
+    """캐시 항목을 파일에 저장 (임시 파일에 쓴 뒤 교체)"""
+    cache_path = get_sheet_cache_path(spreadsheet_id)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'cache_version': SHEET_CACHE_VERSION, 'saved_at': time.time(), **entry}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"시트 캐시 저장 중 오류 발생: {e}")
+
+def _cached_call(spreadsheet_id, key, fetch, drive_service):
+    """버전이 그대로면 저장된 응답, 아니면 fetch()로 새로 받아 저장"""
+    # 버전을 먼저 확인 - 받는 사이에 시트가 바뀌면 다음 읽기 때 버전이 달라 다시 받게 됨
+    version = current_version(spreadsheet_id, drive_service)
+    with _LOCK:
+        entry = _load(spreadsheet_id)
+        if version is not None and entry['version'] == version and key in entry['entries']:
+            # 호출한 쪽이 응답을 고쳐도 캐시가 바뀌지 않도록 복사본 반환
+            return copy.deepcopy(entry['entries'][key])
+
+    response = fetch()
+    if version is None:
+        return response  # 버전을 모르면 저장하지 않음
+
+    with _LOCK:
+        entry = _load(spreadsheet_id)
+        if entry['version'] != version:
+            entry = {'version': version, 'entries': {}}
+            _CACHE[spreadsheet_id] = entry
+        entry['entries'][key] = copy.deepcopy(response)
+        _save(spreadsheet_id, entry)
+    return response
+
+def get_values(service, spreadsheet_id, range_name, drive_service=None, **params):
+    """values.get 응답 반환 (시트가 바뀌지 않았으면 캐시 사용)"""
+    key = json.dumps(['values', range_name, params], ensure_ascii=False, sort_keys=True)
+    return _cached_call(spreadsheet_id, key, lambda: execute_request(service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id, range=range_name, **params)), drive_service)
+
+def batch_get_values(service, spreadsheet_id, ranges, drive_service=None, **params):
+    """values.batchGet 응답 반환 (시트가 바뀌지 않았으면 캐시 사용)"""
+    key = json.dumps(['batch', list(ranges), params], ensure_ascii=False, sort_keys=True)
+    return _cached_call(spreadsheet_id, key, lambda: execute_request(service.spreadsheets().values().batchGet(
+        spreadsheetId=spreadsheet_id, ranges=list(ranges), **params)), drive_service)
+
+def get_spreadsheet(service, spreadsheet_id, drive_service=None, **params):
+    """spreadsheets.get 응답(시트 목록 등 메타데이터) 반환 (시트가 바뀌지 않았으면 캐시 사용)"""
+    key = json.dumps(['spreadsheet', params], ensure_ascii=False, sort_keys=True)
+    return _cached_call(spreadsheet_id, key, lambda: execute_request(service.spreadsheets().get(
+        spreadsheetId=spreadsheet_id, **params)), drive_service)
+
+def cached_version(spreadsheet_id):
+    """캐시에 저장된 응답의 버전 (없으면 None)"""
+    with _LOCK:
+        return _load(spreadsheet_id)['version']
+
+def invalidate(spreadsheet_id=None):
+    """캐시 제거 (spreadsheet_id가 없으면 메모리 캐시 전체)"""
+    with _LOCK:
+        if spreadsheet_id is None:
+            _CACHE.clear()
+            _CHECKED.clear()
+            return
+        _CACHE.pop(spreadsheet_id, None)
+        _CHECKED.pop(spreadsheet_id, None)
+        try:
+            os.remove(get_sheet_cache_path(spreadsheet_id))
+        except OSError:
+            pass
@@ -0,0 +1,185 @@
+'''
+서식 있는 시트 쓰기 (spreadsheets.batchUpdate 한 번)
+- 값, 표시 형식(숫자/날짜), 배경색, 글꼴, 정렬, 셀 병합을 요청 목록에 모았다가
+  spreadsheets.batchUpdate 한 번으로 보냅니다.
+  · 값 + 서식: UpdateCellsRequest (셀마다 userEnteredValue / userEnteredFormat)
+  · 범위 전체에 같은 서식: RepeatCellRequest
+  · 병합: MergeCellsRequest
+- 현황판처럼 서식이 필요한 시트를 엑셀로 받아 꾸민 뒤 다시 올리지 않고, 서버에서 바로 꾸밀 수 있습니다.
+- 값만 쓰는 일반 기록은 지금처럼 sheet_writer(values.batchUpdate)를 사용합니다.
+
+### 사용 예
+batch = SheetFormatBatch(service, spreadsheet_id)
+batch.merge('현황', 'A2:J2')
+batch.write('현황', 'A2', [['샘플상품 블로그 체험단 (20명)']], background='4285F4', bold=True, font_color='FFFFFF',
+            font_size=20, horizontal='CENTER')
+batch.write('현황', 'A4', [headers], background='4285F4', bold=True, font_color='FFFFFF', horizontal='CENTER')
+batch.format('현황', 'E5:E', number_format='#,##0')
+batch.send()  # 요청 전체를 한 번에 전송
+'''
+
+import re
+import sheet_cache
+from quota_scheduler import execute_request
+from sheet_a1 import column_to_index
+
+_CELL_RE = re.compile(r'^([A-Za-z]*)(\d*)$')
+
+# 글꼴 / 정렬 인자 → userEnteredFormat 안의 위치
+TEXT_FORMAT_FIELDS = {'bold': 'bold', 'italic': 'italic', 'font_size': 'fontSize', 'font_family': 'fontFamily'}
+ALIGNMENT_FIELDS = {'horizontal': 'horizontalAlignment', 'vertical': 'verticalAlignment', 'wrap': 'wrapStrategy'}
+
+def hex_to_color(hex_color):
+    """'4285F4' / '#4285F4'를 Sheets Color({'red': 0.26, ...})로 변환"""
+    hex_color = hex_color.lstrip('#')
+    red, green, blue = (int(hex_color[i:i + 2], 16) / 255 for i in (0, 2, 4))
+    return {'red': red, 'green': green, 'blue': blue}
+
+def to_cell_value(value):
+    """파이썬 값을 userEnteredValue로 변환 ('='로 시작하는 문자열은 수식, None은 빈 값)"""
+    if value is None:
+        return {}
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, (int, float)):
+        return {'numberValue': value}
+    value = str(value)
+    if value.startswith('='):
+        return {'formulaValue': value}
+    return {'stringValue': value}
+
+def build_cell_format(number_format=None, background=None, font_color=None, **style):
+    """서식 인자를 (userEnteredFormat, fields 목록)으로 변환
+
+    number_format은 패턴 문자열('#,##0' → NUMBER, 'yyyy-mm-dd' → DATE)이나 NumberFormat dict,
+    background/font_color는 16진 색상, 나머지는 TEXT_FORMAT_FIELDS / ALIGNMENT_FIELDS의 인자.
+    """
+    cell_format = {}
+    fields = []
+    if number_format is not None:
+        if isinstance(number_format, str):
+            kind = 'DATE' if re.search(r'[yd]', number_format) else 'NUMBER'
+            number_format = {'type': kind, 'pattern': number_format}
+        cell_format['numberFormat'] = number_format
+        fields.append('userEnteredFormat.numberFormat')
+    if background is not None:
+        cell_format['backgroundColor'] = hex_to_color(background)
+        fields.append('userEnteredFormat.backgroundColor')
+
+    text_format = {}
+    if font_color is not None:
+        text_format['foregroundColor'] = hex_to_color(font_color)
+        fields.append('userEnteredFormat.textFormat.foregroundColor')
+    for name, field in TEXT_FORMAT_FIELDS.items():
+        if style.get(name) is not None:
+            text_format[field] = style[name]
+            fields.append(f'userEnteredFormat.textFormat.{field}')
+    if text_format:
+        cell_format['textFormat'] = text_format
+
+    for name, field in ALIGNMENT_FIELDS.items():
+        if style.get(name) is not None:
+            cell_format[field] = style[name]
+            fields.append(f'userEnteredFormat.{field}')
+
+    unknown = set(style) - set(TEXT_FORMAT_FIELDS) - set(ALIGNMENT_FIELDS)
+    if unknown:
+        raise ValueError(f"지원하지 않는 서식 인자: {', '.join(sorted(unknown))}")
+    return cell_format, fields
+
+class SheetFormatBatch:
+    """값 + 서식 요청을 모았다가 spreadsheets.batchUpdate 한 번으로 보내는 묶음
+
+    범위는 탭 이름과 A1 표기('A2:J2', 'E5:E', 'C3')로 받으며, 시트 ID는 sheet_cache의 메타데이터로 찾는다.
+    """
+
+    def __init__(self, service, spreadsheet_id, drive_service=None):
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.drive_service = drive_service
+        self.requests = []
+        self._sheet_ids = None
+
+    def __len__(self):
+        return len(self.requests)
+
+    def sheet_id(self, sheet):
+        """탭 이름의 sheetId"""
+        if self._sheet_ids is None:
+            spreadsheet = sheet_cache.get_spreadsheet(self.service, self.spreadsheet_id, self.drive_service)
+            self._sheet_ids = {item['properties']['title']: item['properties']['sheetId']
+                               for item in spreadsheet.get('sheets', [])}
+        if sheet not in self._sheet_ids:
+            raise ValueError(f"시트를 찾을 수 없습니다: {sheet}")
+        return self._sheet_ids[sheet]
+
+    def grid_range(self, sheet, cells):
+        """A1 범위를 GridRange로 변환 (0부터 시작, 끝은 미포함 - 'E5:E'처럼 끝 행이 없으면 시트 끝까지)"""
+        parts = cells.split(':')
+        start_col, start_row = _CELL_RE.match(parts[0]).groups()
+        end_col, end_row = _CELL_RE.match(parts[-1]).groups()
+        grid_range = {'sheetId': self.sheet_id(sheet)}
+        if start_row:
+            grid_range['startRowIndex'] = int(start_row) - 1
+        if end_row:
+            grid_range['endRowIndex'] = int(end_row)
+        if start_col:
+            grid_range['startColumnIndex'] = column_to_index(start_col)
+        if end_col:
+            grid_range['endColumnIndex'] = column_to_index(end_col) + 1
+        return grid_range
+
+    def write(self, sheet, cell, values, **style):
+        """cell(왼쪽 위 셀)부터 2차원 값 목록을 쓰고, 서식 인자가 있으면 같은 셀에 함께 적용 (UpdateCellsRequest)"""
+        cell_format, format_fields = build_cell_format(**style)
+        column, row = _CELL_RE.match(cell).groups()
+        rows = []
+        for row_values in values:
+            cells = []
+            for value in row_values:
+                cell_data = {'userEnteredValue': to_cell_value(value)}
+                if cell_format:
+                    cell_data['userEnteredFormat'] = cell_format
+                cells.append(cell_data)
+            rows.append({'values': cells})
+        self.requests.append({'updateCells': {
+            'start': {'sheetId': self.sheet_id(sheet), 'rowIndex': int(row) - 1, 'columnIndex': column_to_index(column)},
+            'rows': rows,
+            'fields': ','.join(['userEnteredValue'] + format_fields),
+        }})
+        return self
+
+    def format(self, sheet, cells, **style):
+        """범위 전체에 같은 서식 적용 - 값은 그대로 둠 (RepeatCellRequest)"""
+        cell_format, fields = build_cell_format(**style)
+        if not fields:
+            return self
+        self.requests.append({'repeatCell': {
+            'range': self.grid_range(sheet, cells),
+            'cell': {'userEnteredFormat': cell_format},
+            'fields': ','.join(fields),
+        }})
+        return self
+
+    def merge(self, sheet, cells, merge_type='MERGE_ALL'):
+        """셀 병합 (MergeCellsRequest)"""
+        self.requests.append({'mergeCells': {'range': self.grid_range(sheet, cells), 'mergeType': merge_type}})
+        return self
+
+    def unmerge(self, sheet, cells):
+        """범위 안의 병합 해제 (UnmergeCellsRequest)"""
+        self.requests.append({'unmergeCells': {'range': self.grid_range(sheet, cells)}})
+        return self
+
+    def send(self):
+        """모은 요청을 spreadsheets.batchUpdate 한 번으로 전송하고 응답 반환 (보낼 요청이 없으면 None)"""
+        if not self.requests:
+            return None
+        requests, self.requests = self.requests, []
+        try:
+            return execute_request(self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id, body={'requests': requests}))
+        except Exception as e:
+            print(f"서식 쓰기 중 오류 발생: {str(e)}")
+            self.requests = requests + self.requests  # 다음 send()에서 다시 보냄
+            raise
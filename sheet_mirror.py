@@ -0,0 +1,424 @@
+'''
+추적 시트 로컬 미러 (SQLite)
+- 블로그/인스타 추적 시트에서 추적기가 쓰는 열(A~M 중 일부)만 로컬 SQLite(토큰 폴더의 sheet_mirror.db)에 행 단위로 복사해 두고,
+  "아직 링크가 없는 행", "C열이 빈 행", "최근 N주 안의 게시물" 같은 조회를 API 호출 없이 처리합니다.
+- 동기화(sync)는 두 방향입니다.
+  · push: 로컬에서 바꾼 셀(dirty)을 공용 쓰기 큐(sheet_writer.SheetWriteQueue)에 넘김 - 기다리지 않음
+          (쓰기 전담 스레드가 values.batchUpdate로 보내고, 반영되면 dirty 표시를 지움)
+  · pull: Drive version이 바뀌었을 때만 시트를 구간 단위로 다시 읽어 행 단위로 반영
+          (보내지 않았거나 읽는 동안 바뀐 로컬 행은 유지)
+- 로컬 변경은 DB에 먼저 기록되므로, 보내기 전에 프로그램이 죽어도 다음 실행 때 다시 보냅니다.
+- 추적기/대시보드는 실행 중에 start_sync_jobs()로 SYNC_INTERVAL초마다 push + pull을 돌리고,
+  close_sheet_mirrors()에서 멈춥니다. (실행 도중 다른 사람이 시트에 적은 값도 반영)
+- 같은 DB 파일을 쓰는 미러(탭)들은 SQLite 연결 하나와 락 하나를 함께 씁니다.
+  (크롤링 작업자 여러 명이 동시에 써도 "database is locked"가 나지 않음, 다른 프로세스와는 WAL + busy_timeout)
+'''
+
+import os
+import re
+import time
+import atexit
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+import sheet_cache
+from auth import get_token_path
+from sheet_reader import iter_rows
+from sheet_a1 import column_to_index, index_to_column
+from sheet_writer import get_sheet_write_queue
+
+MIRROR_COLUMNS = [index_to_column(i) for i in range(13)]  # 미러 DB에 둘 수 있는 열 (A ~ M)
+PUSH_ROWS = 20  # 바뀐 행이 이만큼 모이면 바로 전송
+SYNC_INTERVAL = 60  # 동기화 작업(start_sync_job) 주기(초)
+BUSY_TIMEOUT_MS = 30000  # 다른 프로세스(대시보드와 추적기 동시 실행 등)가 DB를 쓰는 중이면 기다릴 시간
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS rows (
+    spreadsheet_id TEXT NOT NULL,
+    sheet TEXT NOT NULL,
+    row_number INTEGER NOT NULL,
+    {columns},
+    post_date TEXT,
+    PRIMARY KEY (spreadsheet_id, sheet, row_number)
+);
+CREATE INDEX IF NOT EXISTS rows_b ON rows (spreadsheet_id, sheet, b);
+CREATE INDEX IF NOT EXISTS rows_c ON rows (spreadsheet_id, sheet, c);
+CREATE INDEX IF NOT EXISTS rows_m ON rows (spreadsheet_id, sheet, m);
+CREATE INDEX IF NOT EXISTS rows_post_date ON rows (spreadsheet_id, sheet, post_date);
+CREATE TABLE IF NOT EXISTS dirty_cells (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    spreadsheet_id TEXT NOT NULL,
+    sheet TEXT NOT NULL,
+    row_number INTEGER NOT NULL,
+    column_name TEXT NOT NULL,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    spreadsheet_id TEXT NOT NULL,
+    sheet TEXT NOT NULL,
+    version TEXT,
+    pulled_at REAL,
+    pushed_at REAL,
+    PRIMARY KEY (spreadsheet_id, sheet)
+);
+'''.format(columns=',\n    '.join(f"{column.lower()} TEXT NOT NULL DEFAULT ''" for column in MIRROR_COLUMNS))
+
+def get_mirror_db_path():
+    """미러 DB 경로 (토큰과 같은 폴더)"""
+    return os.path.join(os.path.dirname(get_token_path()), "sheet_mirror.db")
+
+_CONNECTIONS = {}  # DB 경로 → [연결, 락, 사용 중인 미러 수]
+_CONNECTIONS_LOCK = threading.Lock()
+
+def _open_db(db_path):
+    """DB 파일별 공용 연결과 락 반환 (없으면 열고 스키마 생성)"""
+    with _CONNECTIONS_LOCK:
+        entry = _CONNECTIONS.get(db_path)
+        if entry is None:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            db = sqlite3.connect(db_path, check_same_thread=False, timeout=BUSY_TIMEOUT_MS / 1000)
+            db.row_factory = sqlite3.Row
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+            db.executescript(_SCHEMA)
+            entry = [db, threading.RLock(), 0]
+            _CONNECTIONS[db_path] = entry
+        entry[2] += 1
+        return entry[0], entry[1]
+
+def _close_db(db_path):
+    """공용 연결 반납 (마지막 미러가 닫으면 연결 종료)"""
+    with _CONNECTIONS_LOCK:
+        entry = _CONNECTIONS.get(db_path)
+        if entry is None:
+            return
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+        del _CONNECTIONS[db_path]
+    with entry[1]:
+        entry[0].close()
+
+def normalize_columns(columns, date_column=None):
+    """열 목록을 대문자로 바꾸고 시트 순서로 정렬 (date_column도 포함, 미러 DB에 없는 열이면 ValueError)"""
+    columns = {column.upper() for column in columns}
+    if date_column:
+        columns.add(date_column.upper())
+    unknown = columns - set(MIRROR_COLUMNS)
+    if unknown:
+        raise ValueError(f"미러할 수 없는 열입니다 (A~M만 가능): {', '.join(sorted(unknown))}")
+    return sorted(columns, key=column_to_index)
+
+def parse_post_date(value):
+    """'2025. 5. 19.' / '2025-05-19' 형식의 날짜를 'YYYY-MM-DD'로 변환 (날짜가 아니면 None)"""
+    match = re.match(r'\s*(\d{4})[.\-/]\s*(\d{1,2})[.\-/]\s*(\d{1,2})', value or '')
+    if not match:
+        return None
+    year, month, day = (int(part) for part in match.groups())
+    try:
+        return datetime(year, month, day).strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+class SheetMirror:
+    """시트 하나(탭 하나)의 로컬 SQLite 미러
+
+    사용 예:
+        mirror = SheetMirror(service, spreadsheet_id, '시트1', columns=['B', 'C', 'F', 'I'], date_column='I')
+        mirror.pull()
+        for row in mirror.pending_rows('B', 'C'):
+            ...
+        mirror.set_cell(row['row_number'], 'C', link)
+        mirror.push()
+    """
+
+    def __init__(self, service, spreadsheet_id, sheet, columns=None, date_column=None, db_path=None):
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.sheet = sheet
+        self.date_column = date_column  # post_date(게시일 색인)로 쓸 열
+        self.columns = normalize_columns(columns or MIRROR_COLUMNS, date_column)  # 시트에서 읽어 올 열
+        self.db_path = db_path or get_mirror_db_path()
+        self.pull_count = 0  # 실제로 시트를 다시 읽은 횟수
+        self.push_count = 0  # 시트에 반영된 push 횟수
+        self._queued_seq = 0  # 쓰기 큐에 넘긴 마지막 dirty 번호 (같은 셀을 두 번 넘기지 않음)
+        self._sync_timer = None
+        self._pull_lock = threading.Lock()
+        self._written_rows = None  # pull()이 시트를 읽는 동안 set_cell()로 쓴 행 번호
+        # 같은 DB의 다른 미러와 연결/락을 함께 씀 (락은 이 미러의 상태도 보호)
+        self._db, self._lock = _open_db(self.db_path)
+        if self.dirty_count():
+            print(f"이전 실행에서 시트에 보내지 못한 셀 {self.dirty_count()}개를 다시 보냅니다.")
+            self.push()
+
+    def close(self):
+        """동기화 작업을 멈추고 남은 변경을 시트에 반영한 뒤 DB 닫기"""
+        self.stop_sync_job()
+        self.push()
+        get_sheet_write_queue(self.service).flush()  # 반영 완료 처리(_mark_pushed)까지 기다림
+        _close_db(self.db_path)
+
+    # ----- 동기화 -----
+
+    def _key(self):
+        return (self.spreadsheet_id, self.sheet)
+
+    def _state(self):
+        return self._db.execute(
+            'SELECT * FROM sync_state WHERE spreadsheet_id = ? AND sheet = ?', self._key()).fetchone()
+
+    def _set_state(self, **fields):
+        state = dict(self._state() or {'version': None, 'pulled_at': None, 'pushed_at': None})
+        state.update(fields)
+        self._db.execute(
+            'INSERT OR REPLACE INTO sync_state (spreadsheet_id, sheet, version, pulled_at, pushed_at) '
+            'VALUES (?, ?, ?, ?, ?)', self._key() + (state['version'], state['pulled_at'], state['pushed_at']))
+
+    def _current_version(self):
+        """시트의 Drive version에 미러하는 열 목록을 붙인 값 (열이 바뀌어도 다시 읽도록)"""
+        version = sheet_cache.current_version(self.spreadsheet_id, max_age=0)
+        return None if version is None else f"{version}:{''.join(self.columns)}"
+
+    def pull(self, force=False):
+        """시트가 바뀌었을 때만 다시 읽어 미러에 반영. 다시 읽었으면 True
+
+        버전 확인과 시트 읽기는 락 밖에서 하므로, 읽는 동안에도 다른 작업자의 set_cell()은 기다리지 않는다.
+        대신 읽기 시작할 때 보내지 않은 변경이 있던 행과 읽는 동안 새로 쓴 행은 읽은 값이 우리 쓰기보다
+        오래됐을 수 있으므로 로컬 값을 그대로 두고, 나머지 행만 시트 값으로 바꾼다.
+        """
+        with self._pull_lock:  # 다시 읽기는 한 번에 하나씩
+            version = self._current_version()
+            with self._lock:
+                state = self._state()
+                if not force and version is not None and state is not None and state['version'] == version:
+                    return False
+                keep = {cell['row_number'] for cell in self._dirty_cells()}
+                push_count = self.push_count
+                self._written_rows = set()
+
+            try:
+                rows = [(row_number, row) for row_number, row in enumerate(
+                    iter_rows(self.service, self.spreadsheet_id, self.sheet, self.columns), start=1) if any(row)]
+            except Exception:
+                with self._lock:
+                    self._written_rows = None
+                raise
+
+            with self._lock:
+                keep |= self._written_rows
+                keep |= {cell['row_number'] for cell in self._dirty_cells()}
+                self._written_rows = None
+                with self._db:
+                    read = {row_number for row_number, _ in rows}
+                    for (row_number,) in self._db.execute(
+                            'SELECT row_number FROM rows WHERE spreadsheet_id = ? AND sheet = ?', self._key()).fetchall():
+                        if row_number not in read and row_number not in keep:
+                            self._db.execute('DELETE FROM rows WHERE spreadsheet_id = ? AND sheet = ? AND row_number = ?',
+                                             self._key() + (row_number,))
+                    for row_number, row in rows:
+                        if row_number not in keep:
+                            self._upsert(row_number, row)
+                    fields = {'pulled_at': time.time()}
+                    if self.push_count == push_count:
+                        # 읽는 동안 반영된 push가 있으면 _mark_pushed()가 기록한 더 새 버전을 유지
+                        fields['version'] = version
+                    self._set_state(**fields)
+                self.pull_count += 1
+                return True
+
+    def push(self):
+        """아직 넘기지 않은 로컬 변경을 쓰기 큐에 넘김 (시트 응답을 기다리지 않음). 넘긴 셀 수 반환
+
+        전송이 실패해도 쓰기 큐가 다시 보내고, 반영되기 전에 프로그램이 죽으면 셀이 dirty로 남아
+        다음 실행 때 다시 보낸다.
+        """
+        with self._lock:
+            cells = [cell for cell in self._dirty_cells() if cell['seq'] > self._queued_seq]
+            if not cells:
+                return 0
+            upto = cells[-1]['seq']
+            self._queued_seq = upto
+        get_sheet_write_queue(self.service).put_cells(
+            self.spreadsheet_id,
+            [(self.sheet, cell['row_number'], cell['column_name'], cell['value']) for cell in cells],
+            on_sent=lambda: self._mark_pushed(upto), journal=False)  # 복구는 dirty_cells로 (저널은 하나만)
+        return len(cells)
+
+    def _mark_pushed(self, upto):
+        """쓰기 큐가 시트에 반영한 뒤 호출 (전담 스레드) - dirty 표시를 지우고 우리 쓰기로 바뀐 버전을 받아들임"""
+        version = self._current_version()
+        with self._lock:
+            with self._db:
+                self._db.execute('DELETE FROM dirty_cells WHERE spreadsheet_id = ? AND sheet = ? AND seq <= ?',
+                                 self._key() + (upto,))
+                fields = {'pushed_at': time.time()}
+                if version is not None:
+                    # 우리가 쓴 변경으로 바뀐 버전은 다시 읽지 않음
+                    fields['version'] = version
+                self._set_state(**fields)
+            self.push_count += 1
+
+    def sync(self):
+        """보내지 않은 변경을 보낸 뒤 시트 변경을 받아옴"""
+        self.push()
+        return self.pull()
+
+    def start_sync_job(self, interval=SYNC_INTERVAL):
+        """interval초마다 sync()를 실행하는 백그라운드 작업 시작 (이미 돌고 있으면 그대로 둠)"""
+        with self._lock:
+            if self._sync_timer is None:
+                self._schedule_sync(interval)
+
+    def _schedule_sync(self, interval):
+        def run():
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"시트 미러 동기화 중 오류 발생: {str(e)}")
+            with self._lock:
+                if self._sync_timer is not None:  # 그 사이 stop_sync_job()이 불리지 않았으면 다음 예약
+                    self._schedule_sync(interval)
+
+        self._sync_timer = threading.Timer(interval, run)
+        self._sync_timer.daemon = True
+        self._sync_timer.start()
+
+    def stop_sync_job(self):
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+
+    # ----- 로컬 쓰기 -----
+
+    def set_cell(self, row_number, column, value):
+        """셀 값 변경 (로컬에 바로 반영하고 시트에는 push 때 전송)"""
+        with self._lock:
+            with self._db:
+                self._db.execute(
+                    'INSERT INTO dirty_cells (spreadsheet_id, sheet, row_number, column_name, value) '
+                    'VALUES (?, ?, ?, ?, ?)', self._key() + (row_number, column.upper(), value))
+                self._apply(row_number, column.upper(), value)
+            if self._written_rows is not None:
+                self._written_rows.add(row_number)
+            dirty_rows = self._db.execute(
+                'SELECT COUNT(DISTINCT row_number) FROM dirty_cells WHERE spreadsheet_id = ? AND sheet = ? '
+                'AND seq > ?', self._key() + (self._queued_seq,)).fetchone()[0]
+            if dirty_rows >= PUSH_ROWS:
+                self.push()
+
+    def dirty_count(self):
+        """보내지 않은 셀 수"""
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM dirty_cells WHERE spreadsheet_id = ? AND sheet = ?',
+                                    self._key()).fetchone()[0]
+
+    def _dirty_cells(self):
+        return self._db.execute(
+            'SELECT * FROM dirty_cells WHERE spreadsheet_id = ? AND sheet = ? ORDER BY seq', self._key()).fetchall()
+
+    def _post_date(self, row):
+        if not self.date_column:
+            return None
+        return parse_post_date(row[self.columns.index(self.date_column.upper())])
+
+    def _upsert(self, row_number, row):
+        """행 하나를 로컬에 기록 (row는 self.columns 순서의 값 목록)"""
+        names = ', '.join(column.lower() for column in self.columns)
+        marks = ', '.join('?' for _ in self.columns)
+        self._db.execute(
+            f'INSERT OR REPLACE INTO rows (spreadsheet_id, sheet, row_number, {names}, post_date) '
+            f'VALUES (?, ?, ?, {marks}, ?)', self._key() + (row_number, *row, self._post_date(row)))
+
+    def _apply(self, row_number, column, value):
+        """행 하나의 셀 하나를 로컬에 반영 (미러하지 않는 열은 시트에만 씀)"""
+        if column not in self.columns:
+            return
+        current = self._db.execute(
+            'SELECT * FROM rows WHERE spreadsheet_id = ? AND sheet = ? AND row_number = ?',
+            self._key() + (row_number,)).fetchone()
+        row = [current[c.lower()] for c in self.columns] if current else [''] * len(self.columns)
+        row[self.columns.index(column)] = '' if value is None else str(value)
+        self._upsert(row_number, row)
+
+    def add_columns(self, columns):
+        """미러할 열 추가 (새 열이 있으면 버전 값이 달라지므로 다음 pull()에서 시트를 다시 읽음)"""
+        with self._lock:
+            self.columns = normalize_columns(list(self.columns) + list(columns))
+
+    # ----- 조회 -----
+
+    def _select(self, where='', params=()):
+        with self._lock:
+            return self._db.execute(
+                f'SELECT * FROM rows WHERE spreadsheet_id = ? AND sheet = ? {where} ORDER BY row_number',
+                self._key() + tuple(params)).fetchall()
+
+    def row(self, row_number):
+        """행 하나 (없으면 None) - row['b']처럼 소문자 열 이름으로 접근"""
+        rows = self._select('AND row_number = ?', (row_number,))
+        return rows[0] if rows else None
+
+    def pending_rows(self, url_column='B', result_column='C', first_row=2):
+        """URL은 있는데 결과 열이 빈 행 (크롤링 대상)"""
+        url, result = url_column.lower(), result_column.lower()
+        return self._select(f"AND row_number >= ? AND {url} != '' AND TRIM({result}) = ''", (first_row,))
+
+    def rows_without(self, column, first_row=2):
+        """column 열이 빈 행"""
+        return self._select(f"AND row_number >= ? AND TRIM({column.lower()}) = ''", (first_row,))
+
+    def rows_with(self, column, first_row=2):
+        """column 열이 채워진 행"""
+        return self._select(f"AND row_number >= ? AND TRIM({column.lower()}) != ''", (first_row,))
+
+    def rows_matching(self, column, value, first_row=2):
+        """column 열 값이 value인 행"""
+        return self._select(f"AND row_number >= ? AND {column.lower()} = ?", (first_row, value))
+
+    def posts_within(self, weeks):
+        """date_column의 게시일이 최근 weeks주 안인 행"""
+        since = (datetime.now() - timedelta(weeks=weeks)).strftime('%Y-%m-%d')
+        return self._select('AND post_date >= ?', (since,))
+
+_MIRRORS = {}
+_MIRRORS_LOCK = threading.Lock()
+_SYNC_JOB_INTERVAL = None  # start_sync_jobs()로 켜면 공용 미러마다 동기화 작업을 돌림
+
+def get_sheet_mirror(service, spreadsheet_id, sheet, columns=None, date_column=None):
+    """시트(탭)별 공용 미러 반환 (없으면 생성). columns는 호출하는 쪽이 읽고 쓰는 열 (없으면 A~M 전부)
+
+    이미 있는 미러에 없는 열을 요청하면 열을 더하고 다음 pull()에서 다시 읽는다.
+    """
+    with _MIRRORS_LOCK:
+        mirror = _MIRRORS.get((spreadsheet_id, sheet))
+        if mirror is not None:
+            mirror.add_columns(columns or MIRROR_COLUMNS)
+        else:
+            mirror = SheetMirror(service, spreadsheet_id, sheet, columns, date_column)
+            _MIRRORS[(spreadsheet_id, sheet)] = mirror
+            if _SYNC_JOB_INTERVAL is not None:
+                mirror.start_sync_job(_SYNC_JOB_INTERVAL)
+        return mirror
+
+def start_sync_jobs(interval=SYNC_INTERVAL):
+    """지금 있는 공용 미러와 앞으로 만들 미러 모두 interval초마다 동기화 (close_sheet_mirrors()에서 멈춤)"""
+    global _SYNC_JOB_INTERVAL
+    with _MIRRORS_LOCK:
+        _SYNC_JOB_INTERVAL = interval
+        mirrors = list(_MIRRORS.values())
+    for mirror in mirrors:
+        mirror.start_sync_job(interval)
+
+def close_sheet_mirrors():
+    """동기화 작업을 멈추고 모든 공용 미러의 남은 변경 전송 (실행 종료 시 close_sheet_writers()보다 먼저 호출)"""
+    global _SYNC_JOB_INTERVAL
+    with _MIRRORS_LOCK:
+        mirrors = list(_MIRRORS.values())
+        _MIRRORS.clear()
+        _SYNC_JOB_INTERVAL = None
+    for mirror in mirrors:
+        mirror.close()
+
+# sheet_writer보다 나중에 등록되므로 종료 시 먼저 실행됨 (미러 변경 → 쓰기 버퍼 → 시트)
+atexit.register(close_sheet_mirrors)
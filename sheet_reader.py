@@ -0,0 +1,134 @@
+'''
+시트 열 단위 읽기
+- 호출하는 쪽이 실제로 쓰는 열과 행 구간만 values.batchGet 한 번으로 가져옵니다.
+  (예: B, C, F열만 필요하면 'B:C', 'F:F' 두 범위만 요청 → 넓은 시트에서 받는 양과 파싱 비용이 줄어듦)
+- 이어지는 열은 범위 하나로 묶고, 결과는 요청한 열 순서대로 맞춘 행 목록으로 돌려줍니다.
+- sheet_cache를 거치므로 시트가 바뀌지 않았으면 다시 받지 않습니다.
+- 아주 큰 시트(폼 응답 등)는 iter_rows()로 WINDOW_ROWS행씩 나눠 읽으며 한 행씩 처리합니다.
+'''
+
+import sheet_cache
+from quota_scheduler import execute_request
+from sheet_a1 import column_to_index, index_to_column
+from sheet_writer import quote_sheet_name
+
+WINDOW_ROWS = 2000  # iter_rows가 한 번에 읽는 행 수
+
+def number_runs(numbers):
+    """번호 목록을 이어지는 구간 [(시작, 끝), ...]으로 묶음 ([2, 3, 4, 7] → [(2, 4), (7, 7)], 중복은 하나로)"""
+    runs = []
+    for number in sorted(set(numbers)):
+        if runs and runs[-1][1] + 1 == number:
+            runs[-1] = (runs[-1][0], number)
+        else:
+            runs.append((number, number))
+    return runs
+
+def column_runs(columns):
+    """열 문자 목록을 이어지는 구간 [(시작 번호, 끝 번호), ...]으로 묶음 (['B', 'C', 'F'] → [(1, 2), (5, 5)])"""
+    return number_runs(column_to_index(column) for column in columns)
+
+def build_ranges(sheet, columns, first_row=1, last_row=None):
+    """batchGet에 넘길 A1 범위 목록 (last_row가 없으면 시트 끝까지)"""
+    end = '' if last_row is None else str(last_row)
+    return [
+        f"{quote_sheet_name(sheet)}!{index_to_column(start)}{first_row}:{index_to_column(stop)}{end}"
+        for start, stop in column_runs(columns)
+    ]
+
+def project_rows(value_ranges, columns):
+    """batchGet 결과(valueRanges)를 columns 순서의 행 목록으로 변환 (값이 없는 셀은 빈 문자열)"""
+    runs = column_runs(columns)
+    blocks = [value_range.get('values', []) for value_range in value_ranges]
+    blocks += [[]] * (len(runs) - len(blocks))
+
+    # 열마다 (몇 번째 범위, 범위 안에서의 위치)
+    positions = []
+    for column in columns:
+        index = column_to_index(column)
+        for run_number, (start, stop) in enumerate(runs):
+            if start <= index <= stop:
+                positions.append((run_number, index - start))
+                break
+
+    row_count = max((len(block) for block in blocks), default=0)
+    rows = []
+    for row_offset in range(row_count):
+        row = []
+        for run_number, offset in positions:
+            block = blocks[run_number]
+            cells = block[row_offset] if row_offset < len(block) else []
+            row.append(cells[offset] if offset < len(cells) else '')
+        rows.append(row)
+    return rows
+
+def read_columns(service, spreadsheet_id, sheet, columns, first_row=1, last_row=None, drive_service=None):
+    """지정한 열만 읽어 행 목록 반환
+
+    rows[0]이 first_row행이고, 각 행은 columns 순서대로 값을 담는다. 값이 없는 셀은 빈 문자열로 채운다.
+    예: read_columns(service, id, '시트1', ['B', 'C', 'F'], first_row=2) → [[B2, C2, F2], [B3, C3, F3], ...]
+    """
+    result = sheet_cache.batch_get_values(
+        service, spreadsheet_id, build_ranges(sheet, columns, first_row, last_row), drive_service)
+    return project_rows(result.get('valueRanges', []), columns)
+
+def read_tabs(service, spreadsheet_id, sheets, columns, first_row=1, drive_service=None):
+    """여러 탭에서 같은 열을 values.batchGet 한 번으로 읽어 {탭 이름: 행 목록} 반환 (행 형식은 read_columns와 같음)"""
+    sheets = list(sheets)
+    ranges = [build_ranges(sheet, columns, first_row) for sheet in sheets]
+    result = sheet_cache.batch_get_values(
+        service, spreadsheet_id, [a1 for sheet_ranges in ranges for a1 in sheet_ranges], drive_service)
+    value_ranges = result.get('valueRanges', [])
+    tabs = {}
+    offset = 0
+    for sheet, sheet_ranges in zip(sheets, ranges):
+        tabs[sheet] = project_rows(value_ranges[offset:offset + len(sheet_ranges)], columns)
+        offset += len(sheet_ranges)
+    return tabs
+
+def get_row_count(service, spreadsheet_id, sheet, drive_service=None):
+    """시트의 행 수 (gridProperties.rowCount, 시트가 없으면 0)"""
+    spreadsheet = sheet_cache.get_spreadsheet(service, spreadsheet_id, drive_service)
+    for item in spreadsheet.get('sheets', []):
+        properties = item.get('properties', {})
+        if properties.get('title') == sheet:
+            return properties.get('gridProperties', {}).get('rowCount', 0)
+    return 0
+
+def iter_rows(service, spreadsheet_id, sheet, columns=None, first_row=1, window_rows=WINDOW_ROWS, drive_service=None):
+    """시트를 window_rows행씩 나눠 읽으며 행을 하나씩 내보내는 생성기
+
+    columns를 주면 그 열만 (read_columns와 같은 형식), 없으면 행 전체를 values.get과 같은 형식으로 내보낸다.
+    한 번에 메모리에 있는 것은 구간 하나뿐이라 수만 행짜리 응답 시트도 일정한 메모리로 처리할 수 있다.
+    (구간 데이터는 크기 때문에 sheet_cache에 저장하지 않음. 중간의 빈 행은 그대로, 끝의 빈 행은 내보내지 않음)
+    """
+    row_count = get_row_count(service, spreadsheet_id, sheet, drive_service)
+    blank_rows = 0  # 아직 내보내지 않은 빈 행 수 (뒤에 데이터가 있을 때만 내보냄)
+    blank_row = [''] * len(columns) if columns else []
+    for start in range(first_row, row_count + 1, window_rows):
+        end = min(start + window_rows - 1, row_count)
+        if columns:
+            ranges = build_ranges(sheet, columns, start, end)
+        else:
+            ranges = [f"{quote_sheet_name(sheet)}!{start}:{end}"]
+        result = execute_request(service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id, ranges=ranges))
+        value_ranges = result.get('valueRanges', [])
+        if columns:
+            rows = project_rows(value_ranges, columns)
+        else:
+            rows = value_ranges[0].get('values', []) if value_ranges else []
+
+        for row in rows:
+            if not any(row):
+                blank_rows += 1
+                continue
+            for _ in range(blank_rows):
+                yield list(blank_row)
+            blank_rows = 0
+            yield row
+        blank_rows += (end - start + 1) - len(rows)
+
+def count_rows(service, spreadsheet_id, sheet, column='A', first_row=1, window_rows=WINDOW_ROWS, drive_service=None):
+    """column 열 기준으로 first_row행부터 마지막 데이터 행까지의 행 수 (구간 단위로 읽어서 셈)"""
+    return sum(1 for _ in iter_rows(service, spreadsheet_id, sheet, [column], first_row, window_rows, drive_service))
@@ -0,0 +1,81 @@
+'''
+추적 시트 행 모델
+- 시트에서 읽은 행(list[list[str]], 행마다 길이가 제각각)을 열 이름이 정해진 SheetRow로 바꿔 둡니다.
+- URL 정규화와 blogId / username 추출은 행을 만들 때 한 번만 하므로,
+  블로그/인스타 추적기는 row.key, row.crawl_url을 그대로 쓰면 되고 len(row) 검사나 URL 파싱을 반복하지 않습니다.
+- __slots__를 써서 행마다 dict를 만들지 않으므로 캠페인이 커도 메모리를 적게 씁니다.
+'''
+
+from sheet_a1 import column_to_index
+
+BLOG = 'blog'
+INSTA = 'insta'
+
+def normalize_blog_url(url):
+    """모바일 블로그 URL을 PC URL로 변환 (m.blog.naver.com/...?tab=1 → blog.naver.com/...)"""
+    if url.startswith("https://m.blog.naver.com/"):
+        url = url.replace("https://m.blog.naver.com/", "https://blog.naver.com/")
+        # URL에서 ?tab=1 같은 파라미터 제거
+        url = url.split('?')[0]
+    return url
+
+def blog_post_list_url(blog_id):
+    """blogId의 글 목록 URL"""
+    return f"https://blog.naver.com/PostList.naver?blogId={blog_id}&skinType=&skinId=&from=menu"
+
+def extract_username(url):
+    """인스타그램 URL에서 username 추출"""
+    return url.split('instagram.com/')[-1].split('?')[0].split('/')[0]
+
+def parse_account(url):
+    """URL을 (종류, key, 크롤링 URL)로 변환 - 블로그는 blogId, 인스타는 username이 key (둘 다 아니면 (None, None, None))"""
+    url = normalize_blog_url(url.strip())
+    if url.startswith("https://blog.naver.com/"):
+        blog_id = url.split('/')[3]
+        if blog_id:
+            return BLOG, blog_id, blog_post_list_url(blog_id)
+    elif 'instagram.com' in url.lower():
+        return INSTA, extract_username(url), url
+    return None, None, None
+
+class SheetRow:
+    """추적 시트의 행 하나 (URL / 결과 / 이름 열과, URL에서 뽑은 계정 정보)"""
+
+    __slots__ = ('sheet', 'row_number', 'url', 'result', 'name', 'kind', 'key', 'crawl_url')
+
+    def __init__(self, row_number, url='', result='', name='', sheet=None):
+        self.sheet = sheet  # 탭 이름
+        self.row_number = row_number  # 시트의 1부터 시작하는 행 번호
+        self.url = url or ''
+        self.result = result or ''
+        self.name = name or ''
+        self.kind, self.key, self.crawl_url = parse_account(self.url) if self.url else (None, None, None)
+
+    @property
+    def done(self):
+        """결과 열이 이미 채워져 있는지"""
+        return bool(self.result.strip())
+
+    def __repr__(self):
+        return f"SheetRow({self.sheet!r}, {self.row_number}, {self.kind}:{self.key})"
+
+def rows_from_values(values, url_column, result_column, name_column, first_row=1, sheet=None, kind=None):
+    """values.get 형식의 행 목록을 SheetRow 목록으로 변환
+
+    values[0]이 first_row행이며, 빈 URL 행과 (kind를 주면) 다른 종류의 URL 행은 건너뛴다.
+    """
+    indexes = [column_to_index(column) for column in (url_column, result_column, name_column)]
+    return rows_from_columns(
+        ([row[index] if index < len(row) else '' for index in indexes] for row in values),
+        first_row, sheet, kind)
+
+def rows_from_columns(rows, first_row=1, sheet=None, kind=None):
+    """sheet_reader.read_columns(..., [URL 열, 결과 열, 이름 열]) 결과를 SheetRow 목록으로 변환"""
+    result = []
+    for row_number, (url, status, name) in enumerate(rows, start=first_row):
+        if not url:
+            continue
+        row = SheetRow(row_number, url, status, name, sheet)
+        if kind is None or row.kind == kind:
+            result.append(row)
+    return result
@@ -0,0 +1,456 @@
+'''
+시트 쓰기 모으기 (write-behind)
+- 크롤링 중에 나오는 셀 쓰기(행, 열, 값)를 바로 보내지 않고 모아 두었다가
+  values.batchUpdate 한 번으로 보냅니다. (블로거 200명이면 쓰기 400회 → 몇 회)
+- 보내는 시점: 모인 행 수가 flush_rows 이상 / 첫 쓰기 후 flush_interval초 경과 / 실행 종료(close)
+- 모든 쓰기는 먼저 로컬 저널(logs/sheet_journal_<시트ID>.jsonl)에 한 줄씩 추가하므로,
+  도중에 프로그램이 죽어도 다음 실행 때 보내지 못한 셀을 다시 보냅니다.
+  (sheet_mirror처럼 보내지 못한 셀을 직접 보관하는 쪽의 쓰기는 저널에 남기지 않음 - 두 번 보내지 않도록)
+- 여러 크롤링 작업자가 동시에 쓸 때는 SheetWriteQueue(쓰기 전담 스레드 하나)에 넣기만 하면 되고,
+  작업자는 Sheets 응답을 기다리지 않습니다. 같은 행의 쓰기는 합쳐서 행 순서대로 보내고 실패하면 다시 보냅니다.
+'''
+
+import os
+import json
+import time
+import queue
+import atexit
+import threading
+from googleapiclient.errors import HttpError
+from quota_scheduler import execute_request, RETRY_STATUSES
+from sheet_a1 import column_to_index, index_to_column
+
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
+FLUSH_ROWS = 20  # 이 행 수만큼 모이면 전송
+FLUSH_INTERVAL = 30  # 첫 쓰기 후 이 시간(초)이 지나면 전송
+RETRY_DELAYS = [5, 15, 60, 120]  # 쓰기 큐의 전송 실패 후 재시도 간격(초) - 마지막 값 반복
+
+def get_journal_path(spreadsheet_id):
+    """스프레드시트별 저널 파일 경로"""
+    return os.path.join(JOURNAL_DIR, f"sheet_journal_{spreadsheet_id}.jsonl")
+
+def quote_sheet_name(sheet):
+    """A1 범위에 쓸 시트 이름 ('시트1' → "'시트1'")"""
+    return "'" + sheet.replace("'", "''") + "'"
+
+def split_cell_range(a1):
+    """셀 하나의 A1 범위를 (시트, 행, 열)로 분리 ("'시트1'!M5" → ('시트1', 5, 'M'))"""
+    sheet, cell = a1.rsplit('!', 1)
+    if sheet.startswith("'") and sheet.endswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    column = cell.rstrip('0123456789')
+    return sheet, int(cell[len(column):]), column.upper()
+
+def build_update_data(cells):
+    """{(시트, 행, 열): 값}을 values.batchUpdate의 data로 변환
+
+    시트/행 순서로 정렬하고, 같은 행에서 이어지는 열(C, D, E)은 범위 하나로 합친다.
+    """
+    data = []
+    for (sheet, row, column), value in sorted(cells.items(), key=lambda item: (
+            item[0][0], item[0][1], column_to_index(item[0][2]))):
+        index = column_to_index(column)
+        last = data[-1] if data else None
+        if last and last['_key'] == (sheet, row) and last['_end'] + 1 == index:
+            last['values'][0].append(value)
+            last['_end'] = index
+            last['range'] = f"{quote_sheet_name(sheet)}!{index_to_column(last['_start'])}{row}:{column}{row}"
+        else:
+            data.append({'range': f"{quote_sheet_name(sheet)}!{column}{row}", 'values': [[value]],
+                         '_key': (sheet, row), '_start': index, '_end': index})
+    return [{'range': item['range'], 'values': item['values']} for item in data]
+
+class BufferedSheetWriter:
+    """셀 쓰기를 모았다가 values.batchUpdate 한 번으로 보내는 쓰기 버퍼
+
+    사용 예:
+        writer = BufferedSheetWriter(service, spreadsheet_id)
+        writer.set_cell('시트1', 5, 'C', link)
+        writer.set_cell('시트1', 5, 'I', date)
+        writer.close()  # 남은 셀 전송
+    """
+
+    def __init__(self, service, spreadsheet_id, flush_rows=FLUSH_ROWS, flush_interval=FLUSH_INTERVAL,
+                 value_input_option='RAW', journal_path=None):
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.value_input_option = value_input_option
+        self.journal_path = journal_path or get_journal_path(spreadsheet_id)
+        self.flush_count = 0  # 실제로 보낸 batchUpdate 횟수
+        self.flushed_seq = 0  # 시트에 반영된 마지막 쓰기 번호
+        self._pending = {}  # (sheet, row, column) → value (같은 셀은 마지막 값만)
+        self._seq = 0
+        self._first_pending = None
+        self._timer = None
+        self._lock = threading.RLock()  # 대기열/저널 (전송 중에는 잡지 않음)
+        self._send_lock = threading.Lock()
+        self._recover()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return len(self._pending)
+
+    # ----- 저널 -----
+
+    def _recover(self):
+        """이전 실행에서 보내지 못한 셀을 저널에서 읽어 대기열에 넣음"""
+        if not os.path.exists(self.journal_path):
+            return
+        cells = {}
+        flushed_upto = 0
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # 기록 도중 종료된 마지막 줄
+                self._seq = max(self._seq, entry.get('seq', 0))
+                if entry['op'] == 'set':
+                    cells[(entry['sheet'], entry['row'], entry['column'])] = (entry['seq'], entry['value'])
+                elif entry['op'] == 'flushed':
+                    flushed_upto = max(flushed_upto, entry['seq'])
+        pending = {key: value for key, (seq, value) in cells.items() if seq > flushed_upto}
+        if pending:
+            print(f"이전 실행에서 시트에 쓰지 못한 셀 {len(pending)}개를 다시 보냅니다.")
+            self._pending.update(pending)
+            self._first_pending = time.monotonic()
+            self.flush()
+        else:
+            self._remove_journal()
+
+    def _append_journal(self, entry):
+        os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _remove_journal(self):
+        try:
+            os.remove(self.journal_path)
+        except OSError:
+            pass
+
+    # ----- 쓰기 -----
+
+    def set_cell(self, sheet, row, column, value, journal=True):
+        """셀 하나 쓰기 예약 (row는 1부터 시작하는 행 번호, column은 'C' 같은 열 문자)
+
+        journal=False면 저널에 남기지 않는다. (sheet_mirror처럼 호출하는 쪽이 보내지 못한 셀을 따로 보관할 때)
+        """
+        with self._lock:
+            self._seq += 1
+            if journal:
+                self._append_journal({'op': 'set', 'seq': self._seq, 'sheet': sheet, 'row': row,
+                                      'column': column, 'value': value, 'ts': round(time.time(), 3)})
+            self._pending[(sheet, row, column)] = value
+            if self._first_pending is None:
+                self._first_pending = time.monotonic()
+                self._start_timer()
+
+            due = (self.flush_rows is not None and self.pending_rows() >= self.flush_rows) or (
+                self.flush_interval is not None and time.monotonic() - self._first_pending >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def pending_rows(self):
+        """보내지 않은 셀이 있는 행 수"""
+        with self._lock:
+            return len({(sheet, row) for sheet, row, _ in self._pending})
+
+    @property
+    def seq(self):
+        """마지막으로 예약된 쓰기 번호 (flushed_seq와 비교해 전송 여부 확인)"""
+        return self._seq
+
+    def _start_timer(self):
+        """쓰기가 뜸해도 flush_interval 뒤에는 전송되도록 타이머 설정"""
+        self._cancel_timer()
+        if self.flush_interval is None:
+            return
+        self._timer = threading.Timer(self.flush_interval, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _send(self, cells):
+        """셀을 values.batchUpdate 한 번으로 전송 (실패하면 예외)"""
+        execute_request(self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={'valueInputOption': self.value_input_option, 'data': build_update_data(cells)}
+        ))
+
+    def _send_by_row(self, cells):
+        """영구 오류로 거절된 묶음을 행별로 다시 보내 거절된 셀만 골라냄 → (거절된 셀, 다시 보낼 셀)"""
+        rows = {}
+        for key, value in cells.items():
+            rows.setdefault(key[:2], {})[key] = value
+        rejected, retry = {}, {}
+        for row_cells in rows.values():
+            try:
+                self._send(row_cells)
+            except HttpError as e:
+                (retry if e.resp.status in RETRY_STATUSES else rejected).update(row_cells)
+            except Exception:
+                retry.update(row_cells)
+        return rejected, retry
+
+    def flush(self):
+        """모인 셀을 values.batchUpdate 한 번으로 전송. 다시 보낼 셀이 남지 않으면 True
+
+        대기열을 떼어 낸 뒤 락을 놓고 보내므로, 전송하는 동안에도 set_cell()은 기다리지 않는다.
+        일시적인 오류(429/500/503, 네트워크)면 셀을 대기열과 저널에 그대로 두고 다음 전송 때 다시 보낸다.
+        그 밖의 HTTP 오류(잘못된 범위 등)는 다시 보내도 같은 결과이므로, 행별로 다시 보내 보고
+        그래도 거절된 셀은 기록을 남기고 버린다. (계속 다시 보내면 같은 묶음의 다른 셀까지 막힘)
+        """
+        with self._send_lock:  # 전송은 한 번에 하나씩 (순서 유지)
+            with self._lock:
+                self._cancel_timer()
+                if not self._pending:
+                    self.flushed_seq = self._seq
+                    return True
+                pending, self._pending = self._pending, {}
+                upto = self._seq
+                self._first_pending = None
+
+            rejected, retry = {}, {}
+            try:
+                self._send(pending)
+            except HttpError as e:
+                if e.resp.status in RETRY_STATUSES:
+                    print(f"시트 일괄 업데이트 중 오류 발생: {str(e)}")
+                    retry = pending
+                else:
+                    print(f"시트 일괄 업데이트가 거절되었습니다 ({e.resp.status}). 행별로 다시 보냅니다: {str(e)}")
+                    rejected, retry = self._send_by_row(pending)
+            except Exception as e:
+                print(f"시트 일괄 업데이트 중 오류 발생: {str(e)}")
+                retry = pending
+
+            if rejected:
+                ranges = ', '.join(f"{sheet}!{column}{row}" for sheet, row, column in sorted(rejected))
+                print(f"❌ 시트가 거절한 셀 {len(rejected)}개는 다시 보내지 않고 버립니다: {ranges}")
+            if retry:
+                print(f"셀 {len(retry)}개는 다음에 다시 보냅니다.")
+                with self._lock:
+                    # 전송 중에 같은 셀에 새 값이 들어왔으면 새 값을 유지
+                    for key, value in retry.items():
+                        self._pending.setdefault(key, value)
+                    if self._first_pending is None:
+                        self._first_pending = time.monotonic()
+                    self._start_timer()
+                return False
+
+            with self._lock:
+                self.flush_count += 1
+                self.flushed_seq = upto
+                if self._pending:
+                    # 전송 중에 새로 들어온 셀이 있으면 어디까지 보냈는지만 기록
+                    self._append_journal({'op': 'flushed', 'seq': upto})
+                else:
+                    # 모두 시트에 반영됐으므로 저널을 비움
+                    self._remove_journal()
+            if len(pending) > len(rejected):
+                print(f"시트에 셀 {len(pending) - len(rejected)}개를 한 번에 업데이트했습니다.")
+            return True
+
+    def close(self):
+        """남은 셀을 모두 보내고 타이머 정리"""
+        self.flush()
+        with self._lock:
+            self._cancel_timer()
+
+_STOP = object()
+
+class SheetWriteQueue:
+    """여러 작업자의 셀 쓰기를 큐로 받아 전담 스레드 하나가 보내는 단일 작성자
+
+    put()은 큐에 넣고 바로 돌아오므로 작업자는 Sheets 지연을 기다리지 않는다.
+    전담 스레드는 스프레드시트별 BufferedSheetWriter(저널 포함)에 모아 flush_rows행 또는
+    flush_interval초마다 전송하고, 일시적인 오류로 실패하면 RETRY_DELAYS 간격으로 다시 보낸다.
+    (시트가 거절한 셀은 BufferedSheetWriter.flush()가 기록을 남기고 버림)
+
+    사용 예:
+        write_queue = get_sheet_write_queue(service)
+        write_queue.put(spreadsheet_id, '시트1', 5, 'C', link)
+        write_queue.put_updates(spreadsheet_id, [{'range': "'시트1'!M5", 'values': [['250519']]}])
+        write_queue.flush()  # 모두 보낼 때까지 대기 (종료 시)
+    """
+
+    def __init__(self, service, flush_rows=FLUSH_ROWS, flush_interval=FLUSH_INTERVAL):
+        self.service = service
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._writers = {}  # spreadsheet_id → BufferedSheetWriter (전담 스레드만 사용)
+        self._callbacks = []  # (writer, seq, callback) - 해당 쓰기가 반영되면 호출
+        self._failures = {}  # spreadsheet_id → (연속 실패 수, 다음 재시도 시각)
+        self._thread = threading.Thread(target=self._run, name='SheetWriteQueue', daemon=True)
+        self._thread.start()
+
+    # ----- 작업자 쪽 (어느 스레드에서나 호출) -----
+
+    def put(self, spreadsheet_id, sheet, row, column, value, on_sent=None):
+        """셀 하나 쓰기를 큐에 넣음 (바로 반환)"""
+        self.put_cells(spreadsheet_id, [(sheet, row, column, value)], on_sent)
+
+    def put_cells(self, spreadsheet_id, cells, on_sent=None, journal=True):
+        """[(시트, 행, 열, 값), ...]을 큐에 넣음. on_sent는 모두 시트에 반영된 뒤 전담 스레드에서 호출
+
+        journal=False면 큐의 저널에 남기지 않는다. 호출하는 쪽이 보내지 못한 셀을 직접 보관하고
+        다음 실행 때 다시 넣는 경우(sheet_mirror의 dirty_cells)에 쓰며, 그래야 재시작 때 두 번 보내지 않는다.
+        """
+        self._queue.put((spreadsheet_id, list(cells), on_sent, journal))
+
+    def put_updates(self, spreadsheet_id, updates, on_sent=None):
+        """values.batchUpdate의 data 형식({'range': "'시트'!M5", 'values': [[값]]})을 셀 단위로 큐에 넣음"""
+        cells = []
+        for update in updates:
+            sheet, row, column = split_cell_range(update['range'].split(':')[0])
+            for row_offset, values in enumerate(update.get('values', [])):
+                for column_offset, value in enumerate(values):
+                    cells.append((sheet, row + row_offset,
+                                  index_to_column(column_to_index(column) + column_offset), value))
+        self.put_cells(spreadsheet_id, cells, on_sent)
+
+    def flush(self, timeout=None):
+        """지금까지 넣은 쓰기를 모두 보낼 때까지 대기. 모두 반영됐으면 True"""
+        if not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        result = []
+        self._queue.put((done, result))
+        done.wait(timeout)
+        return bool(result and result[0])
+
+    def close(self, timeout=None):
+        """남은 쓰기를 보내고 전담 스레드 종료"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    # ----- 전담 스레드 -----
+
+    def _writer(self, spreadsheet_id):
+        writer = self._writers.get(spreadsheet_id)
+        if writer is None:
+            # 같은 요청의 셀이 나뉘어 가지 않도록 전송 시점은 이 스레드가 정함 (flush_rows/interval=None)
+            writer = BufferedSheetWriter(
+                self.service, spreadsheet_id, flush_rows=None, flush_interval=None,
+                journal_path=os.path.join(JOURNAL_DIR, f"sheet_queue_{spreadsheet_id}.jsonl"))
+            self._writers[spreadsheet_id] = writer
+        return writer
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self._wait_time())
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._flush_all(force=True)
+                break
+            if item is not None and isinstance(item[0], threading.Event):
+                done, result = item
+                result.append(self._flush_all(force=True))
+                done.set()
+            elif item is not None:
+                spreadsheet_id, cells, on_sent, journal = item
+                writer = self._writer(spreadsheet_id)
+                for sheet, row, column, value in cells:
+                    writer.set_cell(sheet, row, column, value, journal=journal)
+                if on_sent is not None:
+                    self._callbacks.append((writer, writer.seq, on_sent))
+                if writer.pending_rows() >= self.flush_rows and spreadsheet_id not in self._failures:
+                    self._flush_writer(spreadsheet_id, writer)
+            self._flush_all()
+
+    def _wait_time(self):
+        """다음 전송(주기 또는 재시도)까지 남은 시간 (보낼 것이 없으면 None: 무한 대기)"""
+        now = time.monotonic()
+        deadlines = []
+        for spreadsheet_id, writer in self._writers.items():
+            if not len(writer):
+                continue
+            failure = self._failures.get(spreadsheet_id)
+            if failure:
+                deadlines.append(failure[1])
+            elif self.flush_interval is not None and writer._first_pending is not None:
+                deadlines.append(writer._first_pending + self.flush_interval)
+        return max(0, min(deadlines) - now) if deadlines else None
+
+    def _flush_all(self, force=False):
+        """전송할 때가 된 스프레드시트를 보냄 (force면 모두). 남은 쓰기가 없으면 True"""
+        now = time.monotonic()
+        all_sent = True
+        for spreadsheet_id, writer in self._writers.items():
+            if len(writer):
+                failure = self._failures.get(spreadsheet_id)
+                due = failure[1] <= now if failure else (
+                    self.flush_interval is not None and writer._first_pending is not None
+                    and now - writer._first_pending >= self.flush_interval)
+                if force or due:
+                    self._flush_writer(spreadsheet_id, writer)
+            all_sent = all_sent and not len(writer)
+        self._run_callbacks()
+        return all_sent
+
+    def _flush_writer(self, spreadsheet_id, writer):
+        """스프레드시트 하나를 보내고 재시도 일정 갱신
+
+        writer.flush()는 다시 보내면 성공할 수 있는 오류(429/500/503, 네트워크)일 때만 셀을 남기고 False를
+        돌려준다. 시트가 거절한 셀은 그 안에서 기록 후 버려지므로 여기서 다시 보낼 일정을 잡지 않는다.
+        """
+        if writer.flush():
+            self._failures.pop(spreadsheet_id, None)
+        else:
+            failure = self._failures.get(spreadsheet_id)
+            count = failure[0] + 1 if failure else 1
+            delay = RETRY_DELAYS[min(count, len(RETRY_DELAYS)) - 1]
+            self._failures[spreadsheet_id] = (count, time.monotonic() + delay)
+
+    def _run_callbacks(self):
+        remaining = []
+        for writer, seq, callback in self._callbacks:
+            if writer.flushed_seq >= seq:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"시트 쓰기 완료 처리 중 오류 발생: {str(e)}")
+            else:
+                remaining.append((writer, seq, callback))
+        self._callbacks = remaining
+
+_WRITE_QUEUE = None
+_WRITE_QUEUE_LOCK = threading.Lock()
+
+def get_sheet_write_queue(service):
+    """공용 쓰기 큐 반환 (없으면 전담 스레드와 함께 생성)"""
+    global _WRITE_QUEUE
+    with _WRITE_QUEUE_LOCK:
+        if _WRITE_QUEUE is None:
+            _WRITE_QUEUE = SheetWriteQueue(service)
+        return _WRITE_QUEUE
+
+def close_sheet_writers():
+    """공용 쓰기 큐의 남은 셀 전송 (실행 종료 시 호출)"""
+    global _WRITE_QUEUE
+    with _WRITE_QUEUE_LOCK:
+        write_queue, _WRITE_QUEUE = _WRITE_QUEUE, None
+    if write_queue is not None:
+        write_queue.close()
+
+# 호출을 잊어도 정상 종료라면 남은 셀을 보냄 (비정상 종료는 저널로 복구)
+atexit.register(close_sheet_writers)
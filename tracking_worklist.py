@@ -0,0 +1,49 @@
+'''
+전체 탭 일괄 추적 작업 목록
+- 스프레드시트의 모든 캠페인 탭에서 URL/결과/이름 열을 values.batchGet 한 번으로 읽고,
+  같은 블로거(blogId)나 인스타 계정(username)을 가리키는 행을 작업 하나로 묶습니다.
+- 크롤링은 작업마다 한 번만 하고, 결과는 묶인 모든 행에 나눠 씁니다.
+'''
+
+import sheet_cache
+from sheet_reader import read_tabs
+from sheet_rows import rows_from_columns
+
+class CrawlTarget:
+    """크롤링 작업 하나 - 같은 계정을 가리키는 여러 탭의 행을 묶음"""
+
+    def __init__(self, key, url, name):
+        self.key = key  # blogId 또는 username
+        self.url = url  # 크롤링할 URL
+        self.name = name  # 처음 나온 행의 이름
+        self.rows = []  # [(탭 이름, 행 번호), ...] - 결과를 쓸 행
+
+    def __repr__(self):
+        return f"CrawlTarget({self.key!r}, 행 {len(self.rows)}개)"
+
+def get_tab_names(service, spreadsheet_id):
+    """스프레드시트의 모든 탭 이름 (시트 순서)"""
+    spreadsheet = sheet_cache.get_spreadsheet(service, spreadsheet_id)
+    return [sheet['properties']['title'] for sheet in spreadsheet.get('sheets', [])]
+
+def build_work_list(service, spreadsheet_id, url_column, result_column, name_column, kind, first_row=2):
+    """모든 탭을 읽어 중복 없는 작업 목록 반환
+
+    kind(sheet_rows.BLOG / INSTA)와 종류가 같은 URL 행만 대상으로 한다.
+    결과 열이 이미 채워진 행은 건너뛰고, 같은 key의 행은 한 작업의 rows로 모은다.
+    """
+    tabs = read_tabs(service, spreadsheet_id, get_tab_names(service, spreadsheet_id),
+                     [url_column, result_column, name_column], first_row)
+    targets = {}
+    for sheet, rows in tabs.items():
+        for row in rows_from_columns(rows, first_row, sheet, kind):
+            if row.done:
+                continue
+            if row.key not in targets:
+                targets[row.key] = CrawlTarget(row.key, row.crawl_url, row.name)
+            targets[row.key].rows.append((sheet, row.row_number))
+
+    work_list = list(targets.values())
+    row_count = sum(len(target.rows) for target in work_list)
+    print(f"탭 {len(tabs)}개에서 행 {row_count}개 → 크롤링 작업 {len(work_list)}개 (중복 {row_count - len(work_list)}개 제외)")
+    return work_list
@@ -1,7 +1,5 @@
 import os
-from googleapiclient.discovery import build
 import pandas as pd
-from auth import get_credentials
 from dotenv import load_dotenv
 from openpyxl.styles import Border, Side, PatternFill, Font, Alignment
 import tkinter as tk
@@ -13,6 +11,16 @@ import shutil  # 파일 복사를 위한 모듈 추가
 import openpyxl  # 엑셀 파일 편집을 위한 모듈
 import subprocess  # 폴더 열기 위한 모듈 추가
 
+# 루트 폴더의 공용 모듈 사용 (인증도 루트 auth.py 하나를 다른 도구와 함께 씀)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from auth import get_service, TOOL_SCOPES
+from sheet_reader import iter_rows
+from sheet_a1 import column_to_index
+
+# 보고서에 쓰는 열 (번호, 날짜, 제품 및 내역, 이름, 금액, 구매여부, 포토리뷰, 리뷰작성, 캡쳐여부, 비고)
+REPORT_COLUMNS = ['B', 'C', 'E', 'F', 'K', 'L', 'M', 'N', 'O', 'P']
+REPORT_HEADER_ROW = 8  # 시트에서 헤더가 있는 행
+
 class StyleConverterGUI:
     def __init__(self, root):
         self.root = root
@@ -209,61 +217,26 @@ class StyleConverterGUI:
         # 스프레드시트 ID 추출 (URL에서 추출)
         SPREADSHEET_ID = '1CK2UXTy7HKjBe2T0ovm5hfzAAKZxZAR_ev3cbTPOMPs'
         
-        # Google Sheets API 서비스 생성
-        creds = get_credentials()
-        service = build('sheets', 'v4', credentials=creds)
+        # Google Sheets API 서비스 가져오기
+        service = get_service('sheets', 'v4', TOOL_SCOPES['가구매'])
         
         try:
-            # 시트 데이터 가져오기
-            result = service.spreadsheets().values().get(
-                spreadsheetId=SPREADSHEET_ID,
-                range=sheet_name
-            ).execute()
+            # 보고서에 쓰는 열만 헤더 행부터 구간 단위로 가져오기 (A, D, G~J열과 Q열 이후는 받지 않음)
+            rows = iter_rows(service, SPREADSHEET_ID, sheet_name, REPORT_COLUMNS, first_row=REPORT_HEADER_ROW)
+            headers = next(rows, None)
             
-            values = result.get('values', [])
-            
-            if not values:
+            if headers is None:
                 print('데이터를 찾을 수 없습니다.')
                 return
             
             # 5-7행을 빈 데이터로 채우기 (3행만 빈 데이터로)
-            empty_rows = [[''] * len(values[7]) for _ in range(3)]
-            
-            # 실제 데이터의 최대 컬럼 수 확인
-            max_cols = max(len(row) for row in values[8:])
-            
-            # 8번째 행이 실제 데이터보다 컬럼이 적은 경우 추가 컬럼 생성
-            headers = values[7]
-            if len(headers) < max_cols:
-                for i in range(len(headers), max_cols):
-                    headers.append(f'추가컬럼_{i+1}')
-            
-            # DataFrame으로 변환 (빈 행 + 헤더 + 데이터)
-            all_data = empty_rows + [headers] + values[8:]
-            df = pd.DataFrame(all_data)
-            
-            # B8 셀에 '번호' 입력 (빈 행이 3개이므로 인덱스 3의 1번 열에 해당)
-            df.iloc[3, 1] = '번호'
-            
-            # 특정 열 삭제 (A, D, G, H, I, J열과 Q열 이후)
-            columns_to_drop = [0, 3, 6, 7, 8, 9]
-            if len(df.columns) > 16:
-                columns_to_drop.extend(range(16, len(df.columns)))
-            df = df.drop(df.columns[columns_to_drop], axis=1)
-            
-            # 헤더 순서 확인
-            expected_headers = ['번호', '날짜', '제품 및 내역', '이름', '금액', '구매여부', '포토리뷰', '리뷰작성', '캡쳐여부', '비고']
-            actual_headers = df.iloc[3].tolist()  # 4번째 행(인덱스 3)이 헤더
-            
-            # 헤더 검증
-            if len(actual_headers) != len(expected_headers):
-                print('경고: 예상된 헤더 수와 실제 헤더 수가 다릅니다.')
-                print(f'예상된 헤더: {expected_headers}')
-                print(f'실제 헤더: {actual_headers}')
-            else:
-                for expected, actual in zip(expected_headers, actual_headers):
-                    if expected != actual:
-                        print(f'경고: 헤더 불일치 - 예상: {expected}, 실제: {actual}')
+            empty_rows = [[''] * len(REPORT_COLUMNS) for _ in range(3)]
+            
+            # B8 셀에 '번호' 입력 (빈 행이 3개이므로 인덱스 3의 첫 번째 열(B열)에 해당)
+            headers[0] = '번호'
+            
+            # DataFrame으로 변환 (빈 행 + 헤더, 데이터 행은 아래에서 받는 대로 바로 기록)
+            df = pd.DataFrame(empty_rows + [headers])
             
             # 저장 경로 설정
             output_file = os.path.join(save_path, f"{filename}.xlsx")
@@ -273,6 +246,35 @@ class StyleConverterGUI:
                 
                 worksheet = writer.sheets[sheet_name]
                 
+                # 데이터 행을 구간 단위로 받아 5행부터 이어서 기록 (시트 전체를 목록으로 들고 있지 않음)
+                # (iter_rows의 행은 항상 REPORT_COLUMNS 길이라 길이 검사 없이 열마다 값이 있는 행 수를 같이 셈)
+                filled_counts = [0] * len(REPORT_COLUMNS)
+                for row in rows:
+                    worksheet.append(row)
+                    for i, value in enumerate(row):
+                        if value:
+                            filled_counts[i] += 1
+                
+                # 헤더가 비어 있는데 데이터가 있는 열은 추가 컬럼 이름 붙이기
+                for i, column in enumerate(REPORT_COLUMNS):
+                    if not headers[i] and filled_counts[i]:
+                        headers[i] = f'추가컬럼_{column_to_index(column) + 1}'
+                        worksheet.cell(row=4, column=i + 1).value = headers[i]
+                
+                # 헤더 순서 확인
+                expected_headers = ['번호', '날짜', '제품 및 내역', '이름', '금액', '구매여부', '포토리뷰', '리뷰작성', '캡쳐여부', '비고']
+                actual_headers = headers  # 4번째 행이 헤더
+                
+                # 헤더 검증
+                if len(actual_headers) != len(expected_headers):
+                    print('경고: 예상된 헤더 수와 실제 헤더 수가 다릅니다.')
+                    print(f'예상된 헤더: {expected_headers}')
+                    print(f'실제 헤더: {actual_headers}')
+                else:
+                    for expected, actual in zip(expected_headers, actual_headers):
+                        if expected != actual:
+                            print(f'경고: 헤더 불일치 - 예상: {expected}, 실제: {actual}')
+                
                 # 모든 열의 너비를 13으로 설정
                 for col in worksheet.columns:
                     col_letter = col[0].column_letter
@@ -283,22 +285,10 @@ class StyleConverterGUI:
                 header_fill = PatternFill(start_color=navy_color, end_color=navy_color, fill_type='solid')
                 white_bold_font = Font(color='FFFFFF', bold=True, name='맑은 고딕', size=11)
                 
-                # '제품 및 내역' 열 찾기
-                product_col = None
-                num_people = None
-                
-                for col in range(1, worksheet.max_column + 1):
-                    if worksheet.cell(row=4, column=col).value == '제품 및 내역':
-                        product_col = col
-                        # 인원수 계산 (데이터가 있는 행의 수 계산)
-                        num_people = 0
-                        for r in range(5, worksheet.max_row + 1):
-                            if worksheet.cell(row=r, column=product_col).value:
-                                num_people += 1
-                        break
-                
-                if not num_people:
-                    num_people = 0  # 기본값 설정
+                # 인원수 = '제품 및 내역' 열에 값이 있는 행의 수 (받으면서 센 값 사용 - 워크시트를 다시 훑지 않음)
+                num_people = 0  # 기본값 설정
+                if '제품 및 내역' in headers:
+                    num_people = filled_counts[headers.index('제품 및 내역')]
                 
                 # 인원수를 클래스 변수로 저장
                 self.num_people = num_people
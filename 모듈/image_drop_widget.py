@@ -4,7 +4,6 @@ import tempfile
 import mimetypes
 from PIL import ImageGrab, Image
 from googleapiclient.http import MediaFileUpload
-from googleapiclient.discovery import build
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
                             QPushButton, QFileDialog, QMessageBox, QApplication)
@@ -14,7 +13,8 @@ from PyQt5.QtGui import QDragEnterEvent, QDropEvent
 # 인증 모듈 임포트 - 경로를 적절히 조정해야 할 수 있음
 import sys
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '모집'))
-from auth import get_credentials
+from auth import get_service
+from quota_scheduler import execute_request
 
 class ImageDropWidget(QWidget):
     """이미지 드래그앤드롭 및 붙여넣기를 지원하는 위젯"""
@@ -107,9 +107,8 @@ class ImageDropWidget(QWidget):
             self.url_input.setText("이미지를 업로드하는 중...")
             QApplication.processEvents()
             
-            # 구글 드라이브 API 인증
-            creds = get_credentials()
-            drive_service = build('drive', 'v3', credentials=creds)
+            # 구글 드라이브 API 서비스
+            drive_service = get_service('drive', 'v3')
             
             # 파일 메타데이터 설정
             file_metadata = {
@@ -121,17 +120,17 @@ class ImageDropWidget(QWidget):
             media = MediaFileUpload(file_path, mimetype=mimetypes.guess_type(file_path)[0])
             
             # 파일 업로드
-            file = drive_service.files().create(
+            file = execute_request(drive_service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id'
-            ).execute()
+            ))
             
             # 파일 공개 접근 권한 설정
-            drive_service.permissions().create(
+            execute_request(drive_service.permissions().create(
                 fileId=file.get('id'),
                 body={'type': 'anyone', 'role': 'reader'}
-            ).execute()
+            ))
             
             # 파일 URL 생성
             file_id = file.get('id')
@@ -6,10 +6,11 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import json
-from auth import get_credentials
+from auth import get_service
+from quota_scheduler import execute_request
+from api_batch import BatchCollector
 from template_loader import load_template, list_templates
 
 def create_form_from_template(template_name, folder_id, custom_title=None, custom_description=None, custom_image_url=None, custom_product_options=None, custom_channel_options=None):
@@ -41,12 +42,9 @@ def create_form_from_template(template_name, folder_id, custom_title=None, custo
                 break
     
     try:
-        # 인증 정보 가져오기
-        creds = get_credentials()
-        
-        # Forms API 서비스 빌드
-        forms_service = build('forms', 'v1', credentials=creds)
-        drive_service = build('drive', 'v3', credentials=creds)
+        # Forms / Drive API 서비스 가져오기
+        forms_service = get_service('forms', 'v1')
+        drive_service = get_service('drive', 'v3')
         
         # 새 폼 생성
         form = {
@@ -57,93 +55,53 @@ def create_form_from_template(template_name, folder_id, custom_title=None, custo
         }
         
         # Forms API 호출하여 폼 생성
-        created_form = forms_service.forms().create(body=form).execute()
+        created_form = execute_request(forms_service.forms().create(body=form))
         form_id = created_form['formId']
         
         print(f"폼이 성공적으로 생성되었습니다. 폼 ID: {form_id}")
         
+        # 설명, 질문, 이미지를 한 번의 batchUpdate로 추가 (요청은 순서대로 적용됨)
+        requests = []
+        
         # 폼 설명 업데이트
         if 'description' in template_data:
-            update_form_settings = {
-                'requests': [
-                    {
-                        'updateFormInfo': {
-                            'info': {
-                                'description': template_data['description']
-                            },
-                            'updateMask': 'description'
-                        }
-                    }
-                ]
-            }
-            forms_service.forms().batchUpdate(formId=form_id, body=update_form_settings).execute()
+            requests.append({
+                'updateFormInfo': {
+                    'info': {
+                        'description': template_data['description']
+                    },
+                    'updateMask': 'description'
+                }
+            })
         
         # 템플릿의 질문들 추가
-        requests = []
         for index, question in enumerate(template_data['questions']):
             question_request = create_question_request(question, index)
             if question_request:
                 requests.append(question_request)
         
-        if requests:
-            update_form = {'requests': requests}
-            forms_service.forms().batchUpdate(formId=form_id, body=update_form).execute()
-        
-        # 이미지 추가 (템플릿에 이미지 URL이 있는 경우)
+        # 이미지 추가 (템플릿에 이미지 URL이 있는 경우) - 질문 추가 후 첫 번째 위치에 삽입
         if 'image_url' in template_data and template_data['image_url']:
-            add_image_request = {
-                'requests': [
-                    {
-                        'createItem': {
-                            'item': {
-                                'title': '',
-                                'imageItem': {
-                                    'image': {
-                                        'sourceUri': template_data['image_url']
-                                    }
-                                }
-                            },
-                            'location': {'index': 0}  # 첫 번째 위치에 이미지 추가
+            requests.append({
+                'createItem': {
+                    'item': {
+                        'title': '',
+                        'imageItem': {
+                            'image': {
+                                'sourceUri': template_data['image_url']
+                            }
                         }
-                    }
-                ]
-            }
-            forms_service.forms().batchUpdate(formId=form_id, body=add_image_request).execute()
-        
-        # 폼의 소유권 설정 및 지정된 폴더로 이동
-        # 현재 파일의 상위 폴더 확인
-        file = drive_service.files().get(
-            fileId=form_id,
-            fields='parents'
-        ).execute()
-        
-        print(f"현재 폼의 부모 폴더: {file.get('parents', [])}")
-        
-        # 모든 부모 폴더를 쉼표로 구분된 문자열로 결합
-        current_parents = ','.join(file.get('parents', []))
-        
-        # 파일 이동 (이전 부모 모두 제거, 새 부모 추가)
-        updated_file = drive_service.files().update(
-            fileId=form_id,
-            addParents=folder_id,
-            removeParents=current_parents,
-            fields='id, parents, name',
-        ).execute()
-        
-        print(f"폼이 성공적으로 폴더로 이동되었습니다. 파일명: {updated_file.get('name')}, 새 부모 폴더: {updated_file.get('parents')}")
+                    },
+                    'location': {'index': 0}  # 첫 번째 위치에 이미지 추가
+                }
+            })
         
-        # 폼 생성 후 공유 가능 설정
-        # 폼에 대한 접근 권한 설정 (링크가 있는 모든 사용자가 접근 가능하도록)
-        drive_service.permissions().create(
-            fileId=form_id,
-            body={
-                'type': 'anyone',
-                'role': 'reader',
-                'allowFileDiscovery': False
-            }
-        ).execute()
+        if requests:
+            update_form = {'requests': requests}
+            execute_request(forms_service.forms().batchUpdate(formId=form_id, body=update_form))
         
-        print("폼이 '링크가 있는 모든 사용자'와 공유되도록 설정되었습니다.")
+        # 지정된 폴더로 이동하고 공유 설정
+        move_and_share_form(drive_service, form_id, folder_id)
         
         # 편집 URL 및 제출용 URL 생성
         form_edit_url = f"https://docs.google.com/forms/d/{form_id}/edit"
@@ -159,6 +117,55 @@ def create_form_from_template(template_name, folder_id, custom_title=None, custo
         print(f"오류가 발생했습니다: {error}")
         return None
 
+def move_and_share_form(drive_service, form_id, folder_id):
+    """폼을 지정된 폴더로 옮기고 '링크가 있는 모든 사용자'와 공유합니다.
+
+    이동과 권한 설정은 서로 의존하지 않으므로 배치 요청 한 번으로 보냅니다.
+    하나라도 실패하면 HttpError를 그대로 발생시킵니다.
+    """
+    # 현재 파일의 상위 폴더 확인
+    file = execute_request(drive_service.files().get(
+        fileId=form_id,
+        fields='parents'
+    ))
+    
+    print(f"현재 폼의 부모 폴더: {file.get('parents', [])}")
+    
+    # 모든 부모 폴더를 쉼표로 구분된 문자열로 결합
+    current_parents = ','.join(file.get('parents', []))
+    
+    batch = BatchCollector(drive_service)
+    
+    # 파일 이동 (이전 부모 모두 제거, 새 부모 추가)
+    batch.add(drive_service.files().update(
+        fileId=form_id,
+        addParents=folder_id,
+        removeParents=current_parents,
+        fields='id, parents, name',
+    ), request_id='move')
+    
+    # 폼에 대한 접근 권한 설정 (링크가 있는 모든 사용자가 접근 가능하도록)
+    batch.add(drive_service.permissions().create(
+        fileId=form_id,
+        body={
+            'type': 'anyone',
+            'role': 'reader',
+            'allowFileDiscovery': False
+        }
+    ), request_id='share')
+    
+    results = batch.execute()
+    
+    updated_file, error = results['move']
+    if error:
+        raise error
+    print(f"폼이 성공적으로 폴더로 이동되었습니다. 파일명: {updated_file.get('name')}, 새 부모 폴더: {updated_file.get('parents')}")
+    
+    _, error = results['share']
+    if error:
+        raise error
+    print("폼이 '링크가 있는 모든 사용자'와 공유되도록 설정되었습니다.")
+
 def create_question_request(question, index):
     """템플릿 질문 데이터를 API 요청 형식으로 변환합니다."""
     request = {
@@ -233,13 +240,10 @@ def create_question_request(question, index):
 def create_sample_form(form_title, folder_id):
     """샘플 구글 폼을 생성하고 지정된 폴더에 저장합니다."""
     try:
-        # 인증 정보 가져오기
-        creds = get_credentials()
-        
-        # Forms API 서비스 빌드
+        # Forms / Drive API 서비스 가져오기
         # 참고: Google Forms API는 v1 버전을 사용합니다
-        forms_service = build('forms', 'v1', credentials=creds)
-        drive_service = build('drive', 'v3', credentials=creds)
+        forms_service = get_service('forms', 'v1')
+        drive_service = get_service('drive', 'v3')
         
         # 새 폼 생성
         form = {
@@ -250,7 +254,7 @@ def create_sample_form(form_title, folder_id):
         }
         
         # Forms API 호출하여 폼 생성
-        created_form = forms_service.forms().create(body=form).execute()
+        created_form = execute_request(forms_service.forms().create(body=form))
         form_id = created_form['formId']
         
         print(f"폼이 성공적으로 생성되었습니다. 폼 ID: {form_id}")
@@ -340,42 +344,10 @@ def create_sample_form(form_title, folder_id):
         }
         
         # Forms API 호출하여 질문 추가
-        forms_service.forms().batchUpdate(formId=form_id, body=update_form).execute()
-        
-        # 폼의 소유권 설정 및 지정된 폴더로 이동
-        # 먼저 현재 파일의 상위 폴더 확인
-        file = drive_service.files().get(
-            fileId=form_id,
-            fields='parents'
-        ).execute()
-        
-        print(f"현재 폼의 부모 폴더: {file.get('parents', [])}")
-        
-        # 모든 부모 폴더를 쉼표로 구분된 문자열로 결합
-        current_parents = ','.join(file.get('parents', []))
-        
-        # 파일 이동 (이전 부모 모두 제거, 새 부모 추가)
-        updated_file = drive_service.files().update(
-            fileId=form_id,
-            addParents=folder_id,
-            removeParents=current_parents,
-            fields='id, parents, name',
-        ).execute()
-        
-        print(f"폼이 성공적으로 폴더로 이동되었습니다. 파일명: {updated_file.get('name')}, 새 부모 폴더: {updated_file.get('parents')}")
-        
-        # 폼 생성 후 공유 가능 설정
-        # 폼에 대한 접근 권한 설정 (링크가 있는 모든 사용자가 접근 가능하도록)
-        drive_service.permissions().create(
-            fileId=form_id,
-            body={
-                'type': 'anyone',
-                'role': 'reader',
-                'allowFileDiscovery': False
-            }
-        ).execute()
+        execute_request(forms_service.forms().batchUpdate(formId=form_id, body=update_form))
         
-        print("폼이 '링크가 있는 모든 사용자'와 공유되도록 설정되었습니다.")
+        # 지정된 폴더로 이동하고 공유 설정
+        move_and_share_form(drive_service, form_id, folder_id)
         
         # 편집 URL 및 제출용 URL 생성
         form_edit_url = f"https://docs.google.com/forms/d/{form_id}/edit"
@@ -394,9 +366,8 @@ def create_sample_form(form_title, folder_id):
 def create_form_with_gui(template_name, folder_name, custom_title, custom_description, custom_image_url=None, custom_product_options=None, custom_channel_options=None, target_drive_id="1J0-1mMfQYTkIO3jaI1OReBdPPTnXxP23"):
     """GUI에서 호출하는 폼 생성 함수"""
     try:
-        # 인증 정보 가져오기
-        creds = get_credentials()
-        drive_service = build('drive', 'v3', credentials=creds)
+        # Drive API 서비스 가져오기
+        drive_service = get_service('drive', 'v3')
         
         # 폴더 생성
         folder_metadata = {
@@ -405,10 +376,10 @@ def create_form_with_gui(template_name, folder_name, custom_title, custom_descri
             'parents': [target_drive_id]
         }
         
-        folder = drive_service.files().create(
+        folder = execute_request(drive_service.files().create(
             body=folder_metadata,
             fields='id'
-        ).execute()
+        ))
         
         folder_id = folder.get('id')
         
@@ -458,9 +429,8 @@ def main():
     # 지정된 드라이브 폴더 ID
     target_drive_id = "1J0-1mMfQYTkIO3jaI1OReBdPPTnXxP23"
     
-    # 인증 정보 가져오기
-    creds = get_credentials()
-    drive_service = build('drive', 'v3', credentials=creds)
+    # Drive API 서비스 가져오기
+    drive_service = get_service('drive', 'v3')
     
     # 폴더 생성
     folder_name = input("저장할 폴더명을 입력하세요: ")
@@ -470,10 +440,10 @@ def main():
         'parents': [target_drive_id]
     }
     
-    folder = drive_service.files().create(
+    folder = execute_request(drive_service.files().create(
         body=folder_metadata,
         fields='id'
-    ).execute()
+    ))
     
     folder_id = folder.get('id')
     print(f"폴더가 생성되었습니다. 폴더 ID: {folder_id}")
@@ -11,7 +11,6 @@ import tempfile
 import uuid
 from PIL import ImageGrab, Image
 from googleapiclient.http import MediaFileUpload
-from googleapiclient.discovery import build
 
 # 현재 디렉토리 경로 추가
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -19,7 +18,8 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
 # 모듈 임포트
-from auth import get_credentials
+from auth import get_service
+from quota_scheduler import execute_request
 from template_loader import list_templates
 from googleform import create_form_with_gui
 
@@ -114,9 +114,8 @@ class ImageDropWidget(QWidget):
             self.url_input.setText("이미지를 업로드하는 중...")
             QApplication.processEvents()
             
-            # 구글 드라이브 API 인증
-            creds = get_credentials()
-            drive_service = build('drive', 'v3', credentials=creds)
+            # 구글 드라이브 API 서비스
+            drive_service = get_service('drive', 'v3')
             
             # 파일 메타데이터 설정
             file_metadata = {
@@ -128,17 +127,17 @@ class ImageDropWidget(QWidget):
             media = MediaFileUpload(file_path, mimetype=mimetypes.guess_type(file_path)[0])
             
             # 파일 업로드
-            file = drive_service.files().create(
+            file = execute_request(drive_service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id'
-            ).execute()
+            ))
             
             # 파일 공개 접근 권한 설정
-            drive_service.permissions().create(
+            execute_request(drive_service.permissions().create(
                 fileId=file.get('id'),
                 body={'type': 'anyone', 'role': 'reader'}
-            ).execute()
+            ))
             
             # 파일 URL 생성
             file_id = file.get('id')
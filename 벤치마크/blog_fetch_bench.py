@@ -0,0 +1,76 @@
+'''
+블로그 글 목록 조회 벤치마크 (HTTP vs Selenium)
+- 시트의 블로거 목록에 대해 글 목록을 HTTP(blog_http.fetch_post_list)와 브라우저(scrape_post_list_with_driver)로
+  각각 읽고 블로그당 소요 시간과 결과가 같은지(제목 목록 비교)를 출력합니다.
+- 실제 네이버 블로그에 접속하므로 네트워크가 필요합니다. 시트에는 쓰지 않습니다.
+
+### 실행
+python 벤치마크/blog_fetch_bench.py <시트URL> [최대블로거수] [http|selenium|both]
+'''
+
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, '소셜체험단_업로드트래킹'))
+
+from auth import get_service
+from sheet_mirror import close_sheet_mirrors
+
+def print_summary(label, times):
+    if times:
+        print(f"{label:<10}: 블로그 {len(times)}개, 평균 {sum(times) / len(times):.2f}초, 최대 {max(times):.2f}초, 합계 {sum(times):.1f}초")
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+    sheet_url = sys.argv[1]
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    mode = sys.argv[3] if len(sys.argv) > 3 else 'both'
+
+    from Blog_uploadTracking import get_blog_data_from_sheet, setup_webdriver, scrape_post_list_with_driver
+    from blog_http import fetch_post_list, close_session
+
+    urls, names, _ = get_blog_data_from_sheet(get_service('sheets', 'v4'), sheet_url)
+    close_sheet_mirrors()
+    urls, names = urls[:limit], names[:limit]
+
+    http_times, selenium_times, mismatches = [], [], 0
+    driver = setup_webdriver() if mode in ('selenium', 'both') else None
+    try:
+        for url, name in zip(urls, names):
+            http_posts = selenium_posts = None
+            if mode in ('http', 'both'):
+                start = time.perf_counter()
+                try:
+                    http_posts = fetch_post_list(url)
+                except Exception as e:
+                    print(f"{name}: HTTP 조회 실패 - {str(e)}")
+                http_times.append(time.perf_counter() - start)
+            if driver is not None:
+                start = time.perf_counter()
+                try:
+                    selenium_posts = scrape_post_list_with_driver(driver, url)
+                except Exception as e:
+                    print(f"{name}: 브라우저 조회 실패 - {str(e)}")
+                selenium_times.append(time.perf_counter() - start)
+            if http_posts is not None and selenium_posts is not None:
+                same = [title for title, _, _ in http_posts] == [title for title, _, _ in selenium_posts]
+                mismatches += not same
+                print(f"{name}: 글 {len(http_posts)}개 / {len(selenium_posts)}개 {'일치' if same else '불일치'}")
+    finally:
+        if driver is not None:
+            driver.quit()
+        close_session()
+
+    print()
+    print_summary("HTTP", http_times)
+    print_summary("Selenium", selenium_times)
+    if mode == 'both':
+        print(f"제목 목록 불일치: {mismatches}개")
+
+if __name__ == "__main__":
+    main()
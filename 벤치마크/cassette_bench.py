@@ -0,0 +1,151 @@
+'''
+카세트 기록/재생 벤치마크
+- scrape_blog_data(블로그 트래커), crawl_instagram_posts(인스타 트래커), 구글 폼 생성을
+  카세트(cassette.py) 위에서 실행하고 항목별 소요 시간을 출력합니다.
+- 한 번 record 모드로 실제 실행한 뒤에는 replay 모드로 네트워크 없이 같은 입력을 반복할 수 있습니다.
+  (replay는 PALDO_CASSETTE_TIMING=real이면 기록된 응답 시간대로, zero면 대기 없이 재생)
+- 주의: record 모드는 실제 실행이므로 블로그 벤치마크는 시트에 링크/날짜를 쓰고,
+  폼 벤치마크는 지정한 폴더에 실제 폼을 만듭니다.
+
+### 실행
+PALDO_CASSETTE=cassettes/캠페인A PALDO_CASSETTE_MODE=record python 벤치마크/cassette_bench.py blog <시트URL> <키워드> [최대블로거수]
+PALDO_CASSETTE=cassettes/캠페인A PALDO_CASSETTE_TIMING=zero python 벤치마크/cassette_bench.py blog <시트URL> <키워드> [최대블로거수]
+python 벤치마크/cassette_bench.py insta <시트URL> <시트명> <키워드> <주> [최대계정수]
+python 벤치마크/cassette_bench.py form <폴더ID> [폼개수]
+'''
+
+import io
+import os
+import sys
+import time
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, '소셜체험단_업로드트래킹'))
+sys.path.append(os.path.join(ROOT_DIR, '모집', '구글모집폼만들기'))
+
+from auth import get_service
+from quota_scheduler import execute_request
+from cassette import get_cassette, create_driver
+from sheet_writer import close_sheet_writers
+from sheet_mirror import close_sheet_mirrors
+
+def timed(func, *args):
+    """함수를 실행하고 (결과, 소요 시간) 반환 (함수 자체의 출력은 숨김)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    return result, time.perf_counter() - start
+
+def print_summary(label, times):
+    total = sum(times)
+    print(f"\n{label} {len(times)}건: 총 {total:.2f}초, 건당 평균 {total / max(len(times), 1):.2f}초, "
+          f"최대 {max(times, default=0):.2f}초")
+
+def bench_blog(sheet_url, keyword, limit=None):
+    from Blog_uploadTracking import setup_webdriver, scrape_blog_data, get_blog_data_from_sheet, extract_sheet_id
+
+    service = get_service('sheets', 'v4')
+    spreadsheet_id = extract_sheet_id(sheet_url)
+    (urls, names, row_indices), read_time = timed(get_blog_data_from_sheet, service, sheet_url)
+    print(f"시트 읽기: {read_time:.2f}초 (블로거 {len(urls)}명)")
+    if limit:
+        urls, names, row_indices = urls[:limit], names[:limit], row_indices[:limit]
+
+    driver = setup_webdriver()
+    times = []
+    try:
+        for url, name, row_index in zip(urls, names, row_indices):
+            data, elapsed = timed(scrape_blog_data, driver, url, keyword, name, service, spreadsheet_id, row_index)
+            times.append(elapsed)
+            print(f"{name or url}: {elapsed:.2f}초 (글 {len(data)}개)")
+    finally:
+        driver.quit()
+        close_sheet_mirrors()
+        close_sheet_writers()
+    print_summary("scrape_blog_data", times)
+
+def instagram_driver():
+    """인스타 트래커와 같은 로그인 프로필로 Chrome 실행 (재생 모드에서는 호출되지 않음)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument("disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    login_file_path = os.path.join(ROOT_DIR, "0_insta_login.txt")
+    if os.path.exists(login_file_path):
+        with open(login_file_path, 'r', encoding='utf-8') as f:
+            options.add_argument(f"user-data-dir={os.path.join(ROOT_DIR, 'user_data', f.read().strip())}")
+    return webdriver.Chrome(options=options)
+
+def bench_insta(sheet_url, sheet_name, keyword, weeks, limit=None):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from Insta_uploadTrcking import extract_spreadsheet_id, crawl_instagram_posts
+
+    service = get_service('sheets', 'v4')
+    result = execute_request(service.spreadsheets().values().get(
+        spreadsheetId=extract_spreadsheet_id(sheet_url), range=f'{sheet_name}!A:B'))
+    accounts = []
+    for row in result.get('values', [])[1:]:
+        if len(row) > 1 and 'instagram.com' in row[1].lower():
+            username = row[1].split('instagram.com/')[-1].split('?')[0].split('/')[0]
+            accounts.append((username, row[1]))
+    if limit:
+        accounts = accounts[:limit]
+
+    times = []
+    for username, url in accounts:
+        def crawl():
+            driver = create_driver(instagram_driver)
+            try:
+                driver.get(url)
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "div._aagv")))
+                return crawl_instagram_posts(driver, url, weeks, username, keyword)
+            finally:
+                driver.quit()
+        try:
+            (post_count, keyword_posts), elapsed = timed(crawl)
+        except Exception as e:
+            print(f"{username}: 실패 ({e})")
+            continue
+        times.append(elapsed)
+        print(f"{username}: {elapsed:.2f}초 (게시물 {post_count}개, 키워드 게시물 {len(keyword_posts)}개)")
+    print_summary("crawl_instagram_posts", times)
+
+def bench_form(folder_id, count=3):
+    from googleform import create_sample_form
+
+    times = []
+    for i in range(count):
+        # 재생 때 같은 요청 본문이 되도록 제목은 고정
+        result, elapsed = timed(create_sample_form, f"카세트 벤치마크 폼 {i + 1}", folder_id)
+        times.append(elapsed)
+        print(f"폼 {i + 1}: {elapsed:.2f}초 ({'성공' if result else '실패'})")
+    print_summary("create_sample_form", times)
+
+def main():
+    cassette = get_cassette()
+    if cassette is None:
+        print("PALDO_CASSETTE 환경 변수에 카세트 폴더를 지정하세요.")
+        return
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    print(f"=== 카세트 벤치마크 ({cassette.mode}, 시간 모드 {cassette.timing}) ===")
+    command, args = sys.argv[1], sys.argv[2:]
+    if command == 'blog':
+        bench_blog(args[0], args[1], int(args[2]) if len(args) > 2 else None)
+    elif command == 'insta':
+        bench_insta(args[0], args[1], args[2], int(args[3]), int(args[4]) if len(args) > 4 else None)
+    elif command == 'form':
+        bench_form(args[0], int(args[1]) if len(args) > 1 else 3)
+    else:
+        print(f"알 수 없는 명령: {command}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+'''
+가짜 Google 백엔드 처리량 벤치마크
+- 네트워크 없이 fake_google.FakeGoogleBackend 위에서 블로그 트래커의 시트 읽기/쓰기와
+  구글 폼 생성(create_sample_form)을 실행하고 소요 시간과 API 호출 수를 출력합니다.
+- 요청은 실제와 같이 execute_request()의 쿼터 스케줄러를 거치므로, 쓰기가 많으면
+  시트 쓰기 쿼터(분당 60회)에 맞춰 속도가 조절되는 것까지 측정됩니다.
+
+### 실행
+python 벤치마크/fake_backend_bench.py [블로거수] [지연프로필] [오류프로필] [폼개수]
+- 지연프로필: zero / typical / slow (fake_google.LATENCY_PROFILES)
+- 오류프로필: none / quota / flaky (fake_google.ERROR_PROFILES)
+'''
+
+import io
+import os
+import sys
+import time
+import contextlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, '소셜체험단_업로드트래킹'))
+sys.path.append(os.path.join(ROOT_DIR, '모집', '구글모집폼만들기'))
+
+from auth import get_service, use_backend
+from fake_google import FakeGoogleBackend
+from sheet_writer import close_sheet_writers
+from sheet_mirror import close_sheet_mirrors
+
+HEADER = ['번호', '블로그 URL', '포스팅 링크', '연락처', '주소', '블로거명', '상품', '비고', '포스팅 날짜']
+
+def make_campaign_rows(count):
+    """블로그 체험단 캠페인 시트 (B: 블로그 URL, C: 포스팅 링크, F: 블로거명, I: 포스팅 날짜)"""
+    rows = [HEADER]
+    for i in range(1, count + 1):
+        rows.append([str(i), f"https://blog.naver.com/blogger{i:04d}", '', '010-0000-0000',
+                     '서울', f"블로거{i}", '샘플상품', '', ''])
+    return rows
+
+def timed(label, func, *args):
+    """함수를 실행하고 소요 시간 출력 (함수 자체의 출력은 숨김)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}: {elapsed:.3f}초")
+    return result, elapsed
+
+def main():
+    bloggers = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    latency = sys.argv[2] if len(sys.argv) > 2 else 'typical'
+    errors = sys.argv[3] if len(sys.argv) > 3 else 'none'
+    forms = int(sys.argv[4]) if len(sys.argv) > 4 else 3
+
+    from Blog_uploadTracking import get_blog_data_from_sheet, update_sheet_with_link_and_date
+    from googleform import create_sample_form
+
+    backend = FakeGoogleBackend(latency=latency, errors=errors, seed=0)
+    spreadsheet_id = backend.add_spreadsheet({'시트1': make_campaign_rows(bloggers)}, '벤치마크 캠페인')
+    folder_id = backend.add_folder('벤치마크 폼 폴더')
+    use_backend(backend)
+
+    print(f"=== 가짜 백엔드 벤치마크 (블로거 {bloggers}명, 지연 {latency}, 오류 {errors}) ===")
+    service = get_service('sheets', 'v4')
+
+    (urls, names, row_indices), _ = timed("시트 읽기", get_blog_data_from_sheet, service, spreadsheet_id)
+
+    def write_all():
+        for row_index in row_indices:
+            update_sheet_with_link_and_date(service, spreadsheet_id, row_index,
+                                            f"https://blog.naver.com/post/{row_index}", '2025. 5. 19.')
+        close_sheet_mirrors()  # 미러에 모아 둔 쓰기까지 전송해야 실제 완료
+        close_sheet_writers()
+    _, write_time = timed(f"링크/날짜 쓰기 ({len(row_indices)}행)", write_all)
+
+    def create_forms():
+        return [create_sample_form(f"벤치마크 폼 {i}", folder_id) for i in range(forms)]
+    results, form_time = timed(f"폼 생성 ({forms}개)", create_forms)
+
+    filled = sum(1 for row in backend.sheet_values(spreadsheet_id, '시트1')[1:] if len(row) > 2 and row[2])
+    print(f"\n쓰기 처리량: {len(row_indices) / max(write_time, 1e-9):.1f}행/초 (C열 채워진 행 {filled}/{bloggers})")
+    if forms:
+        print(f"폼 생성: 개당 {form_time / forms:.2f}초 (성공 {sum(1 for r in results if r)}/{forms})")
+
+    print("\n=== API 호출 수 ===")
+    for name, count in sorted(backend.calls.items(), key=lambda item: item[0]):
+        print(f"{name:<45}: {count}")
+
+    use_backend(None)
+
+if __name__ == "__main__":
+    main()
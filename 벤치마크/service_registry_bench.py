@@ -0,0 +1,52 @@
+'''
+서비스 레지스트리 마이크로 벤치마크
+- 기존 방식(get_credentials() + build())과 get_service()의 호출당 오버헤드를 비교합니다.
+- API 호출은 하지 않고 서비스 객체를 얻는 비용만 측정합니다. (token.json 필요)
+
+### 실행
+python 벤치마크/service_registry_bench.py [반복횟수]
+'''
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from googleapiclient.discovery import build
+from auth import get_credentials, get_service, clear_services
+
+APIS = [('sheets', 'v4'), ('forms', 'v1'), ('drive', 'v3')]
+
+def bench_build(iterations):
+    """매번 토큰을 읽고 build() 하는 기존 방식"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for api, version in APIS:
+            creds = get_credentials()
+            build(api, version, credentials=creds)
+    return time.perf_counter() - start
+
+def bench_registry(iterations):
+    """get_service() 레지스트리 방식 (첫 호출의 생성 비용 포함)"""
+    clear_services()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for api, version in APIS:
+            get_service(api, version)
+    return time.perf_counter() - start
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    calls = iterations * len(APIS)
+
+    before = bench_build(iterations)
+    after = bench_registry(iterations)
+
+    print(f"=== 서비스 객체 획득 비용 ({calls}회) ===")
+    print(f"get_credentials + build : 총 {before:.3f}초, 호출당 {before / calls * 1000:.2f}ms")
+    print(f"get_service             : 총 {after:.3f}초, 호출당 {after / calls * 1000:.3f}ms")
+    if after > 0:
+        print(f"개선 배율: {before / after:.1f}배")
+
+if __name__ == "__main__":
+    main()
@@ -20,14 +20,32 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 import os
+import json
+import threading
 from datetime import datetime
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from auth import get_credentials
+from auth import get_service, get_token_path
+from cassette import create_driver, get_cassette
+from sheet_writer import close_sheet_writers
+from sheet_mirror import get_sheet_mirror, start_sync_jobs, close_sheet_mirrors
+from tracking_worklist import build_work_list
+from sheet_rows import SheetRow, parse_account, BLOG
+from sheet_format import SheetFormatBatch
+from sheet_reader import number_runs
+from blog_http import fetch_post_list, is_http_enabled, close_session, extract_blog_id, canonical_post_url
+from crawl_engine import CrawlEngine, CRAWL_WORKERS
+from driver_pool import DriverPool, register_pool
+from page_waits import WAIT_STATS, wait_until, skip_sleep, all_of, any_of, document_ready
+
+SHEET_NAME = '시트1'
+DRIVER_LEASE_TIMEOUT = 120  # 브라우저 경로에서 풀의 브라우저를 기다릴 최대 시간(초)
+
+# 현황 표시 색 (헤더 / C열: 링크를 찾은 행 / 아직 못 찾은 행)
+HEADER_COLOR = '4285F4'
+DONE_COLOR = 'D9EAD3'
+PENDING_COLOR = 'FFF2CC'
 
 def select_excel_file():
     root = tk.Tk()
@@ -43,7 +61,8 @@ def select_excel_file():
 def setup_webdriver():
     options = Options()
     options.headless = False
-    driver = webdriver.Chrome(options=options)
+    # PALDO_CASSETTE가 지정되어 있으면 페이지를 기록/재생하는 드라이버로 감쌈
+    driver = create_driver(lambda: webdriver.Chrome(options=options))
     return driver
 
 
@@ -51,45 +70,66 @@ def extract_blog_ids(file_path):
     wb = load_workbook(file_path)
     ws = wb.active
     urls, names = [], []
-    for row in range(1, ws.max_row + 1):
-        url = ws['E' + str(row)].value
-        name = ws['A' + str(row)].value
-        if url and url.startswith("https://blog.naver.com/"):
-            blog_id = url.split('/')[3]
-            urls.append(f"https://blog.naver.com/PostList.naver?blogId={blog_id}&skinType=&skinId=&from=menu")
-            names.append(name)
-        time.sleep(1)
+    for row_number in range(1, ws.max_row + 1):
+        url = ws['E' + str(row_number)].value
+        name = ws['A' + str(row_number)].value
+        row = SheetRow(row_number, url, name=name)
+        if row.kind == BLOG:
+            urls.append(row.crawl_url)
+            names.append(row.name)
+        skip_sleep('엑셀 행 읽기', 1)  # 네트워크 요청이 없으므로 행마다 1초 쉬지 않음
     return urls, names
 
 
 
+# 글 목록 화면의 요소
+SELECT_BOX = (By.CSS_SELECTOR, 'a.btn_select.pcol2._ListCountToggle._returnFalse')  # 줄 수 선택 버튼
+OPEN_LIST_BUTTON = (By.CLASS_NAME, 'btn_openlist.pcol2._toggleTopList._returnFalse')  # 목록 열기 버튼
+THIRTY_LINES_OPTION = (By.XPATH, "//a[@data-value='30']")  # 30줄 보기
+POST_TABLE = (By.CSS_SELECTOR, 'table.blog2_list')  # 글 목록 표
+
+def more_rows_than(count):
+    """글 목록 표에 글이 count개보다 많이 보이면 참"""
+    def condition(driver):
+        return len(driver.find_elements(By.CSS_SELECTOR, 'table.blog2_list tbody tr')) > count
+    return condition
+
+def wait_for_list_redraw(driver, old_table=None):
+    """줄 수를 바꾼 뒤 목록을 다시 그릴 때까지 대기 (예전 고정 2초)
+
+    네트워크/DOM이 잠잠한지 대신 결과를 직접 확인한다 - 누르기 전의 표(old_table)가 교체됐거나,
+    기본 보기(10줄)보다 많은 글이 보이거나, 30줄 보기로 표시되면 (글이 10개 이하인 블로그)
+    """
+    conditions = [more_rows_than(10), is_30_line_view]
+    if old_table is not None:
+        conditions.insert(0, EC.staleness_of(old_table))
+    wait_until(driver, any_of(*conditions), timeout=10, budget=2, label='30줄 목록 갱신')
+
 def set_30_line_view(driver):
-    select_box = driver.find_elements(By.CSS_SELECTOR, 'a.btn_select.pcol2._ListCountToggle._returnFalse')
+    select_box = driver.find_elements(*SELECT_BOX)
     if select_box:
         select_box[0].click()
-        time.sleep(1)
-        thirty_lines_option = WebDriverWait(driver, 20).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[@data-value='30']"))
-        )
+        # 메뉴가 열려 30줄 항목을 누를 수 있을 때까지 (예전 고정 1초)
+        thirty_lines_option = wait_until(driver, EC.element_to_be_clickable(THIRTY_LINES_OPTION),
+                                         timeout=20, budget=1, label='줄 수 메뉴 열림', required=True)
+        old_table = next(iter(driver.find_elements(*POST_TABLE)), None)
         thirty_lines_option.click()
-        time.sleep(2)
+        wait_for_list_redraw(driver, old_table)
     else:
         open_list_button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.CLASS_NAME, 'btn_openlist.pcol2._toggleTopList._returnFalse'))
+            EC.element_to_be_clickable(OPEN_LIST_BUTTON)
         )
         open_list_button.click()
-        time.sleep(1)
         
-        select_button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, 'a.btn_select.pcol2._ListCountToggle._returnFalse'))
-        )
+        # 목록이 열려 줄 수 선택 버튼을 누를 수 있을 때까지 (예전 고정 1초)
+        select_button = wait_until(driver, EC.element_to_be_clickable(SELECT_BOX),
+                                   timeout=10, budget=1, label='목록 열림', required=True)
         select_button.click()
-        time.sleep(1)
-        thirty_lines_option = WebDriverWait(driver, 20).until(
-            EC.element_to_be_clickable((By.XPATH, "//a[@data-value='30']"))
-        )
+        thirty_lines_option = wait_until(driver, EC.element_to_be_clickable(THIRTY_LINES_OPTION),
+                                         timeout=20, budget=1, label='줄 수 메뉴 열림', required=True)
+        old_table = next(iter(driver.find_elements(*POST_TABLE)), None)
         thirty_lines_option.click()
-        time.sleep(2)
+        wait_for_list_redraw(driver, old_table)
 
 
 def get_search_keyword():
@@ -111,71 +151,186 @@ def convert_to_date(date_str):
     except:
         return datetime.now().strftime('%Y. %m. %d.')
 
-def update_sheet_with_link_and_date(service, spreadsheet_id, row_index, link, post_date):
+def get_blog_mirror(service, spreadsheet_id, sheet=SHEET_NAME):
+    """블로그 추적 시트(탭)의 로컬 미러 (B: 블로그 URL, C: 포스팅 링크, F: 이름, I: 작성일 - 게시일 조회)"""
+    return get_sheet_mirror(service, spreadsheet_id, sheet, columns=['B', 'C', 'F', 'I'], date_column='I')
+
+def update_sheet_with_link_and_date(service, spreadsheet_id, row_index, link, post_date, sheet=SHEET_NAME):
+    """C열(포스팅 링크), I열(작성일) 쓰기 예약
+
+    로컬 미러에 바로 반영하고, 시트에는 모았다가 values.batchUpdate 한 번으로 보낸다.
+    (바뀐 행이 일정 수 모이면, 그리고 실행 종료 시 close_sheet_mirrors()에서 전송)
+    """
     try:
         # 날짜 형식 변환
         formatted_date = convert_to_date(post_date)
         
-        # C열 업데이트
-        range_name_c = f"'시트1'!C{row_index}"
-        body_c = {
-            'values': [[link]]
-        }
-        service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=range_name_c,
-            valueInputOption='RAW',
-            body=body_c
-        ).execute()
-        
-        # I열 업데이트 (변환된 날짜로)
-        range_name_i = f"'시트1'!I{row_index}"
-        body_i = {
-            'values': [[formatted_date]]
-        }
-        service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=range_name_i,
-            valueInputOption='RAW',
-            body=body_i
-        ).execute()
+        mirror = get_blog_mirror(service, spreadsheet_id, sheet)
+        mirror.set_cell(row_index, 'C', link)  # C열: 포스팅 링크
+        mirror.set_cell(row_index, 'I', formatted_date)  # I열: 변환된 날짜
         
     except Exception as e:
         print(f"시트 업데이트 중 오류 발생: {str(e)}")
 
-def scrape_blog_data(driver, url, keyword, name, service, spreadsheet_id, row_index):
+_DRIVER_POOL = None  # 브라우저 경로용 풀 (대시보드에서는 실행이 끝나도 유지해서 다음 실행에 재사용)
+_DRIVER_POOL_LOCK = threading.Lock()
+
+def get_driver_pool():
+    """브라우저 경로용 공용 WebDriver 풀 (작업자 스레드마다 하나씩 빌려 씀)"""
+    global _DRIVER_POOL
+    with _DRIVER_POOL_LOCK:
+        if _DRIVER_POOL is None:
+            _DRIVER_POOL = register_pool(DriverPool(setup_webdriver))
+        return _DRIVER_POOL
+
+def close_fallback_driver():
+    """브라우저 풀과 HTTP 세션 종료 (프로그램 종료 시)"""
+    global _DRIVER_POOL
+    with _DRIVER_POOL_LOCK:
+        pool, _DRIVER_POOL = _DRIVER_POOL, None
+    if pool is not None:
+        pool.close()
+    close_session()
+
+# 30줄 보기 목록을 바로 여는 URL (목록 열기 → 줄 수 선택 → 30줄 클릭을 건너뜀)
+THIRTY_LINE_LIST_URL = ("https://blog.naver.com/PostList.naver?blogId={blog_id}&from=postList"
+                        "&categoryNo=0&parentCategoryNo=0&currentPage=1&countPerPage=30")
+
+LIST_VIEW_URL_TIMEOUT = 5  # 30줄 URL로 목록이 뜨기를 기다리는 시간(초) - 넘으면 클릭 순서로
+_LIST_VIEW = None  # blogId → 30줄 URL이 통했는지 (True / False)
+_LIST_VIEW_LOCK = threading.Lock()
+
+def get_list_view_cache_path():
+    """blogId별 30줄 URL 사용 가능 여부 파일 (토큰과 같은 폴더)"""
+    return os.path.join(os.path.dirname(get_token_path()), "blog_list_view.json")
+
+def get_list_view_mode(blog_id):
+    """blogId가 30줄 URL로 열리는지 (True / False, 아직 모르면 None)"""
+    global _LIST_VIEW
+    with _LIST_VIEW_LOCK:
+        if _LIST_VIEW is None:
+            _LIST_VIEW = {}
+            try:
+                with open(get_list_view_cache_path(), 'r', encoding='utf-8') as f:
+                    _LIST_VIEW = json.load(f)
+            except (OSError, ValueError):
+                pass
+        return _LIST_VIEW.get(blog_id)
+
+def remember_list_view_mode(blog_id, works):
+    """blogId의 30줄 URL 사용 가능 여부 저장"""
+    get_list_view_mode(blog_id)  # 파일에서 먼저 읽어 둠
+    with _LIST_VIEW_LOCK:
+        if _LIST_VIEW.get(blog_id) == works:
+            return
+        _LIST_VIEW[blog_id] = works
+        try:
+            cache_path = get_list_view_cache_path()
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(_LIST_VIEW, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"30줄 보기 기록 저장 중 오류 발생: {e}")
+
+def is_30_line_view(driver):
+    """글 목록 표가 30줄 보기로 열렸는지 (줄 수 선택 버튼에 30이 표시되거나 글이 30개 보이면)"""
+    if not driver.find_elements(*POST_TABLE):
+        return False
+    if len(driver.find_elements(By.CSS_SELECTOR, 'table.blog2_list tbody tr')) >= 30:
+        return True
+    return any('30' in element.text for element in driver.find_elements(*SELECT_BOX))
+
+def open_30_line_list(driver, url):
+    """30줄 보기 글 목록 열기 - 통하는 블로그는 URL로 바로 열고, 아니면 기존 클릭 순서로"""
+    blog_id = extract_blog_id(url)
+    if blog_id and get_list_view_mode(blog_id) is not False:
+        driver.get(THIRTY_LINE_LIST_URL.format(blog_id=blog_id))
+        # 목록 표나 (목록이 접힌 블로그면) 목록 열기 버튼이 생길 때까지 - 안 되면 빨리 클릭 순서로 넘어감
+        wait_until(driver, all_of(document_ready, any_of(EC.presence_of_element_located(POST_TABLE),
+                                                         EC.presence_of_element_located(OPEN_LIST_BUTTON))),
+                   timeout=LIST_VIEW_URL_TIMEOUT, budget=5, label='30줄 목록 URL 로딩')
+        if is_30_line_view(driver):
+            remember_list_view_mode(blog_id, True)
+            skip_sleep('30줄 보기 클릭 생략', 4)  # 클릭 사이 고정 대기(1 + 1 + 2초)가 없어짐
+            return
+        if driver.find_elements(*POST_TABLE):
+            # 목록은 떴는데 30줄이 아님 - 이 블로그는 URL이 통하지 않으므로 기록하고 이 화면에서 클릭
+            print(f"{blog_id}: 30줄 보기 URL이 통하지 않아 클릭으로 설정합니다.")
+            remember_list_view_mode(blog_id, False)
+            set_30_line_view(driver)
+            return
+        if driver.find_elements(*OPEN_LIST_BUTTON):
+            # 목록이 기본으로 접혀 있는 블로그 - URL 탓이 아니므로 기록하지 않고 이 화면에서 목록을 엶
+            set_30_line_view(driver)
+            return
+        # 제한 시간 안에 아무것도 뜨지 않음 (일시적인 지연일 수 있으므로 기록하지 않고 원래 주소로 다시 엶)
+
     driver.get(url)
-    time.sleep(5)
+    # 문서 로딩이 끝나고 줄 수 선택 버튼이나 목록 열기 버튼이 생길 때까지 (예전 고정 5초)
+    wait_until(driver, all_of(document_ready, any_of(EC.presence_of_element_located(SELECT_BOX),
+                                                     EC.presence_of_element_located(OPEN_LIST_BUTTON))),
+               timeout=15, budget=5, label='글 목록 화면 로딩')
     set_30_line_view(driver)
+
+def scrape_post_list_with_driver(driver, url):
+    """브라우저로 글 목록 화면을 열어 [(제목, 작성일, 링크), ...] 반환 (최대 30개)"""
+    open_30_line_list(driver, url)
+    WebDriverWait(driver, 30).until(
+        EC.presence_of_element_located(POST_TABLE)
+    )
+    posts = driver.find_elements(By.CSS_SELECTOR, 'table.blog2_list tbody tr')[:30]
+    blog_id = extract_blog_id(url)
+    data = []
+    for post in posts:
+        title_elements = post.find_elements(By.CSS_SELECTOR, 'span.ell2.pcol2')
+        date_elements = post.find_elements(By.CSS_SELECTOR, 'div.wrap_td span.date.pcol2')
+        link_elements = post.find_elements(By.CSS_SELECTOR, 'td.title a')
+        if title_elements and date_elements and link_elements:
+            # 링크는 HTTP 경로와 같은 형식으로 (시트 C열에 경로마다 다른 URL이 쓰이지 않도록)
+            link = canonical_post_url(link_elements[0].get_attribute('href'), blog_id)
+            data.append((title_elements[0].text, date_elements[0].text, link))
+    return data
+
+def fetch_blog_posts(driver, url):
+    """블로그 최근 글 [(제목, 작성일, 링크), ...] - HTTP로 먼저 받고, 실패하면 브라우저로 읽음
+
+    driver가 None이면 브라우저 경로가 필요할 때 get_driver_pool()에서 미리 띄워 둔 브라우저를 빌려 쓴다.
+    """
+    if is_http_enabled():
+        try:
+            return fetch_post_list(url)
+        except Exception as e:
+            print(f"HTTP 글 목록 조회 실패, 브라우저로 다시 시도합니다: {str(e)}")
+            if driver is None:
+                # 다른 블로그도 실패할 수 있으므로 나머지 브라우저도 백그라운드에서 띄워 둠
+                get_driver_pool().prewarm()
+    if driver is not None:
+        return scrape_post_list_with_driver(driver, url)
+    with get_driver_pool().lease(DRIVER_LEASE_TIMEOUT) as pooled_driver:
+        return scrape_post_list_with_driver(pooled_driver, url)
+
+def scrape_blog_data(driver, url, keyword, name, service, spreadsheet_id, row_index):
+    """블로그 글 목록에서 키워드 글을 찾아 시트에 기록
+
+    row_index는 '시트1'의 행 번호, 또는 전체 탭 모드에서는 결과를 쓸 [(탭 이름, 행 번호), ...]
+    """
+    targets = row_index if isinstance(row_index, list) else [(SHEET_NAME, row_index)]
     try:
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'table.blog2_list'))
-        )
-        posts = driver.find_elements(By.CSS_SELECTOR, 'table.blog2_list tbody tr')[:30]
-        data = []
+        data = fetch_blog_posts(driver, url)
         found_in_blog = False
         
-        for post in posts:
-            title_elements = post.find_elements(By.CSS_SELECTOR, 'span.ell2.pcol2')
-            date_elements = post.find_elements(By.CSS_SELECTOR, 'div.wrap_td span.date.pcol2')
-            link_elements = post.find_elements(By.CSS_SELECTOR, 'td.title a')
-            if title_elements and date_elements and link_elements:
-                title = title_elements[0].text
-                date = date_elements[0].text
-                link = link_elements[0].get_attribute('href')
-                
-                if keyword in title:
-                    if not found_in_blog:
-                        print(f"\n키워드 '{keyword}' 발견")
-                        found_in_blog = True
-                        # 작성일을 파라미터로 전달
-                        update_sheet_with_link_and_date(service, spreadsheet_id, row_index, link, date)
-                    print(f"제목: {title}")
-                    print(f"작성일: {date}")
-                    print(f"링크: {link}")
-                    print("-" * 80)
-                
-                data.append((title, date, link))
+        for title, date, link in data:
+            if keyword in title:
+                if not found_in_blog:
+                    print(f"\n키워드 '{keyword}' 발견")
+                    found_in_blog = True
+                    # 작성일을 파라미터로 전달 (같은 블로거를 가리키는 모든 행에 기록)
+                    for sheet, row in targets:
+                        update_sheet_with_link_and_date(service, spreadsheet_id, row, link, date, sheet)
+                print(f"제목: {title}")
+                print(f"작성일: {date}")
+                print(f"링크: {link}")
+                print("-" * 80)
                 
         if not found_in_blog:
             print(f"{name}의 블로그에서 '{keyword}' 관련 글이 없습니다.")
@@ -187,6 +342,31 @@ def scrape_blog_data(driver, url, keyword, name, service, spreadsheet_id, row_in
 
 
 
+def crawl_blogs(urls, names, row_indices, keyword, service, spreadsheet_id, workers=CRAWL_WORKERS, on_result=None):
+    """작업 목록의 블로그를 작업자 workers명이 동시에 검색하고 블로그별 글 목록을 입력 순서대로 반환
+
+    각 블로그는 scrape_blog_data와 같게 처리한다 (HTTP 우선, 실패하면 공용 DriverPool에서 빌린 브라우저로).
+    on_result(index, (url, name, row_index), data, error)는 블로그 하나가 끝날 때마다 불린다.
+    """
+    def crawl(job):
+        url, name, row_index = job
+        print(f"\n{name}의 블로그 검색 중...")
+        return scrape_blog_data(None, url, keyword, name, service, spreadsheet_id, row_index)
+
+    def report(index, job, data, error):
+        print(f"[{engine.completed}/{len(urls)}] {job[1]} 완료 ({engine.throughput():.2f}개/초)")
+        if on_result:
+            on_result(index, job, data, error)
+
+    if get_cassette() is not None:
+        workers = 1  # 카세트는 페이지 방문 순서대로 기록/재생하므로 한 명씩
+    engine = CrawlEngine(crawl, workers)
+    WAIT_STATS.reset()
+    data_list = engine.run(zip(urls, names, row_indices), on_result=report)
+    print(f"\n{engine.summary()}")
+    WAIT_STATS.report()  # 브라우저 경로에서 고정 sleep 대신 조건 대기로 절약한 시간
+    return [data or [] for data in data_list]
+
 def apply_excel_styles(ws):
     header_font = Font(bold=True)
     header_fill = PatternFill(start_color="FCD5B4", end_color="FCD5B4", fill_type="solid")
@@ -224,10 +404,10 @@ def get_user_input():
         url = input("URL: ").strip()
         if url.lower() == 'done':
             break
-        if url.startswith("https://blog.naver.com/"):
-            blog_id = url.split('/')[3]
+        kind, _, crawl_url = parse_account(url)
+        if kind == BLOG:
             name = input("블로거 이름: ").strip()
-            urls.append(f"https://blog.naver.com/PostList.naver?blogId={blog_id}&skinType=&skinId=&from=menu")
+            urls.append(crawl_url)
             names.append(name)
         else:
             print("올바른 네이버 블로그 URL을 입력해주세요 (https://blog.naver.com/로 시작해야 합니다)")
@@ -270,63 +450,67 @@ def extract_sheet_id(input_str):
         else:
             raise ValueError("유효하지 않은 구글 시트 URL 또는 ID입니다.")
 
+def get_blog_work_list_from_all_tabs(service, spreadsheet_id_or_url):
+    """모든 탭을 한 번에 읽어 블로거별 작업 목록 반환 (urls, names, 행 목록들)
+
+    같은 블로거가 여러 탭/행에 있으면 한 번만 크롤링하고, 결과는 그 행들 모두에 쓴다.
+    """
+    try:
+        spreadsheet_id = extract_sheet_id(spreadsheet_id_or_url)
+        work_list = build_work_list(service, spreadsheet_id, 'B', 'C', 'F', BLOG)
+        return ([target.url for target in work_list], [target.name for target in work_list],
+                [target.rows for target in work_list])
+    except Exception as e:
+        print(f"구글 시트 데이터 읽기 오류: {str(e)}")
+        return [], [], []
+
+def style_status_board(service, spreadsheet_id, sheet=SHEET_NAME):
+    """추적 시트를 현황판처럼 꾸밈 - 헤더 강조, C열은 링크를 찾은 행 초록 / 못 찾은 행 노랑
+
+    서식 요청을 모아 spreadsheets.batchUpdate 한 번으로 보내므로 엑셀로 받아 꾸밀 필요가 없다.
+    반환값: (링크를 찾은 행 수, 못 찾은 행 수)
+    """
+    mirror = get_blog_mirror(service, spreadsheet_id, sheet)
+    mirror.sync()
+    done = [row['row_number'] for row in mirror.rows_with('C')]
+    pending = [row['row_number'] for row in mirror.pending_rows('B', 'C')]
+
+    batch = SheetFormatBatch(service, spreadsheet_id)
+    batch.format(sheet, '1:1', background=HEADER_COLOR, font_color='FFFFFF', bold=True, horizontal='CENTER')
+    for color, row_numbers in ((DONE_COLOR, done), (PENDING_COLOR, pending)):
+        for start, end in number_runs(row_numbers):
+            batch.format(sheet, f'C{start}:C{end}', background=color)
+    batch.send()
+    return len(done), len(pending)
+
 def get_blog_data_from_sheet(service, spreadsheet_id_or_url):
     """구글 시트에서 블로그 데이터를 가져옵니다."""
     try:
         # 시트 ID 추출
         spreadsheet_id = extract_sheet_id(spreadsheet_id_or_url)
-        RANGE_NAME = "'시트1'!B:F"  # B열부터 F열까지 가져오도록 수정
-        
-        # 시트 데이터 가져오기
-        sheet = service.spreadsheets()
-        result = sheet.values().get(
-            spreadsheetId=spreadsheet_id,
-            range=RANGE_NAME
-        ).execute()
-        
-        values = result.get('values', [])
-        if not values:
-            print('데이터가 없습니다.')
+        # 로컬 미러를 시트와 맞춘 뒤(시트가 바뀌었을 때만 다시 읽음) B열 URL은 있고 C열이 빈 행 조회
+        mirror = get_blog_mirror(service, spreadsheet_id)
+        mirror.sync()
+        pending = mirror.pending_rows('B', 'C')
+        if not pending:
+            print('처리할 데이터가 없습니다.')
             return [], [], []
             
         urls = []
         names = []
         row_indices = []  # 실제 행 번호를 저장할 리스트
         
-        # 데이터 처리 (첫 번째 행은 헤더이므로 건너뛰기)
-        for i, row in enumerate(values[1:], start=2):
-            print(f"\n행 {i} 처리 중:")
-            print(f"행 데이터: {row}")
+        for record in pending:
+            # B열 URL / C열 결과 / F열 블로거 이름 (blogId와 글 목록 URL은 행을 만들 때 한 번 계산)
+            row = SheetRow(record['row_number'], record['b'], record['c'], record['f'], SHEET_NAME)
+            print(f"\n행 {row.row_number} 처리 중: B열 URL {row.url}")
             
-            if len(row) >= 1:  # URL만 있어도 처리 (B열만 있으면 됨)
-                print(f"열 개수 조건 통과 (현재 {len(row)}개 열)")
-                has_url = bool(row[0])  # B열에 URL이 있는지
-                print(f"B열 URL 존재: {has_url} (값: {row[0]})")
-                
-                # C열이 없거나 비어있는 경우 처리
-                is_cell_empty = len(row) <= 1 or not row[1] or row[1].strip() == ""
-                print(f"C열 비어있음: {is_cell_empty} (값: {row[1] if len(row) > 1 else '없음'})")
-                
-                if has_url and is_cell_empty:
-                    print("URL 처리 시작")
-                    blog_url = row[0]
-                    # 모바일 URL을 PC URL로 변환
-                    if blog_url.startswith("https://m.blog.naver.com/"):
-                        blog_url = blog_url.replace("https://m.blog.naver.com/", "https://blog.naver.com/")
-                        # URL에서 ?tab=1 같은 파라미터 제거
-                        blog_url = blog_url.split('?')[0]
-                    
-                    if blog_url.startswith("https://blog.naver.com/"):
-                        blog_id = blog_url.split('/')[3]
-                        urls.append(f"https://blog.naver.com/PostList.naver?blogId={blog_id}&skinType=&skinId=&from=menu")
-                        names.append(row[4] if len(row) > 4 else "")  # F열(인덱스 4)의 블로거 이름
-                        row_indices.append(i)
-                    else:
-                        print("URL 처리 건너뜀 (네이버 블로그 URL이 아님)")
-                else:
-                    print("URL 처리 건너뜀 (조건 불충족)")
+            if row.kind == BLOG:
+                urls.append(row.crawl_url)
+                names.append(row.name)  # F열의 블로거 이름
+                row_indices.append(row.row_number)
             else:
-                print(f"열 개수 부족 (현재 {len(row)}개 열)")
+                print("URL 처리 건너뜀 (네이버 블로그 URL이 아님)")
         
         print(f"\n최종 처리된 URL 수: {len(urls)}")
         return urls, names, row_indices
@@ -341,8 +525,7 @@ def main():
     print(f"\n=== '{keyword}' 키워드 검색 시작 ===\n")
     
     # 구글 시트 서비스 초기화
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    service = get_service('sheets', 'v4')
     
     # 시트 ID 입력 받기
     sheet_id_or_url = input("구글 시트 URL 또는 ID를 입력하세요: ").strip()
@@ -350,29 +533,34 @@ def main():
         print("시트 URL 또는 ID가 입력되지 않았습니다.")
         return
     
+    # 처리 범위 선택
+    all_tabs = input("모든 탭을 한 번에 처리할까요? (y/n, 기본 n: '시트1'만): ").strip().lower() == 'y'
+    
     try:
-        # 구글 시트에서 블로그 데이터 가져오기
-        urls, names, row_indices = get_blog_data_from_sheet(service, sheet_id_or_url)
+        # 실행 중에는 미러를 주기적으로 시트와 동기화 (다른 사람이 고친 내용도 반영)
+        start_sync_jobs()
+        # 구글 시트에서 블로그 데이터 가져오기 (전체 탭 모드는 같은 블로거를 한 번만 크롤링)
+        if all_tabs:
+            urls, names, row_indices = get_blog_work_list_from_all_tabs(service, sheet_id_or_url)
+        else:
+            urls, names, row_indices = get_blog_data_from_sheet(service, sheet_id_or_url)
         if not urls:
             print("처리할 블로그 데이터가 없습니다.")
             return
 
         print(f"총 {len(urls)}개의 블로그를 검색합니다.")
         
-        driver = setup_webdriver()
-        data_list = []
-        
-        # 각 블로그별로 실시간 처리
-        for url, name, row_index in zip(urls, names, row_indices):
-            print(f"\n{name}의 블로그 검색 중...")
-            data = scrape_blog_data(driver, url, keyword, name, service, extract_sheet_id(sheet_id_or_url), row_index)
-            data_list.append(data)
-        
-        driver.quit()
+        # 작업자 여러 명이 동시에 처리 (HTTP로 읽고, 실패한 블로그만 브라우저를 띄워 읽음)
+        crawl_blogs(urls, names, row_indices, keyword, service, extract_sheet_id(sheet_id_or_url))
     except ValueError as e:
         print(f"오류: {str(e)}")
     except Exception as e:
         print(f"처리 중 오류 발생: {str(e)}")
+    finally:
+        close_fallback_driver()
+        # 미러에 모아 둔 변경 → 시트 쓰기 전송
+        close_sheet_mirrors()
+        close_sheet_writers()
 
 if __name__ == "__main__":
     main()
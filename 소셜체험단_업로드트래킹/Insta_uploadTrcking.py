@@ -18,18 +18,25 @@ from selenium.webdriver.common.by import By
 from datetime import datetime, timezone, timedelta
 import json
 import random
-from googleapiclient.discovery import build
 import sys
 from urllib.parse import urlparse, urlunsplit
 
 # auth.py 파일 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from auth import get_credentials
+from auth import get_service
+from cassette import create_driver
+from sheet_mirror import get_sheet_mirror, start_sync_jobs, close_sheet_mirrors
+from sheet_writer import get_sheet_write_queue, close_sheet_writers, quote_sheet_name
+from tracking_worklist import build_work_list
+from sheet_rows import SheetRow, INSTA
+import sheet_cache
+
+ALL_TABS = '전체 탭'  # select_sheet()에서 0번(모든 탭 한 번에 처리)을 고른 경우
 
 def get_sheet_list(service, spreadsheet_id):
     """스프레드시트의 모든 시트 목록을 가져오는 함수"""
     try:
-        spreadsheet = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+        spreadsheet = sheet_cache.get_spreadsheet(service, spreadsheet_id)
         sheets = spreadsheet.get('sheets', [])
         return [(i+1, sheet['properties']['title']) for i, sheet in enumerate(sheets)]
     except Exception as e:
@@ -65,9 +72,8 @@ def select_sheet():
             break
         print("스프레드시트 URL 또는 ID를 입력해주세요.")
     
-    # Google Sheets API 인증 및 서비스 객체 생성
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
+    # Google Sheets API 서비스 객체 가져오기
+    service = get_service('sheets', 'v4')
     
     # 시트 목록 가져오기
     sheets = get_sheet_list(service, SPREADSHEET_ID)
@@ -78,6 +84,7 @@ def select_sheet():
     
     # 시트 목록 출력
     print("\n=== 사용 가능한 시트 목록 ===")
+    print("0. 전체 탭 (같은 계정은 한 번만 크롤링하고 모든 행에 기록)")
     for num, title in sheets:
         print(f"{num}. {title}")
     
@@ -85,12 +92,16 @@ def select_sheet():
     while True:
         try:
             choice = int(input("\n사용할 시트 번호를 입력하세요: "))
+            if choice == 0:
+                SHEET_NAME = None
+                print(f"\n선택된 시트: {ALL_TABS}")
+                return ALL_TABS
             if 1 <= choice <= len(sheets):
                 SHEET_NAME = sheets[choice-1][1]  # 전역 변수 업데이트
                 print(f"\n선택된 시트: {SHEET_NAME}")
                 return SHEET_NAME
             else:
-                print(f"1부터 {len(sheets)} 사이의 숫자를 입력해주세요.")
+                print(f"0부터 {len(sheets)} 사이의 숫자를 입력해주세요.")
         except ValueError:
             print("올바른 숫자를 입력해주세요.")
 
@@ -404,136 +415,76 @@ def take_break(username_count):
         print(f"\n중간 휴식 시작 (총 {break_time//60}분 {break_time%60}초)...")
         show_countdown(break_time, "중간")
 
-def load_sheet_data(service, spreadsheet_id):
-    """스프레드시트 전체 데이터를 한 번에 로드"""
+def get_insta_mirror(service, spreadsheet_id):
+    """인스타 추적 시트(탭)의 로컬 미러 (A: 계정, B: 인스타 URL, C: 결과, M: 상태)"""
+    return get_sheet_mirror(service, spreadsheet_id, SHEET_NAME, columns=['A', 'B', 'C', 'M'])
+
+def get_insta_accounts(mirror, pending_only=False):
+    """미러의 B열 인스타 URL 행을 시트 순서대로 SheetRow 목록으로 반환 (pending_only면 C열이 빈 행만)"""
+    records = mirror.pending_rows('B', 'C') if pending_only else mirror.rows_with('B')
+    rows = (SheetRow(record['row_number'], record['b'], record['c'], record['a'], SHEET_NAME) for record in records)
+    return [row for row in rows if row.kind == INSTA]
+
+def batch_update_sheet(service, spreadsheet_id, updates, on_sent=None):
+    """여러 셀 쓰기를 공용 쓰기 큐에 넘김 (바로 반환)
+
+    쓰기 전담 스레드가 같은 행의 쓰기를 합쳐 values.batchUpdate로 보내고, 실패하면 다시 보낸다.
+    on_sent는 시트에 반영된 뒤 전담 스레드에서 호출된다.
+    """
     try:
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=f'{SHEET_NAME}!A:M'  # 시트명 변수 사용
-        ).execute()
-        return result.get('values', [])
+        get_sheet_write_queue(service).put_updates(spreadsheet_id, updates, on_sent)
+        return True
     except Exception as e:
-        print(f"\n❌ 스프레드시트 로드 중 오류 발생: {str(e)}")
+        print(f"\n❌ 일괄 업데이트 중 오류 발생: {str(e)}")
         return None
 
-def batch_update_sheet(service, spreadsheet_id, updates):
-    """여러 셀을 한 번에 업데이트"""
-    max_retries = 3  # 최대 재시도 횟수
-    retry_delay = 2  # 재시도 간 대기 시간(초)
-    
-    for attempt in range(max_retries):
-        try:
-            body = {
-                'valueInputOption': 'RAW',
-                'data': updates
-            }
-            result = service.spreadsheets().values().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=body
-            ).execute()
-            return result
-        except Exception as e:
-            if attempt < max_retries - 1:  # 마지막 시도가 아니면 재시도
-                print(f"\n⚠️ 일괄 업데이트 실패 (시도 {attempt + 1}/{max_retries}). {retry_delay}초 후 재시도합니다...")
-                print(f"오류 내용: {str(e)}")
-                time.sleep(retry_delay)
-                retry_delay *= 2  # 지수 백오프: 대기 시간을 2배로 증가
-            else:  # 마지막 시도에서도 실패
-                print(f"\n❌ 일괄 업데이트 중 오류 발생 (최대 재시도 횟수 초과): {str(e)}")
-                return None
-
 def process_next_username(service, spreadsheet_id, usernames):
-    """다음 크롤링할 계정을 찾고 상태를 업데이트"""
+    """다음 크롤링할 계정을 찾고 상태를 업데이트 (쿼터 초과 시 재시도는 스케줄러가 처리)"""
     global PROCESSED_USERNAMES  # 전역 변수 사용
-    max_retries = 3  # 최대 재시도 횟수
-    retry_delay = 2  # 재시도 간 대기 시간(초)
     
-    for attempt in range(max_retries):
-        try:
-            # 스프레드시트 데이터를 한 번에 로드
-            result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=f'{SHEET_NAME}!A:M'  # 시트명 변수 사용
-            ).execute()
-            sheet_data = result.get('values', [])
+    try:
+        # 로컬 미러 (동기화 작업이 시트에서 바뀐 내용을 주기적으로 받아 옴)
+        mirror = get_insta_mirror(service, spreadsheet_id)
+        
+        # username과 행 번호, URL 매핑
+        username_to_row = {}
+        username_to_url = {}
+
+        # C열이 빈 계정 행을 시트 순서대로 확인 (URL / username은 행을 만들 때 이미 정리됨)
+        for row in get_insta_accounts(mirror, pending_only=True):
+            i, username, url = row.row_number, row.key, row.crawl_url
             
-            if not sheet_data:
-                print("스프레드시트에서 데이터를 찾을 수 없습니다.")
-                return None, None, None  # URL도 None으로 반환
+            if username not in usernames:  # 크롤링 대상 목록에 없는 경우 건너뛰기
+                continue
             
-            # username과 행 번호, URL 매핑
-            username_to_row = {}
-            username_to_url = {}
-
-            # 헤더 제외하고 데이터 처리
-            for i, row in enumerate(sheet_data[1:], start=2):  # 2부터 시작 (1-based, 헤더 제외)
-                if not row or len(row) < 2:  # 빈 행이나 URL이 없는 행 건너뛰기
-                    continue
-                    
-                # B열의 URL 확인
-                url = row[1]
-                if not url or 'instagram.com' not in url.lower():
-                    continue
-                
-                # URL에서 username 추출
-                username = url.split('instagram.com/')[-1].split('?')[0].split('/')[0]
-                
-                if username not in usernames:  # 크롤링 대상 목록에 없는 경우 건너뛰기
-                    continue
-                
-                # 이미 처리한 username인 경우 건너뛰기
-                if username in PROCESSED_USERNAMES:
-                    print(f"\n⏭️ {username} 계정은 이미 처리되었습니다.")
-                    continue
-                
-                # C열이 비어있는지 확인
-                content = row[2] if len(row) > 2 else ""
-                if content.strip():
-                    print(f"\n⏭️ {username} 계정은 이미 C열에 내용이 있어 건너뜁니다.")
-                    PROCESSED_USERNAMES.add(username)  # 처리된 username으로 표시
-                    continue
-                    
-                username_to_row[username] = i
-                username_to_url[username] = url
-                PROCESSED_USERNAMES.add(username)  # 처리된 username으로 표시
+            # 이미 처리한 username인 경우 건너뛰기
+            if username in PROCESSED_USERNAMES:
+                print(f"\n⏭️ {username} 계정은 이미 처리되었습니다.")
+                continue
                 
-                print(f"\n🔄 {username} 계정 크롤링을 시작합니다.")
-                return username_to_row, username, username_to_url[username]
+            username_to_row[username] = i
+            username_to_url[username] = url
+            PROCESSED_USERNAMES.add(username)  # 처리된 username으로 표시
+            
+            print(f"\n🔄 {username} 계정 크롤링을 시작합니다.")
+            return username_to_row, username, username_to_url[username]
 
-            print("\n더 이상 크롤링할 계정이 없습니다.")
-            return username_to_row, None, None
+        print("\n더 이상 크롤링할 계정이 없습니다.")
+        return username_to_row, None, None
 
-        except Exception as e:
-            if attempt < max_retries - 1:  # 마지막 시도가 아니면 재시도
-                print(f"\n⚠️ 스프레드시트 처리 실패 (시도 {attempt + 1}/{max_retries}). {retry_delay}초 후 재시도합니다...")
-                print(f"오류 내용: {str(e)}")
-                time.sleep(retry_delay)
-                retry_delay *= 2  # 지수 백오프: 대기 시간을 2배로 증가
-            else:  # 마지막 시도에서도 실패
-                print(f"\n❌ 스프레드시트 처리 중 오류 발생 (최대 재시도 횟수 초과): {str(e)}")
-                return None, None, None
+    except Exception as e:
+        print(f"\n❌ 스프레드시트 처리 중 오류 발생 (최대 재시도 횟수 초과): {str(e)}")
+        return None, None, None
 
 def update_crawl_date(service, spreadsheet_id, username, post_count, error_log=None):
     """Google Sheets의 M열에 게시물 수와 에러 로그 업데이트"""
     try:
-        # 전체 데이터 가져오기
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=f'{SHEET_NAME}!A:M'  # 시트명 변수 사용
-        ).execute()
-        values = result.get('values', [])
-
-        # username이 있는 행 찾기
-        row_number = None
-        for i, row in enumerate(values):
-            if row and row[0] == username:
-                row_number = i + 1  # 1-based index
-                break
+        # username이 있는 행 찾기 (로컬 미러의 A열)
+        mirror = get_insta_mirror(service, spreadsheet_id)
+        matches = mirror.rows_matching('A', username, first_row=1)
+        row_number = matches[0]['row_number'] if matches else None
 
         if row_number:
-            # M열 업데이트
-            range_name = f'{SHEET_NAME}!M{row_number}'  # 시트명 변수 사용
-            
             # 에러가 있는 경우와 없는 경우 구분
             if error_log:
                 body = {
@@ -546,12 +497,9 @@ def update_crawl_date(service, spreadsheet_id, username, post_count, error_log=N
                 }
                 print(f"\n✅ {username}의 크롤링이 완료되었습니다. ({post_count}개 게시물)")
 
-            service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption='RAW',
-                body=body
-            ).execute()
+            # M열 업데이트 (미러에 바로 반영하고 쓰기 큐로 전송)
+            mirror.set_cell(row_number, 'M', body['values'][0][0])
+            mirror.push()
 
         else:
             print(f"\n❌ {username}을 스프레드시트에서 찾을 수 없습니다.")
@@ -567,28 +515,30 @@ def update_crawl_result(service, spreadsheet_id, username, username_to_row, post
 
     row_number = username_to_row[username]
 
-    # 키워드가 포함된 게시물 정보 생성
-    keyword_info = ""
-    if keyword_posts:
-        # C열에 첫 번째 키워드 게시물 URL 저장
-        c_update = {
-            'range': f'{SHEET_NAME}!C{row_number}',
-            'values': [[keyword_posts[0]['url']]]
-        }
-        batch_update_sheet(service, spreadsheet_id, [c_update])
-        
-        # M열에 첫 번째 키워드 게시물의 날짜만 표시 (YYMMDD 형식)
-        first_post_date = datetime.fromisoformat(keyword_posts[0]['date'].replace('Z', '+00:00'))
-        formatted_date = first_post_date.strftime('%y%m%d')
-        keyword_info = formatted_date
+    try:
+        # 우리가 쓴 값은 미러에 바로 반영 (다음 계정을 고를 때 C열이 찬 행으로 보임)
+        mirror = get_insta_mirror(service, spreadsheet_id)
+
+        # 키워드가 포함된 게시물 정보 생성
+        keyword_info = ""
+        if keyword_posts:
+            # C열에 첫 번째 키워드 게시물 URL 저장
+            mirror.set_cell(row_number, 'C', keyword_posts[0]['url'])
+            
+            # M열에 첫 번째 키워드 게시물의 날짜만 표시 (YYMMDD 형식)
+            first_post_date = datetime.fromisoformat(keyword_posts[0]['date'].replace('Z', '+00:00'))
+            formatted_date = first_post_date.strftime('%y%m%d')
+            keyword_info = formatted_date
 
-    # M열 업데이트
-    m_update = {
-        'range': f'{SHEET_NAME}!M{row_number}',
-        'values': [[keyword_info]]
-    }
+        # M열 업데이트
+        mirror.set_cell(row_number, 'M', keyword_info)
 
-    result = batch_update_sheet(service, spreadsheet_id, [m_update])
+        # 계정 하나가 끝날 때마다 쓰기 큐에 넘김 (시트 응답은 기다리지 않음)
+        mirror.push()
+        result = True
+    except Exception as e:
+        print(f"\n❌ 크롤링 결과 업데이트 중 오류 발생: {str(e)}")
+        result = None
     if result:
         if error_log:
             print(f"\n❌ {username}의 크롤링 중 에러 발생. 에러 로그가 기록되었습니다.")
@@ -600,6 +550,74 @@ def update_crawl_result(service, spreadsheet_id, username, username_to_row, post
             else:
                 print(f"ℹ️ 키워드가 포함된 게시물을 찾지 못했습니다.")
 
+def update_crawl_result_rows(service, spreadsheet_id, username, rows, post_count, keyword_posts, error_log=None):
+    """전체 탭 모드의 크롤링 결과를 같은 계정을 가리키는 모든 행 [(탭 이름, 행 번호), ...]에 기록"""
+    keyword_info = ""
+    if keyword_posts:
+        # M열에 첫 번째 키워드 게시물의 날짜만 표시 (YYMMDD 형식)
+        first_post_date = datetime.fromisoformat(keyword_posts[0]['date'].replace('Z', '+00:00'))
+        keyword_info = first_post_date.strftime('%y%m%d')
+
+    updates = []
+    for sheet, row_number in rows:
+        if keyword_posts:
+            # C열에 첫 번째 키워드 게시물 URL 저장
+            updates.append({'range': f"{quote_sheet_name(sheet)}!C{row_number}",
+                            'values': [[keyword_posts[0]['url']]]})
+        updates.append({'range': f"{quote_sheet_name(sheet)}!M{row_number}", 'values': [[keyword_info]]})
+
+    if batch_update_sheet(service, spreadsheet_id, updates):
+        if error_log:
+            print(f"\n❌ {username}의 크롤링 중 에러 발생. (행 {len(rows)}개)")
+        else:
+            print(f"\n✅ {username}의 크롤링이 완료되었습니다. 결과를 행 {len(rows)}개에 기록합니다.")
+            if not keyword_posts:
+                print("ℹ️ 키워드가 포함된 게시물을 찾지 못했습니다.")
+
+def crawl_account(url, username, weeks, keyword, user_data_dir):
+    """계정 하나를 새 브라우저로 크롤링하고 (게시물 수, 키워드 게시물 목록) 반환 (실패하면 예외)"""
+    driver = None
+    try:
+        # Chrome 옵션 설정
+        options = Options()
+        options.add_argument("--start-maximized")
+        options.add_experimental_option("detach", True)
+        options.add_argument("disable-blink-features=AutomationControlled")
+        options.add_experimental_option("excludeSwitches", ["enable-logging"])
+        options.add_argument(f"user-data-dir={user_data_dir}")
+        options.add_argument("--disable-application-cache")
+        options.add_argument("--disable-cache")
+
+        # 캐시와 임시 파일 정리 (로그인 정보 유지)
+        clear_chrome_data(user_data_dir)
+
+        # 새로운 Chrome 드라이버 시작 (PALDO_CASSETTE가 지정되어 있으면 기록/재생 드라이버)
+        driver = create_driver(lambda: webdriver.Chrome(options=options))
+
+        print(f"\n{username} 계정 크롤링을 시작합니다...")
+        print(f"\n프로필 URL({url})로 이동합니다...")
+        driver.get(url)
+        
+        # 프로필 페이지의 주요 요소가 로드될 때까지 대기
+        try:
+            # 프로필 이미지나 게시물 그리드가 로드될 때까지 대기
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div._aagv"))
+            )
+            print("프로필 페이지가 성공적으로 로드되었습니다.")
+        except Exception as e:
+            print(f"프로필 페이지 로딩 중 오류 발생: {str(e)}")
+            raise
+
+        # 크롤링 실행 및 게시물 수 받기
+        result = crawl_instagram_posts(driver, url, weeks, username, keyword)
+        print(f"\n{username} 계정 크롤링 완료. 브라우저를 종료합니다.")
+        return result
+    finally:
+        # 브라우저 종료
+        if driver is not None:
+            driver.quit()
+
 # 메인 실행 코드
 def main():
     global SHEET_NAME, SPREADSHEET_ID, PROCESSED_USERNAMES  # 전역 변수 사용 선언
@@ -613,32 +631,28 @@ def main():
         print("시트를 선택할 수 없어 프로그램을 종료합니다.")
         return
 
-    # Google Sheets API 설정
-    RANGE_NAME = f'{SHEET_NAME}!A:B'  # A열과 B열 모두 가져오기
-
-    # Google Sheets API 인증 및 서비스 객체 생성
-    creds = get_credentials()
-    service = build('sheets', 'v4', credentials=creds)
-
-    # 스프레드시트에서 데이터 가져오기
-    sheet = service.spreadsheets()
-    result = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range=RANGE_NAME).execute()
-    values = result.get('values', [])
+    # Google Sheets API 서비스 객체 가져오기
+    service = get_service('sheets', 'v4')
 
-    if not values:
-        print('스프레드시트에서 데이터를 찾을 수 없습니다.')
-        return
+    work_list = None
+    if selected_sheet == ALL_TABS:
+        # 모든 탭을 한 번에 읽어 계정별 작업 목록 생성 (C열이 채워진 행은 제외)
+        work_list = build_work_list(service, SPREADSHEET_ID, 'B', 'C', 'A', INSTA)
+        usernames = [target.key for target in work_list]
+    else:
+        # 로컬 미러를 시트와 맞춘 뒤(시트가 바뀌었을 때만 다시 읽음) 계정마다 미러에서 조회
+        try:
+            mirror = get_insta_mirror(service, SPREADSHEET_ID)
+            mirror.sync()
+        except Exception as e:
+            print(f"\n❌ 스프레드시트 로드 중 오류 발생: {str(e)}")
+            return
 
-    # 헤더 제거 (첫 번째 행 건너뛰기)
-    usernames = []
-    for row in values[1:]:  # 빈 행 제외
-        if len(row) > 1 and row[1]:  # B열에 URL이 있는 경우
-            url = row[1]
-            if 'instagram.com' in url.lower():
-                # URL에서 username 추출
-                username = url.split('instagram.com/')[-1].split('?')[0].split('/')[0]
-                usernames.append(username)
-                print(f"추가된 username: {username}")
+        # B열 인스타 URL 행의 username (헤더 제외, 행을 만들 때 한 번 추출한 값)
+        usernames = []
+        for row in get_insta_accounts(mirror):
+            usernames.append(row.key)
+            print(f"추가된 username: {row.key}")
 
     if not usernames:
         print('크롤링할 계정이 없습니다.')
@@ -678,7 +692,25 @@ def main():
     user_data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "user_data", profile_name)
 
     try:
-        while True:
+        # 실행 중에는 미러를 주기적으로 시트와 동기화 (다른 사람이 채운 C열도 반영)
+        start_sync_jobs()
+        if work_list is not None:
+            # 전체 탭 모드: 계정마다 한 번만 크롤링하고 결과는 그 계정을 가리키는 모든 행에 기록
+            for i, target in enumerate(work_list, start=1):
+                print(f"\n🔄 {target.key} 계정 크롤링을 시작합니다. ({i}/{len(work_list)}, 행 {len(target.rows)}개)")
+                try:
+                    post_count, keyword_posts = crawl_account(target.url, target.key, weeks, keyword, user_data_dir)
+                    update_crawl_result_rows(service, SPREADSHEET_ID, target.key, target.rows, post_count, keyword_posts)
+                    
+                    # 휴식 시간 관리
+                    take_break(i)
+
+                except Exception as e:
+                    error_message = f"{datetime.now(timezone(timedelta(hours=9))).strftime('%Y-%m-%d %H:%M:%S')} - {str(e)}"
+                    update_crawl_result_rows(service, SPREADSHEET_ID, target.key, target.rows, 0, [], error_message)
+                    continue
+
+        while work_list is None:
             # 다음 크롤링할 계정 찾기
             username_to_row, next_username, next_url = process_next_username(service, SPREADSHEET_ID, usernames)
             
@@ -687,60 +719,26 @@ def main():
                 break
 
             try:
-                # Chrome 옵션 설정
-                options = Options()
-                options.add_argument("--start-maximized")
-                options.add_experimental_option("detach", True)
-                options.add_argument("disable-blink-features=AutomationControlled")
-                options.add_experimental_option("excludeSwitches", ["enable-logging"])
-                options.add_argument(f"user-data-dir={user_data_dir}")
-                options.add_argument("--disable-application-cache")
-                options.add_argument("--disable-cache")
-
-                # 캐시와 임시 파일 정리 (로그인 정보 유지)
-                clear_chrome_data(user_data_dir)
-
-                # 새로운 Chrome 드라이버 시작
-                driver = webdriver.Chrome(options=options)
-
-                print(f"\n{next_username} 계정 크롤링을 시작합니다...")
-                print(f"\n프로필 URL({next_url})로 이동합니다...")
-                driver.get(next_url)
-                
-                # 프로필 페이지의 주요 요소가 로드될 때까지 대기
-                try:
-                    # 프로필 이미지나 게시물 그리드가 로드될 때까지 대기
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "div._aagv"))
-                    )
-                    print("프로필 페이지가 성공적으로 로드되었습니다.")
-                except Exception as e:
-                    print(f"프로필 페이지 로딩 중 오류 발생: {str(e)}")
-                    raise
-
-                # 크롤링 실행 및 게시물 수 받기
-                post_count, keyword_posts = crawl_instagram_posts(driver, next_url, weeks, next_username, keyword)
+                # 크롤링 실행 및 게시물 수 받기 (브라우저는 크롤링 후 종료)
+                post_count, keyword_posts = crawl_account(next_url, next_username, weeks, keyword, user_data_dir)
                 
                 # 크롤링 결과 업데이트
                 update_crawl_result(service, SPREADSHEET_ID, next_username, username_to_row, post_count, keyword_posts)
                 
-                # 브라우저 종료
-                print(f"\n{next_username} 계정 크롤링 완료. 브라우저를 종료합니다.")
-                driver.quit()
-                
                 # 휴식 시간 관리
                 take_break(usernames.index(next_username) + 1)
 
             except Exception as e:
                 error_message = f"{datetime.now(timezone(timedelta(hours=9))).strftime('%Y-%m-%d %H:%M:%S')} - {str(e)}"
                 update_crawl_result(service, SPREADSHEET_ID, next_username, username_to_row, 0, [], error_message)
-                if 'driver' in locals():
-                    driver.quit()
                 continue
 
     except Exception as e:
         print(f"크롤링 중 오류 발생: {str(e)}")
     finally:
+        # 미러에 남은 변경 → 쓰기 큐에 남은 결과(C/M열) 전송
+        close_sheet_mirrors()
+        close_sheet_writers()
         print("\n모든 계정의 크롤링이 완료되었습니다.")
         input("프로그램을 종료하려면 엔터를 누르세요...")
 
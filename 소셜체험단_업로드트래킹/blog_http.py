@@ -0,0 +1,124 @@
+'''
+네이버 블로그 글 목록 HTTP 조회 (브라우저 없이)
+- 글 목록 화면(PostList.naver)이 내부적으로 부르는 PostTitleListAsync.naver를 requests로 직접 받아
+  Selenium 경로와 같은 (제목, 작성일, 링크) 목록을 만듭니다.
+  Chrome 실행 / 5초 대기 / 30줄 보기 클릭이 없으므로 블로그 하나에 보통 1초 미만입니다.
+- 연결은 requests.Session 하나를 공유해 재사용합니다. (블로거가 수백 명이어도 TLS 연결을 다시 맺지 않음)
+- 응답 형식이 바뀌거나 조회에 실패하면 예외를 던지고, 호출하는 쪽(Blog_uploadTracking)이 Selenium으로 다시 읽습니다.
+
+### 설정 (환경 변수 또는 .env)
+PALDO_BLOG_FETCH=http | selenium   # 기본값 http, selenium이면 항상 브라우저로 읽음
+(카세트 기록/재생 중에는 같은 입력으로 비교할 수 있도록 항상 브라우저 경로를 사용)
+'''
+
+import os
+import json
+import html
+import threading
+from urllib.parse import urlparse, parse_qs, unquote_plus
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cassette import get_cassette
+
+POST_LIST_URL = 'https://blog.naver.com/PostTitleListAsync.naver'
+POST_URL = 'https://blog.naver.com/{blog_id}/{log_no}'  # 시트 C열에 쓰는 글 링크 형식 (HTTP / 브라우저 경로 공통)
+POST_COUNT = 30  # 한 번에 받는 글 수 (30줄 보기와 같음)
+TIMEOUT = 10  # 요청 제한 시간(초)
+POOL_SIZE = 10  # 세션이 유지하는 연결 수
+HEADERS = {
+    'User-Agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/124.0 Safari/537.36'),
+    'Referer': 'https://blog.naver.com/',
+}
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def get_session():
+    """공용 requests.Session (연결 재사용 + 일시적인 오류는 짧게 재시도)"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                          allowed_methods=['GET'])
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+            session.mount('https://', adapter)
+            session.headers.update(HEADERS)
+            _SESSION = session
+        return _SESSION
+
+def close_session():
+    """공용 세션 종료"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+def is_http_enabled():
+    """HTTP 경로를 쓸지 여부 (PALDO_BLOG_FETCH=selenium이거나 카세트 사용 중이면 False)"""
+    return os.getenv('PALDO_BLOG_FETCH', 'http').lower() != 'selenium' and get_cassette() is None
+
+def extract_blog_id(url):
+    """PostList URL(?blogId=...) 또는 blog.naver.com/<blogId> URL에서 blogId 추출 (없으면 None)"""
+    parsed = urlparse(url)
+    blog_id = parse_qs(parsed.query).get('blogId', [None])[0]
+    if blog_id:
+        return blog_id
+    parts = [part for part in parsed.path.split('/') if part]
+    if parts and '.' not in parts[0]:
+        return parts[0]
+    return None
+
+def canonical_post_url(href, blog_id=None):
+    """글 링크를 POST_URL 형식으로 통일 (PostView.naver?blogId=..&logNo=.. 또는 /<blogId>/<logNo>)
+
+    logNo를 찾지 못하면 href를 그대로 반환한다.
+    """
+    parsed = urlparse(href or '')
+    query = parse_qs(parsed.query)
+    log_no = query.get('logNo', [None])[0]
+    blog_id = query.get('blogId', [None])[0] or blog_id
+    if not log_no:
+        parts = [part for part in parsed.path.split('/') if part]
+        if len(parts) >= 2 and parts[-1].isdigit() and '.' not in parts[-2]:
+            blog_id, log_no = parts[-2], parts[-1]
+    if not blog_id or not log_no:
+        return href
+    return POST_URL.format(blog_id=blog_id, log_no=log_no)
+
+def parse_post_list(text, blog_id):
+    """PostTitleListAsync 응답을 [(제목, 작성일, 링크), ...]로 변환
+
+    응답은 JSON이지만 작은따옴표를 \\'로 이스케이프해서 보내므로 먼저 고쳐서 읽는다.
+    제목은 URL 인코딩 + HTML 엔티티로 오므로 둘 다 풀고, 링크는 POST_URL 형식으로 만든다.
+    """
+    data = json.loads(text.replace("\\'", "'"))
+    if data.get('resultCode') != 'S':
+        raise ValueError(f"글 목록 조회 실패 (resultCode={data.get('resultCode')}, {data.get('resultMessage', '')})")
+    posts = []
+    for post in data.get('postList', []):
+        title = html.unescape(unquote_plus(post.get('title', ''))).strip()
+        date = post.get('addDate', '')
+        link = POST_URL.format(blog_id=blog_id, log_no=post['logNo'])
+        posts.append((title, date, link))
+    return posts
+
+def fetch_post_list(url, count=POST_COUNT, session=None, timeout=TIMEOUT):
+    """블로그의 최근 글 count개를 [(제목, 작성일, 링크), ...]로 반환 (실패하면 예외)"""
+    blog_id = extract_blog_id(url)
+    if not blog_id:
+        raise ValueError(f"blogId를 찾을 수 없는 URL입니다: {url}")
+    params = {
+        'blogId': blog_id,
+        'viewdate': '',
+        'currentPage': 1,
+        'categoryNo': 0,
+        'parentCategoryNo': 0,
+        'countPerPage': count,
+    }
+    response = (session or get_session()).get(POST_LIST_URL, params=params, timeout=timeout)
+    response.raise_for_status()
+    return parse_post_list(response.text, blog_id)[:count]
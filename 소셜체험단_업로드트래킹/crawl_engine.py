@@ -0,0 +1,94 @@
+'''
+동시 크롤링 엔진
+- 작업 목록(블로그 URL 등)을 작업자 여러 명(스레드 풀)이 나눠 처리하고, 끝나는 대로 결과를 넘겨줍니다.
+- 같은 호스트(blog.naver.com 등)에 동시에 보내는 요청은 per_host개까지로 제한합니다. (예의상 상한)
+  작업자를 늘리면 이 상한까지는 처리량이 거의 작업자 수만큼 늘어납니다.
+- 크롤링 함수(crawl)는 작업 하나를 받아 결과를 돌려주는 함수면 되므로 HTTP 경로와 Selenium 경로 모두에 쓸 수 있습니다.
+  (Selenium은 작업마다 브라우저를 따로 빌려 써야 함 - driver_pool.DriverPool 참고)
+
+### 사용 예
+engine = CrawlEngine(lambda job: fetch_post_list(job[0]), workers=4)
+results = engine.run(jobs, on_result=lambda index, job, result, error: print(index, result))
+print(engine.summary())
+'''
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+CRAWL_WORKERS = int(os.getenv('PALDO_CRAWL_WORKERS', '4'))  # 기본 작업자 수
+PER_HOST_LIMIT = int(os.getenv('PALDO_CRAWL_PER_HOST', '4'))  # 호스트 하나에 동시에 보내는 요청 수 상한
+# 블로그 작업은 모두 blog.naver.com으로 가므로 실제 동시 요청 수는 min(작업자 수, PER_HOST_LIMIT)
+# (대시보드의 작업자 수 입력도 PER_HOST_LIMIT까지만 받음)
+
+def default_host_of(job):
+    """작업의 호스트 (작업이 (url, ...) 튜플이거나 url 문자열이라고 봄)"""
+    url = job[0] if isinstance(job, (tuple, list)) else job
+    return urlparse(url).netloc.lower()
+
+class CrawlEngine:
+    """작업자 풀 + 호스트별 동시 요청 상한으로 작업 목록을 처리하는 엔진"""
+
+    def __init__(self, crawl, workers=CRAWL_WORKERS, per_host=PER_HOST_LIMIT, host_of=default_host_of):
+        self.crawl = crawl
+        self.workers = max(1, workers)
+        self.per_host = max(1, per_host)
+        if self.workers > self.per_host:
+            print(f"작업자 {self.workers}명 중 호스트 하나에는 {self.per_host}명까지만 동시에 요청합니다.")
+        self.host_of = host_of
+        self._host_slots = {}
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.elapsed = 0.0
+
+    def _slot(self, host):
+        """호스트별 세마포어 (없으면 생성)"""
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host)
+                self._host_slots[host] = slot
+            return slot
+
+    def _run_job(self, job):
+        with self._slot(self.host_of(job)):
+            return self.crawl(job)
+
+    def run(self, jobs, on_result=None):
+        """작업을 모두 처리하고 작업 순서대로 결과 목록 반환 (실패한 작업은 None)
+
+        on_result(index, job, result, error)는 작업이 끝나는 순서대로 호출하는 쪽 스레드에서 불린다.
+        """
+        jobs = list(jobs)
+        results = [None] * len(jobs)
+        self.completed = self.failed = 0
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(self.workers, max(1, len(jobs))),
+                                thread_name_prefix='crawl') as executor:
+            futures = {executor.submit(self._run_job, job): index for index, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                index = futures[future]
+                error = future.exception()
+                result = None if error else future.result()
+                results[index] = result
+                self.completed += 1
+                if error:
+                    self.failed += 1
+                    print(f"크롤링 작업 실패: {str(error)}")
+                self.elapsed = time.perf_counter() - start
+                if on_result:
+                    on_result(index, jobs[index], result, error)
+        self.elapsed = time.perf_counter() - start
+        return results
+
+    def throughput(self):
+        """초당 처리한 작업 수"""
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        """처리량 요약 문자열"""
+        return (f"작업 {self.completed}개 완료 (실패 {self.failed}개), {self.elapsed:.1f}초, "
+                f"{self.throughput():.2f}개/초 (작업자 {self.workers}명, 호스트당 {self.per_host}개)")
@@ -0,0 +1,142 @@
+'''
+조건 대기 (고정 sleep 대신)
+- time.sleep(5)처럼 무조건 기다리던 곳을 "준비됐는지" 조건(요소 있음 / DOM 변화 멈춤 / 네트워크 조용함)으로 바꾸고,
+  조건이 맞는 즉시 다음 단계로 넘어갑니다. 조건마다 제한 시간(timeout)이 있어 무한정 기다리지 않습니다.
+- 각 대기는 원래 고정 대기 시간(budget)과 실제로 기다린 시간을 기록해 두고,
+  실행이 끝나면 report()로 고정 sleep 대비 얼마나 절약했는지 출력합니다.
+
+### 사용 예
+wait_until(driver, document_ready, timeout=10, budget=5, label='글 목록 로딩')
+wait_until(driver, dom_stable('table.blog2_list'), timeout=5, budget=2, label='30줄 목록 갱신')
+WAIT_STATS.report()
+'''
+
+import time
+import threading
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+POLL_INTERVAL = 0.1  # 조건 확인 간격(초)
+
+class WaitStats:
+    """대기 기록 - 고정 sleep(budget) 대비 실제로 기다린 시간"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self.budget = 0.0  # 고정 sleep이었다면 기다렸을 시간 합계
+            self.waited = 0.0  # 실제로 기다린 시간 합계
+            self.timeouts = 0
+            self.by_label = {}  # label → [횟수, budget 합, 실제 합]
+
+    def record(self, label, budget, waited, timed_out=False):
+        with self._lock:
+            self.count += 1
+            self.budget += budget
+            self.waited += waited
+            self.timeouts += timed_out
+            item = self.by_label.setdefault(label, [0, 0.0, 0.0])
+            item[0] += 1
+            item[1] += budget
+            item[2] += waited
+
+    @property
+    def saved(self):
+        """고정 sleep 대비 절약한 시간(초) - 조건이 budget보다 늦게 맞은 경우는 음수로 반영"""
+        return self.budget - self.waited
+
+    def report(self):
+        """절약 시간 요약 출력"""
+        if not self.count:
+            return
+        print(f"\n대기 {self.count}회: 고정 대기였다면 {self.budget:.1f}초 → 실제 {self.waited:.1f}초 "
+              f"({self.saved:.1f}초 절약, 제한 시간 초과 {self.timeouts}회)")
+        for label, (count, budget, waited) in sorted(self.by_label.items(), key=lambda item: item[1][1] - item[1][2],
+                                                     reverse=True):
+            print(f"  - {label}: {count}회, {budget - waited:.1f}초 절약")
+
+WAIT_STATS = WaitStats()  # 실행 전체의 공용 기록
+
+def wait_until(driver, condition, timeout, budget=0.0, label='대기', required=False, stats=WAIT_STATS):
+    """condition(driver)이 참이 될 때까지 기다려 그 값을 반환
+
+    timeout 안에 맞지 않으면 required=True일 때는 TimeoutException, 아니면 None을 반환한다.
+    (예전에 고정 sleep 뒤 그냥 진행하던 곳은 required=False로 두어 동작을 바꾸지 않음)
+    """
+    start = time.perf_counter()
+    try:
+        result = WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(condition)
+        stats.record(label, budget, time.perf_counter() - start)
+        return result
+    except TimeoutException:
+        stats.record(label, budget, time.perf_counter() - start, timed_out=True)
+        if required:
+            raise
+        print(f"{label}: {timeout}초 안에 준비되지 않아 그대로 진행합니다.")
+        return None
+
+def skip_sleep(label, budget, stats=WAIT_STATS):
+    """기다릴 이유가 없어 없앤 sleep을 절약 시간으로 기록"""
+    stats.record(label, budget, 0.0)
+
+# ----- 조건 (driver를 받아 준비됐으면 참인 값을 반환) -----
+
+def document_ready(driver):
+    """문서 로딩 완료 (document.readyState == 'complete')"""
+    return driver.execute_script('return document.readyState') == 'complete'
+
+def all_of(*conditions):
+    """모든 조건이 참이면 마지막 조건의 값"""
+    def condition(driver):
+        result = True
+        for item in conditions:
+            result = item(driver)
+            if not result:
+                return False
+        return result
+    return condition
+
+def any_of(*conditions):
+    """조건 중 하나라도 참이면 그 값"""
+    def condition(driver):
+        for item in conditions:
+            try:
+                result = item(driver)
+            except Exception:
+                continue
+            if result:
+                return result
+        return False
+    return condition
+
+def dom_stable(css_selector='body', quiet=0.3):
+    """css_selector 요소의 HTML이 quiet초 동안 바뀌지 않으면 참 (목록 다시 그리기가 끝났는지 확인)"""
+    state = {'html': None, 'since': None}
+
+    def condition(driver):
+        html = driver.execute_script(
+            'var element = document.querySelector(arguments[0]); return element ? element.outerHTML : null;',
+            css_selector)
+        now = time.perf_counter()
+        if html is None or html != state['html']:
+            state['html'], state['since'] = html, now
+            return False
+        return now - state['since'] >= quiet
+    return condition
+
+def network_idle(quiet=0.5):
+    """quiet초 동안 새 리소스 요청이 없으면 참 (Resource Timing 항목 수로 판단)"""
+    state = {'count': None, 'since': None}
+
+    def condition(driver):
+        count = driver.execute_script("return performance.getEntriesByType('resource').length")
+        now = time.perf_counter()
+        if count != state['count']:
+            state['count'], state['since'] = count, now
+            return False
+        return now - state['since'] >= quiet
+    return condition